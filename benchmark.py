@@ -0,0 +1,50 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Python program for timing the hot paths of the Ad Hoc networks
+"""
+
+from scripts.benchmark import Benchmark
+import sys, argparse
+
+
+def main():
+    """
+    Run the benchmarks and compare them with a baseline file.
+    """
+
+    parser = argparse.ArgumentParser(description="Benchmarks of the Ad Hoc networks")
+    parser.add_argument("--cases", nargs="+", default=list(Benchmark.default_scales), help="Cases to time")
+    parser.add_argument("--scales", nargs="+", default=[], help="Scales of a case as case=scale,scale,... instead of its default scales")
+    parser.add_argument("--max-scale", type=int, default=None, help="Skip the default scales bigger than this one")
+    parser.add_argument("--repeats", type=int, default=5, help="Timed repeats of each case and scale")
+    parser.add_argument("--output", default="benchmark.json", help="Results file in the content folder")
+    parser.add_argument("--baseline", default=None, help="Results file to compare with")
+    arguments = parser.parse_args()
+
+    scales = {
+        case : [scale for scale in Benchmark.default_scales[case] if arguments.max_scale is None or scale <= arguments.max_scale]
+        for case in arguments.cases
+    }
+    # The given scales replace the default ones and they aren't capped
+    for case_scales in arguments.scales:
+        case, values = case_scales.split("=")
+        if case not in Benchmark.default_scales:
+            parser.error(f"The case ({case}) doesn't exist, the cases are {list(Benchmark.default_scales)}.")
+        scales[case] = [int(value) for value in values.split(",")]
+    benchmark = Benchmark(scales, arguments.repeats)
+    for result in benchmark.run():
+        print(f"{result['case']:<22}{result['scale']:>8}{result['median']:>14.6f} s")
+    benchmark.save_results(arguments.output)
+
+    if arguments.baseline is not None:
+        regressions = benchmark.compare(arguments.baseline)
+        for regression in regressions:
+            print(f"Regression: {regression['case']} at {regression['scale']} is {regression['ratio']:.2f}x slower")
+        # A regression fails the run, so it can be checked in a script
+        if len(regressions) > 0:
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
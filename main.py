@@ -7,6 +7,8 @@ Python program for simulating Ad Hoc networks and the partition tasking problem
 
 from scripts.program import Program
 from scripts.adhoc_network import AdHocNetwork
+from scripts.sweep import Sweep
+import sys
 
 
 def main():
@@ -21,6 +23,21 @@ def main():
     parameters = program.read_parameters("parameters1.txt")
     adhoc_network = AdHocNetwork(**parameters)
     adhoc_network.run()
+
+def sweep(filename: str):
+    """
+    Run the parameter sweep of the file.
+    """
+
+    program = Program()
+    parameters_sets = program.expand_sweep(program.read_sweep(filename))
+    sweep = Sweep(parameters_sets)
+    sweep.run()
+    sweep.save_results("sweep_results.csv")
     
 if __name__ == "__main__": 
-    main()
\ No newline at end of file
+    # python main.py <sweep file> runs a sweep instead of the parameters file
+    if len(sys.argv) > 1:
+        sweep(sys.argv[1])
+    else:
+        main()
\ No newline at end of file
@@ -1,10 +1,19 @@
 from scripts.grid import Grid
 from scripts.graph import Graph
-from scripts.task import Task
+from scripts.spatial_hash import SpatialHash
+from scripts.group_allocator import GroupAllocator
+from scripts.mobility import Mobility
 from scripts.generator import Generator
 from scripts.visual_graph import VisualGraph
+from scripts.event_log import EventLog
+from scripts.trajectory import Trajectory
+from scripts.animation import Animation
+from scripts.metrics import Metrics
+from scripts.checkpoint import Checkpoint
+from scripts.random_streams import RandomStreams
+from scripts.solver_registry import SolverRegistry
 from typing import List
-import time, random, math, os, sys, scripts.constants, numpy as np, pandas as pd
+import time, random, math, os, sys, concurrent.futures, scripts.constants, numpy as np, pandas as pd
 
 
 class AdHocNetwork:
@@ -34,8 +43,48 @@ class AdHocNetwork:
             Number of iterations of the simulation
         mobility_model : str
             Mobility model of the agents in the network
+        collision_resolution : str
+            Resolve one contested task per round or a batch of independent contested tasks
+        solver : str
+            Solver of the knapsack of the groups
+        solver_epsilon : float
+            Maximum relative gap to the best score of the approximation scheme solver
+        executor : str
+            Allocate the groups in this process or in a pool of threads or processes
+        num_workers : int
+            Number of workers of the pool, 0 for the number of processors
+        run_id : int
+            Id of the run in a sweep, -1 if it isn't part of a sweep
+        trajectory_interval : int
+            Number of steps between the recorded positions of the agents
+        trajectory_storage : str
+            Store the recorded positions in memory or in a memory map file
+        render_mode : str
+            Show the visual graphs in a window or only save them
+        animation_format : str
+            Format of the animation of the iterations, none to skip it
+        metrics_mode : str
+            Measure the timers and counters of the phases of the simulation or not
+        checkpoint_interval : int
+            Number of iterations between the checkpoints, 0 to skip them
+        resume_path : str
+            Path of the checkpoint where the run starts, empty to start from the first iteration
+        results : dict
+            Scores and statistics of the simulation
+        random_streams : "RandomStreams"
+            Independent random generators of the subsystems
         generator : "Generator"
-            Generator of random numbers
+            Generator of the agents
+        mobility : "Mobility"
+            Mobility of the agents in the grid
+        spatial_hash : "SpatialHash"
+            Cells of the agents used to find their neighbors, it follows the agents between the edge updates
+        trajectory : "Trajectory"
+            Recorded positions of the agents
+        animation : "Animation"
+            Recorded frames of the iterations, None if there is no animation
+        metrics : "Metrics"
+            Timers and counters of the phases of the simulation
         visual_graph : "VisualGraph"
             Visual graph object
 
@@ -62,29 +111,31 @@ class AdHocNetwork:
             Create the edges of the network.
         remove_edges(self, graph: "Graph") -> None:
             Remove the edges of the network.
+        update_edges(self, graph: "Graph", moved_slots: np.ndarray) -> np.ndarray:
+            Update the edges of the agents that moved.
+        create_trajectory(self) -> "Trajectory":
+            Create the recorder of the positions of the agents.
         brownian_motion(self, step_size: int) -> None:
             Apply the brownian motion mobility model.
-        create_tasks(self, min_size: int, max_size: int, min_value: int, max_value: int) -> List["Task"]:
-            Create tasks objects.
+        create_tasks(self, min_size: int, max_size: int, min_value: int, max_value: int, min_time: int, max_time: int) -> np.ndarray:
+            Create tasks in the task table.
         create_initial_tasks(self) -> None:
             Assign tasks to the agents.
-        save_tasks(self, tasks, filename: str) -> None:
+        save_tasks(self, filename: str, tasks: np.ndarray) -> None:
             Save the tasks of the network.
-        count_collisions(self, agents_results: dict) -> dict:
-            Get the agents in the selected tasks.
-        check_collisions(self, tasks_counter: dict) -> bool:
-            Check the collisions in the selected tasks.
-        join_tasks(self, group: List["Agent"]) -> List["Task"]:
+        join_tasks(self, group: List["Agent"]) -> np.ndarray:
             Join the tasks of the group
-        assign_tasks(self, group: List["Agent"], tasks: List["Task"]) -> List["Task"]:
+        assign_tasks(self, group: List["Agent"], tasks: np.ndarray) -> None:
             Assign the tasks to the agents in the group.
-        merge(self, tasks: List["Task"], all_selected_tasks: List[tuple], left: int, mid: int, right: int):
-            Merge the lists of selected tasks under the conditions.
-        merge_sort_tasks(self, tasks: List["Task"], all_selected_tasks: List[tuple], begin: int, end: int) -> None:
-            Merge sort the selected tasks of the group of agents.
+        create_group_allocator(self, group: List["Agent"], joined_tasks: np.ndarray) -> "GroupAllocator":
+            Create the allocator of the joined tasks of the group.
+        create_executor(self) -> concurrent.futures.Executor:
+            Create the pool that allocates the groups.
+        allocate_groups(self, allocators: List["GroupAllocator"], executor: concurrent.futures.Executor) -> List["GroupAllocator"]:
+            Allocate the tasks of every group.
         initialization(self) -> None:
             Initialize the Ad Hoc Network.
-        run(self) -> None:
+        run(self) -> dict:
             Run the Ad Hoc Network.
     """
 
@@ -99,9 +150,48 @@ class AdHocNetwork:
         "num_tasks"                : int,
         "iterations"               : int,
         "mobility_model"           : str,
+        "collision_resolution"     : str,
+        "solver"                   : str,
+        "solver_epsilon"           : float,
+        "executor"                 : str,
+        "num_workers"              : int,
+        "run_id"                   : int,
+        "trajectory_interval"      : int,
+        "trajectory_storage"       : str,
+        "render_mode"              : str,
+        "animation_format"         : str,
+        "metrics_mode"             : str,
+        "checkpoint_interval"      : int,
+        "resume_path"              : str,
+    }
+
+    # Allowed values of the keyword arguments that select a mode, the solvers include the registered ones
+    valid_options = {
+        "mobility_model"           : scripts.constants.MOBILITY_MODELS,
+        "collision_resolution"     : scripts.constants.COLLISION_RESOLUTIONS,
+        "solver"                   : SolverRegistry.solvers,
+        "executor"                 : scripts.constants.EXECUTORS,
+        "trajectory_storage"       : scripts.constants.TRAJECTORY_STORAGES,
+        "render_mode"              : scripts.constants.RENDER_MODES,
+        "animation_format"         : scripts.constants.ANIMATION_FORMATS,
+        "metrics_mode"             : scripts.constants.METRICS_MODES,
     }
 
     def __init__(self, **kwargs: dict) -> None:
+        self.collision_resolution = scripts.constants.COLLISION_RESOLUTIONS[0]
+        self.solver = scripts.constants.KNAPSACK_SOLVERS[0]
+        self.solver_epsilon = scripts.constants.KNAPSACK_EPSILON
+        self.executor = scripts.constants.EXECUTORS[0]
+        self.num_workers = 0
+        self.run_id = -1
+        self.trajectory_interval = 1
+        self.trajectory_storage = scripts.constants.TRAJECTORY_STORAGES[0]
+        self.render_mode = scripts.constants.RENDER_MODES[0]
+        self.animation_format = scripts.constants.ANIMATION_FORMATS[0]
+        self.metrics_mode = scripts.constants.METRICS_MODES[0]
+        self.checkpoint_interval = 0
+        self.resume_path = ""
+        self.results = {}
         # Validate the kwargs arguments
         self.validate_kwargs(kwargs, self.valid_kwargs)
         self.initialization()
@@ -109,6 +199,7 @@ class AdHocNetwork:
     def validate_kwargs(self, kwargs: dict, valid_kwargs: dict) -> None:
         """
         Validate the key word arguments.
+        The arguments that select a mode must be one of the values of valid_options.
 
             Parameters
                 kwargs (dict): Dictionary with the key word arguments
@@ -121,10 +212,11 @@ class AdHocNetwork:
         for key in kwargs:
             # Validate key & value
             if valid_kwargs.get(key, None):
-                if isinstance(kwargs[key], valid_kwargs[key]):
-                    setattr(self, key, kwargs[key])
-                else:
+                if isinstance(kwargs[key], valid_kwargs[key]) == False:
                     raise Exception(f"The attributes values ({kwargs[key]}) are invalid.")
+                if key in self.valid_options and kwargs[key] not in self.valid_options[key]:
+                    raise Exception(f"The value ({kwargs[key]}) of {key} isn't valid, the values are {list(self.valid_options[key])}.")
+                setattr(self, key, kwargs[key])
             else:
                 raise Exception(f"The key ({key}) ins't a valid keyword argument.")
 
@@ -139,8 +231,10 @@ class AdHocNetwork:
                 return None
         """
 
-        # Define the parent path
+        # Define the parent path, the runs of a sweep with the same seed have their own folder
         self.parent_path = scripts.constants.content_folder_path + "\\" + str(self.seed_id)
+        if self.run_id != -1:
+            self.parent_path += f"_{self.run_id}"
         self.log_path = self.parent_path + "\\logs"
         self.graphs_path = self.parent_path + "\\graphs"
 
@@ -199,11 +293,11 @@ class AdHocNetwork:
         """
 
         # Generate random tags and values
-        tags = self.generator.generate_unique_integer_numbers(0, self.num_agents-1)
-        values = self.generator.generate_integer_numbers(1, self.num_agents)
-        radius = self.generator.generate_float_numbers(3, 3, 0)
+        tags = self.generator.generate_unique_integer_numbers(0, self.num_agents-1).tolist()
+        values = self.generator.generate_integer_numbers(1, self.num_agents).tolist()
+        radius = self.generator.generate_float_numbers(3, 3, 0).tolist()
         for i in range(self.num_agents):
-            graph.add_agent(str(tags[i]), values[i], radius[i])
+            graph.add_agent(tags[i], values[i], radius[i])
         return graph
                 
     def create_graph(self) -> "Graph":
@@ -232,11 +326,9 @@ class AdHocNetwork:
 
         # Generate unique pairs of numbers
         unique_pairs = self.generator.generate_unique_pairs(0, self.rows-1, 0, self.cols-1)
-        for idx, agent in enumerate(graph.agents):
-            # Assign the position to the agents and the grid 
-            row, col = unique_pairs[idx]
-            graph.agents[agent].update_position(row, col)
-            self.grid.values[row][col] = agent
+        # Assign the position to the agents and the grid 
+        graph.grid = self.grid
+        graph.set_positions(unique_pairs[:, 0], unique_pairs[:, 1])
 
     def create_edges(self, graph: "Graph") -> None:
         """
@@ -249,11 +341,20 @@ class AdHocNetwork:
                 return None
         """
 
-        for agent1 in graph.agents:
-            for agent2 in graph.agents:
-                if agent1 != agent2 and graph.agents[agent1].in_neighborhood(graph.agents[agent2].col, graph.agents[agent2].row) == True:
-                    if self.generator.generate_random_number() < self.connection_probability:
-                        graph.add_edge(agent1, agent2)
+        rows, cols = graph.get_positions()
+        radii = graph.get_radii()
+        # Only the agents in the cells within the radius can be neighbors
+        self.spatial_hash = SpatialHash(self.rows, self.cols, max(math.ceil(radii.max()), 1))
+        self.spatial_hash.build(rows, cols)
+        sources, targets = self.spatial_hash.query_pairs(1)
+        # Keep the agents inside the radius of the first agent, sorted as the pairs of agents of the graph
+        distances = (cols[targets]-cols[sources])**2 + (rows[targets]-rows[sources])**2
+        inside = (sources != targets) & (distances <= radii[sources]**2)
+        sources, targets = sources[inside], targets[inside]
+        order = np.lexsort((targets, sources))
+        sources, targets = sources[order], targets[order]
+        connected = self.random_streams.edges.random(len(sources)) < self.connection_probability
+        graph.set_edges(sources[connected], targets[connected])
 
     def remove_edges(self, graph: "Graph") -> None:
         """
@@ -266,8 +367,73 @@ class AdHocNetwork:
                 return None
         """
 
-        for agent in graph.agents:
-            graph.agents[agent].neighbors = []
+        graph.clear_edges()
+
+    def update_edges(self, graph: "Graph", moved_slots: np.ndarray) -> np.ndarray:
+        """
+        Update the edges of the agents that moved.
+        Only a connection probability of 1 is incremental: the other probabilities draw the connection
+        of every pair of agents again in each step, so all the edges are created again and compared.
+        With a probability of 1 the edges depend only on the positions, so the spatial hash only moves
+        the moved agents and only their pairs are checked. The removed edges are the old edges of the moved
+        agents, the added edges are their new edges, and the adjacency is replaced once if they differ.
+
+            Parameters
+                graph ("Graph"): Graph of the network 
+                moved_slots (np.ndarray): Slots of the agents that moved
+
+            Returns
+                return Slots whose edges changed
+        """
+
+        old_adjacency = graph.adjacency
+        if self.connection_probability < 1:
+            self.remove_edges(graph)
+            self.create_edges(graph)
+            changes = (old_adjacency != graph.adjacency).tocoo()
+            return np.unique(np.concatenate((changes.row, changes.col))).astype(np.int64)
+
+        num_slots = len(graph.agents)
+        rows, cols = graph.get_positions()
+        radii = graph.get_radii()
+        moved = np.zeros(num_slots, dtype=np.bool_)
+        moved[moved_slots] = True
+        # Old edges of the moved agents, the edges of the matrix are sorted by source and target
+        edges = old_adjacency.tocoo()
+        touched = moved[edges.row] | moved[edges.col]
+        old_keys = edges.row[touched].astype(np.int64)*num_slots + edges.col[touched]
+
+        # New edges of the moved agents, the pairs are checked in both directions because each agent has its own radius
+        self.spatial_hash.move(moved_slots, rows[moved_slots], cols[moved_slots])
+        moved_sources, moved_targets = self.spatial_hash.query_pairs(1, moved_slots)
+        sources, targets = np.concatenate((moved_sources, moved_targets)), np.concatenate((moved_targets, moved_sources))
+        distances = (cols[targets]-cols[sources])**2 + (rows[targets]-rows[sources])**2
+        inside = (sources != targets) & (distances <= radii[sources]**2)
+        # The pairs of two moved agents are found twice, sorting and dropping the repeats is faster than np.unique
+        new_keys = np.sort(sources[inside]*num_slots + targets[inside])
+        new_keys = new_keys[np.concatenate(([True], new_keys[1:] != new_keys[:-1]))]
+
+        changed_keys = np.setxor1d(old_keys, new_keys, assume_unique=True)
+        if len(changed_keys) > 0:
+            graph.set_edges(np.concatenate((edges.row[~touched], new_keys // num_slots)), np.concatenate((edges.col[~touched], new_keys % num_slots)))
+        changed = np.zeros(num_slots, dtype=np.bool_)
+        changed[changed_keys // num_slots], changed[changed_keys % num_slots] = True, True
+        return np.flatnonzero(changed).astype(np.int64)
+
+    def create_trajectory(self) -> "Trajectory":
+        """
+        Create the recorder of the positions of the agents.
+        It has a record for the installed positions and for each iteration.
+
+            Parameters
+                None
+
+            Returns
+                return Trajectory of the agents
+        """
+
+        path = self.log_path + "\\trajectory.npy" if self.trajectory_storage == "memmap" else None
+        return Trajectory(self.iterations+1, len(self.graph.agents), self.rows, self.cols, self.trajectory_interval, path)
 
     def brownian_motion(self, step_size: int) -> None:
         """
@@ -280,34 +446,28 @@ class AdHocNetwork:
                 return None
         """
 
-        agents = list(self.graph.agents.values())
-        for agent in self.graph.agents:
-            new_row, new_col = self.graph.agents[agent].brownian_motion(self.rows, self.cols, agents, step_size)
-            self.graph.agents[agent].update_position(new_row, new_col)
+        rows, cols = self.graph.get_positions()
+        new_rows, new_cols = self.mobility.brownian_motion(rows, cols, step_size)
+        self.graph.set_positions(new_rows, new_cols)
 
-    def create_tasks(self, min_size: int, max_size: int, min_value: int, max_value: int, min_time: float, max_time: float) -> List["Task"]:
+    def create_tasks(self, min_size: int, max_size: int, min_value: int, max_value: int, min_time: int, max_time: int) -> np.ndarray:
         """
-        Create tasks objects.
+        Create tasks in the task table.
 
             Parameters
                 min_size (int): Minimal size of tasks
                 max_size (int): Maximum size of tasks
                 min_value (int): Minimal value of tasks
                 max_value (int): Maximum value of tasks
-                min_time (float): Minimal time of tasks
-                max_time (float): Maximum time of tasks
+                min_time (int): Minimal time of tasks
+                max_time (int): Maximum time of tasks
 
             Returns
-                return List of tasks
+                return Ids of the tasks
         """
 
-        return [
-            Task(
-                random.randint(min_size, max_size),
-                random.randint(min_value, max_value),
-                random.randint(min_time, max_time)
-                ) for i in range(self.num_tasks)
-        ]
+        columns = self.random_streams.tasks.integers((min_size, min_value, min_time), (max_size+1, max_value+1, max_time+1), size=(self.num_tasks, 3)).astype(np.int32)
+        return self.graph.task_table.add_tasks(columns[:, 0], columns[:, 1], columns[:, 2])
 
     def create_initial_tasks(self) -> None:
         """
@@ -322,184 +482,116 @@ class AdHocNetwork:
 
         max_value = self.graph.get_max_value()
         for agent in self.graph.agents:
-            self.graph.agents[agent].tasks = self.create_tasks(1, max_value, 1, 100, 60, 120)
+            agent.tasks = self.create_tasks(1, max_value, 1, 100, 60, 120)
 
-    def save_tasks(self, filename: str, tasks: List["Task"]) -> None:
+    def save_tasks(self, filename: str, tasks: np.ndarray) -> None:
         """
         Save the tasks of the network.
 
             Parameters
                 filename (str): Name of the task file
-                tasks (List["Task"]): List of tasks
+                tasks (np.ndarray): Ids of the tasks
 
             Returns
                 return None
         """
 
-        pd.DataFrame([
-            (task.size, task.value, task.time) for task in tasks
-        ]).to_csv(self.log_path + f"\\{filename}", index=False)
+        task_table = self.graph.task_table
+        pd.DataFrame({
+            0 : task_table.sizes[tasks],
+            1 : task_table.values[tasks],
+            2 : task_table.times[tasks]
+        }).to_csv(self.log_path + f"\\{filename}", index=False)
 
-    def count_collisions(self, agents_results: dict) -> dict:
+    def join_tasks(self, group: List["Agent"]) -> np.ndarray:
         """
-        Get the agents in the selected tasks.
-
-            Parameters
-                agents_results (dict): Dictionary with the agents results
-
-            Returns
-                return Dictionary with the agents for each selected task
-        """
-
-        tasks_counter = {}
-        for agent in agents_results:
-            for task_idx in agents_results[agent]["selected_tasks"]:
-                # The task doesn"t exist in the counter
-                if tasks_counter.get(task_idx, None) == None:
-                    tasks_counter[task_idx] = [agent]
-                else:
-                    tasks_counter[task_idx].append(agent)
-        return tasks_counter
-
-    def check_collisions(self, tasks_counter: dict) -> bool:
-        """
-        Check the collisions in the selected tasks.
+        Join the tasks of the group
 
             Parameters
-                tasks_counter (dict): Dictionary with the agents of each selected task
+                group (List["Agent"]): Join the tasks of the group
 
             Returns
-                return True if exist a collision otherwise False
+                return Ids of the tasks joined
         """
 
-        for task_idx in tasks_counter: 
-            if len(tasks_counter[task_idx]) > 1:
-                return True
-        return False
+        joined_tasks = [np.zeros(0, dtype=np.int64)]
+        for agent in group:
+            joined_tasks.append(agent.tasks)
+            joined_tasks.append(np.array(agent.selected_tasks, dtype=np.int64))
+        return np.concatenate(joined_tasks)
 
-    def join_tasks(self, group: List["Agent"]) -> List["Task"]:
+    def assign_tasks(self, group: List["Agent"], tasks: np.ndarray) -> None:
         """
-        Join the tasks of the group
+        Assign the tasks to the agents in the group.
 
             Parameters
                 group (List["Agent"]): Join the tasks of the group
+                tasks (np.ndarray): Ids of the tasks
 
             Returns
-                return List with the tasks joinedj
+                return None
         """
 
-        joined_tasks = []
         for agent in group:
-            joined_tasks.extend(agent.tasks)
-            joined_tasks.extend(agent.selected_tasks)
-        return joined_tasks
+            agent.tasks = tasks
 
-    def assign_tasks(self, group: List["Agent"], tasks: List["Task"]) -> List["Task"]:
+    def create_group_allocator(self, group: List["Agent"], joined_tasks: np.ndarray) -> "GroupAllocator":
         """
-        Assign the tasks to the agents in the group.
+        Create the allocator of the joined tasks of the group.
 
             Parameters
-                group (List["Agent"]): Join the tasks of the group
-                tasks (List["Task"]): List of tasks
+                group (List["Agent"]): Group of agents
+                joined_tasks (np.ndarray): Ids of the tasks joined
 
             Returns
-                return List with the tasks joinedj
+                return Allocator of the group
         """
 
-        for agent in group:
-            agent.tasks = tasks
+        return GroupAllocator(
+            [agent.value for agent in group],
+            self.graph.task_table.sizes[joined_tasks],
+            self.graph.task_table.values[joined_tasks],
+            self.collision_resolution,
+            scripts.constants.COLLISION_KEY_BASED,
+            self.solver,
+            self.solver_epsilon
+        )
 
-    def merge(self, tasks: List["Task"], all_selected_tasks: List[tuple], left: int, mid: int, right: int):
+    def create_executor(self) -> concurrent.futures.Executor:
         """
-        Merge the lists of selected tasks under the conditions.
+        Create the pool that allocates the groups.
 
             Parameters
-                tasks (List["Task"]): List of tasks
-                all_selected_tasks (List[tuple]): The selected tasks
-                left (int): Initial index
-                mid (int): Mid index
-                right (int): Last index
+                None
 
             Returns
-                return None
+                return Pool of threads or processes, None for the serial executor
         """
 
-        sub_list_1 = mid-left+1
-        sub_list_2 = right-mid
-
-        # Create temporal lists
-        left_list = [0]*sub_list_1
-        right_list = [0]*sub_list_2
-
-        # Copy data to temporal lists left_list[] and right_list[]
-        for i in range(sub_list_1):
-            left_list[i] = all_selected_tasks[left + i]
-        for j in range(sub_list_2):
-            right_list[j] = all_selected_tasks[mid + 1 + j]
-
-        idx_sub_list_1 = 0  # Initial index of first sub-array
-        idx_sub_list_2 = 0  # Initial index of second sub-array
-        idx_merged_list = left  # Initial index of merged array
-
-        # Merge the temporal lists back into all_selected_tasks[left..right]
-        while idx_sub_list_1 < sub_list_1 and idx_sub_list_2 < sub_list_2:
-            # Left task have more collisions than right task
-            if len(left_list[idx_sub_list_1][1]) > len(right_list[idx_sub_list_2][1]):
-                all_selected_tasks[idx_merged_list] = left_list[idx_sub_list_1]
-                idx_sub_list_1 += 1
-            # Same number of collisions
-            elif len(left_list[idx_sub_list_1][1]) == len(right_list[idx_sub_list_2][1]):
-                # Compare attributes
-                size_comparison = tasks[left_list[idx_sub_list_1][0]].size > tasks[right_list[idx_sub_list_2][0]].size
-                value_comparison = tasks[left_list[idx_sub_list_1][0]].value > tasks[right_list[idx_sub_list_2][0]].value
-                # The left task is better than the right task
-                if size_comparison == False and value_comparison == True:
-                    all_selected_tasks[idx_merged_list] = left_list[idx_sub_list_1]
-                    idx_sub_list_1 += 1
-                # The right task is better than the left task
-                elif size_comparison == True and value_comparison == False:
-                    all_selected_tasks[idx_merged_list] = right_list[idx_sub_list_2]
-                    idx_sub_list_2 += 1
-                else:
-                    all_selected_tasks[idx_merged_list] = left_list[idx_sub_list_1]
-                    idx_sub_list_1 += 1
-            else:
-                all_selected_tasks[idx_merged_list] = right_list[idx_sub_list_2]
-                idx_sub_list_2 += 1
-            idx_merged_list += 1
-
-        # Copy the remaining elements of left[], if any
-        while idx_sub_list_1 < sub_list_1:
-            all_selected_tasks[idx_merged_list] = left_list[idx_sub_list_1]
-            idx_sub_list_1 += 1
-            idx_merged_list += 1
-
-        # Copy the remaining elements of right[], if any
-        while idx_sub_list_2 < sub_list_2:
-            all_selected_tasks[idx_merged_list] = right_list[idx_sub_list_2]
-            idx_sub_list_2 += 1
-            idx_merged_list += 1
+        max_workers = self.num_workers if self.num_workers > 0 else None
+        if self.executor == "thread":
+            return concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+        elif self.executor == "process":
+            return concurrent.futures.ProcessPoolExecutor(max_workers=max_workers)
+        return None
 
-    def merge_sort_tasks(self, tasks: List["Task"], all_selected_tasks: List[tuple], begin: int, end: int) -> None:
+    def allocate_groups(self, allocators: List["GroupAllocator"], executor: concurrent.futures.Executor) -> List["GroupAllocator"]:
         """
-        Merge sort the selected tasks of the group of agents.
+        Allocate the tasks of every group.
+        The groups don't share agents or tasks, so they are allocated at the same time in the pool
+        and the results are returned in the order of the groups.
 
             Parameters
-                tasks (List["Task"]): List of tasks
-                all_selected_tasks (List[tuple]): The selected tasks
-                begin (int): Initial index
-                end (int): Last index
+                allocators (List["GroupAllocator"]): Allocator of each group
+                executor (concurrent.futures.Executor): Pool of threads or processes, None to allocate in this process
 
             Returns
-                return None
+                return Allocators with the results of each group
         """
 
-        if begin >= end:
-            return
-        mid = begin+(end-begin)//2
-        self.merge_sort_tasks(tasks, all_selected_tasks, begin, mid)
-        self.merge_sort_tasks(tasks, all_selected_tasks, mid+1, end)
-        self.merge(tasks, all_selected_tasks, begin, mid, end)
+        if executor is None:
+            return [allocator.allocate() for allocator in allocators]
+        return list(executor.map(GroupAllocator.allocate, allocators))
 
     def initialization(self) -> None:
         """
@@ -519,9 +611,9 @@ class AdHocNetwork:
         # Generate and set random seed
         if self.seed_id == -1:
             self.seed_id = random.randrange(sys.maxsize)
-        random.seed(self.seed_id)
+        self.random_streams = RandomStreams(self.seed_id)
 
-        self.generator = Generator(self.num_agents, self.seed_id)
+        self.generator = Generator(self.num_agents, self.random_streams.placement)
         self.rows, self.cols = math.floor(self.height/self.height_span), math.floor(self.width/self.width_span)
 
         # Create the grid, graph, and edges
@@ -529,12 +621,17 @@ class AdHocNetwork:
         self.graph = self.create_graph()
         self.install_graph(self.graph)
         self.create_edges(self.graph)
-        self.visual_graph = VisualGraph(str(self.seed_id), self.cols+1, self.rows+1, self.graphs_path)
+        self.mobility = Mobility(self.grid, self.random_streams.mobility)
+        self.trajectory = self.create_trajectory()
+        self.trajectory.record(*self.graph.get_positions())
+        self.visual_graph = VisualGraph(str(self.seed_id), self.cols+1, self.rows+1, self.graphs_path, self.render_mode, self.random_streams.visuals)
+        self.animation = Animation() if self.animation_format != "none" else None
+        self.metrics = Metrics(self.metrics_mode == "enabled")
 
         # Assign the initial tasks to each agent
         self.create_initial_tasks()
 
-    def run(self) -> None:
+    def run(self) -> dict:
         """
         Run the Ad Hoc Network.
 
@@ -542,97 +639,161 @@ class AdHocNetwork:
                 None
 
             Returns
-                return None
+                return Dictionary with the scores and statistics of the simulation
         """
 
-        log_text = f"Simulation stats\n\nRows: {self.rows}\nColumns: {self.cols}\nNumber of agents: {self.num_agents}\nNumber of tasks: {self.num_tasks}\nAgents:\n\n"
+        # The records are written while the simulation runs and the text log is rendered from them
+        event_log = EventLog(self.log_path + "\\log.jsonl")
+        event_log.write("start", rows=self.rows, cols=self.cols, num_agents=self.num_agents, num_tasks=self.num_tasks)
 
         # Save the initial agents stats
         for agent in self.graph.agents:
-            log_text += self.graph.agents[agent].__str__() + "\n"
+            event_log.write("agent", tag=agent.tag, value=agent.value)
 
         start_time_simulation = time.time()
-
-        # Create the list of groups of agents
-        groups = self.graph.create_groups()
-
-        # Show the initial configuration of agents in the network
-        self.visual_graph.show_visual_graph("network_1.png", groups)
-
-        for i in range(self.iterations):
-            log_text += "\n"+"#"*50+f"\n\nIteration: {i}\n\nNumber of groups: {len(groups)}\n"
-            groups_cnt = 0
+        start_iteration, total_iterations, iteration_score, iteration_num_tasks, max_gap = 0, 0, 0, 0, 0.0
+        task_table = self.graph.task_table
+        executor = self.create_executor()
+        metrics = self.metrics
+
+        if self.resume_path != "":
+            # The checkpoint has the groups and the random states after the initial configuration
+            run_state = Checkpoint.load(self.resume_path, self)
+            start_iteration, total_iterations = run_state["iteration"], run_state["total_iterations"]
+            iteration_score, iteration_num_tasks = run_state["iteration_score"], run_state["iteration_num_tasks"]
+            max_gap = run_state.get("max_gap", 0.0)
+            start_time_simulation -= run_state["time"]
+            groups = self.graph.groups
+            event_log.write("resume", iteration=start_iteration)
+        else:
+            # Create the list of groups of agents
+            start_time = metrics.start()
+            groups = self.graph.create_groups()
+            metrics.stop("grouping", start_time)
+
+            # Show the initial configuration of agents in the network
+            start_time = metrics.start()
+            self.visual_graph.show_visual_graph("network_1.png", groups)
+            metrics.stop("rendering", start_time)
+        if self.animation is not None:
+            self.animation.record(self.graph)
+
+        for i in range(start_iteration, self.iterations):
+            start_time_iteration = metrics.start()
+            event_log.write("iteration", iteration=i, num_groups=len(groups))
+            # Union each task of the group
+            groups_joined_tasks, allocators = [], []
             for group in groups:
-                log_text += f"\nGroup: {groups_cnt}\n"  
-                # Union each task of the group
-                joined_tasks, iterations = self.join_tasks(group), 0
+                joined_tasks = self.join_tasks(group)
                 for agent in group:
-                    agent.value += sum([task.size for task in agent.selected_tasks])
+                    agent.value += task_table.sizes[agent.selected_tasks].sum().item()
                     agent.selected_tasks = []
                 # Save the joined tasks as a CSV file
                 # self.save_tasks(f"task_group_{groups_cnt}.csv", joined_tasks)
-                while joined_tasks != []:
-                    iterations += 1
-                    # Assign the tasks to the agents of the same group
-                    self.assign_tasks(group, joined_tasks)
-                    agents_results = {}
-                    for agent in group:
-                        best_allocation_score, selected_tasks = agent.get_allocation_resources_score()
-                        agents_results[agent] = {
-                            "score" : best_allocation_score,
-                            "selected_tasks" : selected_tasks
-                        }
-                    tasks_counter = self.count_collisions(agents_results)
-                    if self.check_collisions(tasks_counter) == True:
-                        # Sort the tasks_counter in function of the number of collisions and attributes
-                        all_selected_tasks = list(tasks_counter.items())
-                        self.merge_sort_tasks(joined_tasks, all_selected_tasks, 0, len(tasks_counter)-1)
-                        sorted_selected_tasks = all_selected_tasks
-                        # Select the task with more collisions
-                        task_idx, task_agents = sorted_selected_tasks.pop(0)
-                        # Sort tasks_agents in function of the value (size)
-                        sorted_task_agents = sorted(task_agents, key=lambda agent: agent.value)
-                        perfect_agent = False
-                        # Check if exist the best agent for the task
-                        for agent in sorted_task_agents:
-                            # Perfect case
-                            if agent.value == joined_tasks[task_idx].size:
-                                agent.assign_task(joined_tasks[task_idx])
-                                perfect_agent = True
-                                break
-                        if perfect_agent == False:
-                            best_agent = sorted_task_agents.pop()
-                            best_agent.assign_task(joined_tasks[task_idx])
-                        # Remove the tasksk
-                        joined_tasks.pop(task_idx)
-                    else:
-                        for agent in group:
-                            if agents_results[agent]["score"] > 0:
-                                for task_idx in agents_results[agent]["selected_tasks"]:
-                                    agent.assign_task(joined_tasks[task_idx])
-                        break
+                groups_joined_tasks.append(joined_tasks)
+                allocators.append(self.create_group_allocator(group, joined_tasks))
+            start_time = metrics.start()
+            allocators = self.allocate_groups(allocators, executor)
+            metrics.stop("allocation", start_time)
+            groups_cnt, iteration_score, iteration_num_tasks = 0, 0, 0
+            for group, joined_tasks, allocator in zip(groups, groups_joined_tasks, allocators):
+                event_log.write("group", group=groups_cnt)
+                for agent, value, selected_tasks in zip(group, allocator.values, allocator.selected_tasks):
+                    agent.value, agent.selected_tasks = value, joined_tasks[selected_tasks].tolist()
+                # Assign the tasks left to the agents of the same group
+                self.assign_tasks(group, joined_tasks[allocator.alive])
                 total_num_selected_tasks, total_score = 0, 0
+                start_time = metrics.start()
                 for agent in group:
-                    log_text += agent.__str__() + "->" + str(agent.selected_tasks) + "\n"
+                    event_log.write("allocation", tag=agent.tag, value=agent.value, tasks=np.column_stack((
+                        task_table.sizes[agent.selected_tasks], task_table.values[agent.selected_tasks], task_table.times[agent.selected_tasks]
+                    )).tolist())
                     total_num_selected_tasks += len(agent.selected_tasks)
-                    total_score += sum([task.value for task in agent.selected_tasks])
-                log_text += f"\nGroup stats\nTotal score: {total_score}\nTotal number of tasks: {total_num_selected_tasks}\nIterations: {iterations}\n"
+                    total_score += task_table.values[agent.selected_tasks].sum().item()
+                event_log.write("group_stats", score=total_score, num_tasks=total_num_selected_tasks, iterations=allocator.iterations)
+                metrics.stop("logging", start_time)
+                # The allocators measure themselves, so the measures come back from the workers
+                metrics.add_time("group_allocation", allocator.allocation_time)
+                metrics.add_time("collision_resolution", allocator.collision_time)
+                metrics.count("knapsack_updates", allocator.knapsack_updates)
+                metrics.count("knapsack_cells", allocator.knapsack_cells)
+                metrics.count("collision_rounds", allocator.collision_rounds)
+                total_iterations += allocator.iterations
+                max_gap = max(max_gap, allocator.max_gap)
+                iteration_score += total_score
+                iteration_num_tasks += total_num_selected_tasks
                 groups_cnt += 1
+            # The records of the iteration are on disk even if the simulation stops
+            start_time = metrics.start()
+            event_log.flush()
+            metrics.stop("logging", start_time)
 
             # Move the agents
+            start_time = metrics.start()
+            old_rows, old_cols = self.graph.get_positions()
             if self.mobility_model == "brownian_motion":
                 self.brownian_motion(scripts.constants.STEP_SIZE)
-
-            # Update the edges
-            self.remove_edges(self.graph)
-            self.create_edges(self.graph)
-
-            # Create new possible groups
-            groups = self.graph.create_groups()
-
-        log_text += f"\nSimulation finished\nSeed ID: {str(self.seed_id)}\nTime: {str(time.time() - start_time_simulation)}"
-        
-        self.log(f"log.txt", log_text)
-
+            new_rows, new_cols = self.graph.get_positions()
+            self.trajectory.record(new_rows, new_cols)
+            metrics.stop("mobility", start_time)
+
+            # Update the edges of the agents that moved
+            start_time = metrics.start()
+            changed_slots = self.update_edges(self.graph, np.flatnonzero((old_rows != new_rows) | (old_cols != new_cols)))
+            metrics.stop("edge_rebuild", start_time)
+
+            # Update the groups of the agents whose edges changed
+            start_time = metrics.start()
+            groups = self.graph.update_groups(changed_slots)
+            metrics.stop("grouping", start_time)
+            if self.animation is not None:
+                self.animation.record(self.graph)
+            metrics.stop("iteration", start_time_iteration)
+
+            if self.checkpoint_interval > 0 and (i+1) % self.checkpoint_interval == 0:
+                Checkpoint.save(self.log_path + f"\\checkpoint_{i+1}.npz", self, {
+                    "iteration" : i+1,
+                    "total_iterations" : total_iterations,
+                    "iteration_score" : iteration_score,
+                    "iteration_num_tasks" : iteration_num_tasks,
+                    "max_gap" : max_gap,
+                    "time" : time.time() - start_time_simulation,
+                })
+
+        if executor is not None:
+            executor.shutdown()
+
+        simulation_time = time.time() - start_time_simulation
+        event_log.write("finish", seed_id=self.seed_id, collision_resolution=self.collision_resolution, total_iterations=total_iterations, time=simulation_time)
+        event_log.close()
+
+        start_time = metrics.start()
+        EventLog.render(event_log.path, self.log_path + "\\log.txt")
+        metrics.stop("logging", start_time)
+
+        start_time = metrics.start()
         self.visual_graph.show_visual_graph(f"network_{self.iterations}.png", groups)
-        self.visual_graph.movement_graph(f"movement_{self.iterations}.png", groups)
+        self.trajectory.flush()
+        self.visual_graph.movement_graph(f"movement_{self.iterations}.png", groups, self.trajectory)
+
+        # The animation is rendered after the simulation from the recorded frames
+        if self.animation is not None:
+            self.visual_graph.animation_graph(f"animation_{self.iterations}.{self.animation_format}", self.animation)
+        metrics.stop("rendering", start_time)
+
+        metrics.count("mobility_rounds", self.mobility.rounds)
+        metrics.count("mobility_retries", self.mobility.retries)
+        if metrics.enabled == True:
+            metrics.save_report(self.log_path + "\\metrics.json")
+
+        # Scores of the last iteration
+        self.results = {
+            "seed_id" : self.seed_id,
+            "score" : iteration_score,
+            "num_selected_tasks" : iteration_num_tasks,
+            "num_groups" : len(groups),
+            "total_iterations" : total_iterations,
+            "max_gap" : max_gap,
+            "time" : simulation_time,
+        }
+        return self.results
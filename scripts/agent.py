@@ -1,34 +1,40 @@
 from typing import List, Tuple
-import math, random, scripts.constants, numpy as np
+from scripts.solver_registry import SolverRegistry
+from scripts.agent_table import AgentTable
+import scripts.constants, numpy as np
 
 
 class Agent:
     """
-    A class to represent a agent.
+    A class to represent a agent as a view of its slot in an agent table.
 
         Attributes
         ----------
 
-        tag : str
+        table : "AgentTable"
+            Table with the data of the agent
+        tag : int
             Tag/id of the agent
-        value : float
+        value : int
             Value of the agent
         radius : float
             Radius of the agent
         neighbors : list
-            List of neighbor agents
+            List of neighbor agents, read from the adjacency of the graph
+        graph : "Graph"
+            Graph of the agent
+        slot : int
+            Slot of the agent in the table and the graph
+        grid : "Grid"
+            Grid where the agent is installed, read from the graph
         row : int
             Row position of the agent
         col : int
             Column position of the agent
-        old_rows : List[int]
-            List of old row positions of the agent
-        old_cols : List[int]
-            List of old column positions of the agent
-        tasks : list
-            List of tasks
-        selected_tasks : List["Task"]
-            List of selected tasks
+        tasks : np.ndarray
+            Ids of the tasks in the task table of the graph
+        selected_tasks : List[int]
+            Ids of the selected tasks
         state : int
             Define the state of the agent
                 state (0) -> The agent is not working
@@ -50,30 +56,210 @@ class Agent:
             Check if the other agent is inside the agent radius.
         check_in_limits(self, rows: int, cols: int, new_row: int, new_col: int) -> bool:
             Check if the new position is in the limits.
-        check_physical_collisions(self, agents: List["Agent"], new_row: int, new_col: int) -> bool:
+        check_physical_collisions(self, grid: "Grid", new_row: int, new_col: int) -> bool:
             Check if the agent collide with other agent.
-        brownian_motion(self, rows: int, cols: int, agents: List["Agent"], step_size: int) -> Tuple[int, int]:
-            Brownian motion for the agent.
         update_position(self, new_row: int, new_col: int) -> None:
             Update the position of the agent.
-        assign_task(self, task: "Task") -> None:
+        assign_task(self, task: int) -> None:
             Assign the task to the agent.
-        get_selected_tasks(self, selected_tasks: List[List[float]]) -> List[int]:
-            Get the selected tasks of the agent.
-        get_allocation_resources_score(self) -> Tuple[float, list]:
+        get_allocation_resources_score(self, solver: str, epsilon: float) -> Tuple[float, list]:
             Get the best allocation score and the list of selected tasks.
     """
 
-    def __init__(self, tag: str, value: float, radius: float) -> None:
-        self.tag = tag
-        self.value = value
-        self.radius = radius
-        self.neighbors = []
-        self.tasks = []
+    __slots__ = ("table", "slot", "graph", "tasks", "selected_tasks")
+
+    def __init__(self, tag: int, value: int, radius: float, table: "AgentTable" = None) -> None:
+        self.table = AgentTable() if table is None else table
+        self.slot = self.table.add_agent(tag, value, radius)
+        self.graph = None
+        self.tasks = np.zeros(0, dtype=np.int64)
         self.selected_tasks = []
-        self.state = 0
-        self.row, self.col = None, None
-        self.old_rows, self.old_cols = [], [] 
+
+    @property
+    def tag(self) -> int:
+        """
+        Get the tag of the agent from the table.
+
+            Parameters
+                None
+    
+            Returns
+                return Tag of the agent
+        """
+
+        return self.table.tags[self.slot].item()
+
+    @tag.setter
+    def tag(self, tag: int) -> None:
+        """
+        Set the tag of the agent in the table.
+
+            Parameters
+                tag (int): Tag of the agent
+    
+            Returns
+                return None
+        """
+
+        self.table.tags[self.slot] = tag
+
+    @property
+    def value(self) -> int:
+        """
+        Get the value of the agent from the table.
+
+            Parameters
+                None
+    
+            Returns
+                return Value of the agent
+        """
+
+        return self.table.values[self.slot].item()
+
+    @value.setter
+    def value(self, value: int) -> None:
+        """
+        Set the value of the agent in the table.
+
+            Parameters
+                value (int): Value of the agent
+    
+            Returns
+                return None
+        """
+
+        self.table.values[self.slot] = value
+
+    @property
+    def radius(self) -> float:
+        """
+        Get the radius of the agent from the table.
+
+            Parameters
+                None
+    
+            Returns
+                return Radius of the agent
+        """
+
+        return self.table.radii[self.slot].item()
+
+    @radius.setter
+    def radius(self, radius: float) -> None:
+        """
+        Set the radius of the agent in the table.
+
+            Parameters
+                radius (float): Radius of the agent
+    
+            Returns
+                return None
+        """
+
+        self.table.radii[self.slot] = radius
+
+    @property
+    def state(self) -> int:
+        """
+        Get the state of the agent from the table.
+
+            Parameters
+                None
+    
+            Returns
+                return State of the agent
+        """
+
+        return self.table.states[self.slot].item()
+
+    @state.setter
+    def state(self, state: int) -> None:
+        """
+        Set the state of the agent in the table.
+
+            Parameters
+                state (int): State of the agent
+    
+            Returns
+                return None
+        """
+
+        self.table.states[self.slot] = state
+
+    @property
+    def row(self) -> int:
+        """
+        Get the row position of the agent from the table.
+
+            Parameters
+                None
+    
+            Returns
+                return Row position of the agent, None if it isn't installed
+        """
+
+        row = self.table.rows[self.slot].item()
+        return None if row == scripts.constants.EMPTY_CELL else row
+
+    @row.setter
+    def row(self, row: int) -> None:
+        """
+        Set the row position of the agent in the table.
+
+            Parameters
+                row (int): Row position of the agent, None if it isn't installed
+    
+            Returns
+                return None
+        """
+
+        self.table.rows[self.slot] = scripts.constants.EMPTY_CELL if row is None else row
+
+    @property
+    def col(self) -> int:
+        """
+        Get the column position of the agent from the table.
+
+            Parameters
+                None
+    
+            Returns
+                return Column position of the agent, None if it isn't installed
+        """
+
+        col = self.table.cols[self.slot].item()
+        return None if col == scripts.constants.EMPTY_CELL else col
+
+    @col.setter
+    def col(self, col: int) -> None:
+        """
+        Set the column position of the agent in the table.
+
+            Parameters
+                col (int): Column position of the agent, None if it isn't installed
+    
+            Returns
+                return None
+        """
+
+        self.table.cols[self.slot] = scripts.constants.EMPTY_CELL if col is None else col
+
+    @property
+    def grid(self) -> "Grid":
+        """
+        Get the grid where the agent is installed from the graph.
+
+            Parameters
+                None
+    
+            Returns
+                return Grid of the agent, None if it isn't in a graph
+        """
+
+        if self.graph is None:
+            return None
+        return self.graph.grid
 
     def __str__(self) -> str:
         """
@@ -101,6 +287,22 @@ class Agent:
 
         return "(" + str(self.tag) + ", " + str(self.value) + ")"
 
+    @property
+    def neighbors(self) -> List["Agent"]:
+        """
+        Get the neighbor agents from the adjacency of the graph.
+
+            Parameters
+                None
+    
+            Returns
+                return List of neighbor agents
+        """
+
+        if self.graph is None:
+            return []
+        return self.graph.get_neighbors(self.slot)
+
     def add_neighbor(self, neighbor: "agent") -> None:
         """
         Add a new agent to the neighbors list.
@@ -112,8 +314,7 @@ class Agent:
                 return None
         """
 
-        if neighbor not in self.neighbors:
-            self.neighbors.append(neighbor)
+        self.graph.connect(self.slot, neighbor.slot)
 
     def remove_neighbor(self, neighbor: "agent") -> None:
         """
@@ -126,8 +327,7 @@ class Agent:
                 return None
         """
 
-        if neighbor in self.neighbors:
-            self.neighbors.remove(neighbor)
+        self.graph.disconnect(self.slot, neighbor.slot)
 
     def is_bidirectional(self, neighbor: "agent") -> bool:
         """
@@ -140,7 +340,7 @@ class Agent:
                 return None
         """
 
-        return self in neighbor.neighbors
+        return self.graph.has_edge(neighbor.slot, self.slot)
 
     def in_neighborhood(self, x_pos: int, y_pos: int) -> bool:
         """
@@ -154,7 +354,7 @@ class Agent:
                 return True if the agent is in the neighborhood otherwise False
         """
 
-        return math.sqrt((x_pos - self.col)**2 + (y_pos - self.row)**2) <= self.radius
+        return (x_pos - self.col)**2 + (y_pos - self.row)**2 <= self.radius**2
 
     def check_in_limits(self, rows: int, cols: int, new_row: int, new_col: int) -> bool:
         """
@@ -172,12 +372,12 @@ class Agent:
 
         return (0 <= new_row < rows) and (0 <= new_col < cols)
 
-    def check_physical_collisions(self, agents: List["Agent"], new_row: int, new_col: int) -> bool:
+    def check_physical_collisions(self, grid: "Grid", new_row: int, new_col: int) -> bool:
         """
         Check if the agent collide with other agent.
 
             Parameters
-                agents (List["Agent"]): List of agents
+                grid ("Grid"): Grid with the slots of the agents
                 new_row (int): New row position
                 new_col (int): New col position
 
@@ -185,34 +385,7 @@ class Agent:
                 return True if the agent collide with other agent otherwise False
         """
 
-        for agent in agents:
-            if new_row == agent.row and new_col == agent.col:
-                return True
-        return False
-
-    def brownian_motion(self, rows: int, cols: int, agents: List["Agent"], step_size: int) -> Tuple[int, int]:
-        """
-        Brownian motion for the agent.
-
-            Parameters
-                rows (int): Number of rows
-                cols (int): Number of columns
-                agents (List["Agent"]): List of agents
-                step_size (int): Size of each step
-
-            Returns
-                return The new agent position based on the brownian motion
-        """
-
-        # Perform Brownian motion simulation
-        dx = random.choice(scripts.constants.MOBILITY_ACTIONS) * step_size
-        dy = random.choice(scripts.constants.MOBILITY_ACTIONS) * step_size
-        new_row, new_col = self.row+dx, self.col+dy
-        while (self.check_in_limits(rows, cols, new_row, new_col) == False) or (self.check_physical_collisions(agents, new_row, new_col) == True):
-            dx = random.choice(scripts.constants.MOBILITY_ACTIONS) * step_size
-            dy = random.choice(scripts.constants.MOBILITY_ACTIONS) * step_size
-            new_row, new_col = self.row+dx, self.col+dy
-        return new_row, new_col
+        return grid.is_free(new_row, new_col) == False
 
     def update_position(self, new_row: int, new_col: int) -> None:
         """
@@ -226,59 +399,36 @@ class Agent:
                 return None
         """
 
-        if self.row and self.col:
-            self.old_rows.append(self.row+1)
-            self.old_cols.append(self.col+1)
+        if self.grid is not None:
+            self.grid.move_value(self.slot, self.row, self.col, new_row, new_col)
         self.row, self.col = new_row, new_col
 
-    def assign_task(self, task: "Task") -> None:
+    def assign_task(self, task: int) -> None:
         """
         Assign the task to the agent.
 
             Parameters
-                task ("Task"): The task to assign
+                task (int): Id of the task to assign
 
             Returns
                 return None
         """
 
         self.selected_tasks.append(task)
-        self.value -= task.size
+        self.value -= self.graph.task_table.sizes[task].item()
 
-    def get_selected_tasks(self, selected_tasks: List[List[float]]) -> List[int]:
-        """
-        Get the selected tasks of the agent.
-
-            Parameters
-                selected_tasks (List[List[float]]): List of selected tasks
-
-            Returns
-                return A list with the selected tasks
-        """
-
-        result_tasks, w = [], self.value
-        for i in range(len(self.tasks)-1, -1, -1):
-            if selected_tasks[i][w]:
-                result_tasks.append(i)
-                w -= self.tasks[i].size
-        return result_tasks
-        
-    def get_allocation_resources_score(self) -> Tuple[float, list]:
+    def get_allocation_resources_score(self, solver: str = scripts.constants.KNAPSACK_SOLVERS[0], epsilon: float = scripts.constants.KNAPSACK_EPSILON) -> Tuple[float, list]:
         """
         Get the best allocation score and the list of selected tasks.
 
             Parameters
-                None
+                solver (str): Name of the knapsack solver
+                epsilon (float): Maximum relative gap of the approximation scheme
 
             Returns
                 return Tuple with the best allocation resources score and the list of selected tasks
         """
 
-        dp = [0]*(self.value+1)
-        selected_tasks = [[False]*(self.value+1) for _ in range(len(self.tasks))]
-        for i in range(1, len(self.tasks)+1):
-            for w in range(self.value, 0, -1):
-                if self.tasks[i-1].size <= w and dp[w] < dp[w-self.tasks[i-1].size]+self.tasks[i-1].value:
-                    dp[w] = dp[w-self.tasks[i-1].size]+self.tasks[i-1].value
-                    selected_tasks[i-1][w] = True
-        return dp[self.value], self.get_selected_tasks(selected_tasks)
+        knapsack = SolverRegistry.create(solver, self.graph.task_table.sizes[self.tasks], self.graph.task_table.values[self.tasks], self.value, epsilon=epsilon)
+        knapsack.solve()
+        return knapsack.get_score(self.value), knapsack.get_selected_items(self.value)
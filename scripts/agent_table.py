@@ -0,0 +1,118 @@
+import scripts.constants, numpy as np
+
+
+class AgentTable:
+    """
+    A class to represent the data of the agents stored in typed arrays indexed by slot.
+
+        Attributes
+        ----------
+
+        size : int
+            Number of agents in the table
+        tags : np.ndarray
+            Tag/id of each agent
+        values : np.ndarray
+            Value of each agent
+        radii : np.ndarray
+            Radius of each agent
+        rows : np.ndarray
+            Row position of each agent, EMPTY_CELL if it isn't installed
+        cols : np.ndarray
+            Column position of each agent, EMPTY_CELL if it isn't installed
+        states : np.ndarray
+            State of each agent
+
+        Methods
+        -------
+
+        __len__(self) -> int:
+            Get the number of agents in the table.
+        resize(self, capacity: int) -> None:
+            Change the number of agents that fit in the arrays.
+        add_agent(self, tag: int, value: int, radius: float) -> int:
+            Add a new agent at the end of the table.
+        pop_agent(self, slot: int) -> "AgentTable":
+            Remove an agent and move the next agents to the previous slot.
+    """
+
+    def __init__(self, capacity: int = 1) -> None:
+        self.size = 0
+        self.tags = np.zeros(capacity, dtype=np.int64)
+        self.values = np.zeros(capacity, dtype=np.int64)
+        self.radii = np.zeros(capacity, dtype=np.float64)
+        self.rows = np.full(capacity, scripts.constants.EMPTY_CELL, dtype=np.int64)
+        self.cols = np.full(capacity, scripts.constants.EMPTY_CELL, dtype=np.int64)
+        self.states = np.zeros(capacity, dtype=np.int8)
+
+    def __len__(self) -> int:
+        """
+        Get the number of agents in the table.
+
+            Parameters
+                None
+
+            Returns
+                return Number of agents
+        """
+
+        return self.size
+
+    def resize(self, capacity: int) -> None:
+        """
+        Change the number of agents that fit in the arrays.
+
+            Parameters
+                capacity (int): New number of agents that fit in the arrays
+
+            Returns
+                return None
+        """
+
+        for name, fill_value in (("tags", 0), ("values", 0), ("radii", 0), ("rows", scripts.constants.EMPTY_CELL), ("cols", scripts.constants.EMPTY_CELL), ("states", 0)):
+            old_array = getattr(self, name)
+            new_array = np.full(capacity, fill_value, dtype=old_array.dtype)
+            new_array[:self.size] = old_array[:self.size]
+            setattr(self, name, new_array)
+
+    def add_agent(self, tag: int, value: int, radius: float) -> int:
+        """
+        Add a new agent at the end of the table.
+
+            Parameters
+                tag (int): Tag/id of the agent
+                value (int): Value of the agent
+                radius (float): Radius of the agent
+
+            Returns
+                return Slot of the agent
+        """
+
+        # Double the arrays when they are full
+        if self.size == len(self.tags):
+            self.resize(2*max(self.size, 1))
+        slot = self.size
+        self.tags[slot], self.values[slot], self.radii[slot] = tag, value, radius
+        self.size += 1
+        return slot
+
+    def pop_agent(self, slot: int) -> "AgentTable":
+        """
+        Remove an agent and move the next agents to the previous slot.
+
+            Parameters
+                slot (int): Slot of the agent
+
+            Returns
+                return Table with only the removed agent
+        """
+
+        removed = AgentTable()
+        for name in ("tags", "values", "radii", "rows", "cols", "states"):
+            array = getattr(self, name)
+            getattr(removed, name)[0] = array[slot]
+            array[slot:self.size-1] = array[slot+1:self.size]
+        removed.size = 1
+        self.size -= 1
+        self.rows[self.size], self.cols[self.size] = scripts.constants.EMPTY_CELL, scripts.constants.EMPTY_CELL
+        return removed
@@ -0,0 +1,85 @@
+from typing import Tuple
+import numpy as np
+
+
+class Animation:
+    """
+    A class to represent the frames of the network recorded in each iteration.
+    The frames only keep arrays of the positions, edges and groups, so the recording doesn't slow down the simulation.
+
+        Attributes
+        ----------
+
+        rows : List[np.ndarray]
+            Row of each agent in each frame
+        cols : List[np.ndarray]
+            Column of each agent in each frame
+        sources : List[np.ndarray]
+            Slots of the first agents of the edges in each frame
+        targets : List[np.ndarray]
+            Slots of the second agents of the edges in each frame
+        labels : List[np.ndarray]
+            Group of each agent in each frame
+
+        Methods
+        -------
+
+        __len__(self) -> int:
+            Get the number of frames.
+        record(self, graph: "Graph") -> None:
+            Record a frame of the graph.
+        get_frame(self, frame: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+            Get the points, edges and groups of a frame.
+    """
+
+    def __init__(self) -> None:
+        self.rows, self.cols = [], []
+        self.sources, self.targets = [], []
+        self.labels = []
+
+    def __len__(self) -> int:
+        """
+        Get the number of frames.
+
+            Parameters
+                None
+
+            Returns
+                return Number of frames
+        """
+
+        return len(self.rows)
+
+    def record(self, graph: "Graph") -> None:
+        """
+        Record a frame of the graph.
+
+            Parameters
+                graph ("Graph"): Graph with the agents and their groups
+
+            Returns
+                return None
+        """
+
+        rows, cols = graph.get_positions()
+        edges = graph.adjacency.tocoo()
+        self.rows.append(rows.astype(np.int32))
+        self.cols.append(cols.astype(np.int32))
+        self.sources.append(edges.row.astype(np.int32))
+        self.targets.append(edges.col.astype(np.int32))
+        self.labels.append(graph.labels.astype(np.int32))
+
+    def get_frame(self, frame: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Get the points, edges and groups of a frame.
+
+            Parameters
+                frame (int): Number of the frame
+
+            Returns
+                return Tuple with the point of each agent, the segment of each edge and the group of each agent
+        """
+
+        points = np.column_stack((self.cols[frame]+1, self.rows[frame]+1))
+        segments = np.stack((points[self.sources[frame]], points[self.targets[frame]]), axis=1)
+        return points, segments, self.labels[frame]
@@ -0,0 +1,285 @@
+from typing import List, Callable
+from scripts.adhoc_network import AdHocNetwork
+import os, json, math, time, platform, tempfile, statistics, scripts.constants, numpy as np
+
+
+class Benchmark:
+    """
+    A class to represent the benchmarks of the hot paths of the Ad Hoc networks.
+    Each case is timed at several scales with a fixed seed, so the results of two runs can be compared.
+    The networks of the cases save their content in a temporary folder, so the content folder only gets the results.
+
+        Attributes
+        ----------
+
+        scales : dict
+            Scales of each case
+        repeats : int
+            Number of timed repeats of each case and scale
+        seed_id : int
+            Seed id of the networks
+        results : List[dict]
+            Times of each case and scale
+
+        Methods
+        -------
+
+        create_network(self, num_agents: int, num_tasks: int) -> "AdHocNetwork":
+            Create a network of the given size.
+        measure(self, function: Callable, setup: Callable) -> dict:
+            Time the repeats of a function.
+        bench_allocation_score(self, scale: int) -> dict:
+            Time the knapsack of an agent with the given number of tasks.
+        bench_allocation_capacity(self, scale: int) -> dict:
+            Time the knapsack of an agent with the given capacity.
+        bench_create_edges(self, scale: int) -> dict:
+            Time the creation of the edges of the given number of agents.
+        bench_create_groups(self, scale: int) -> dict:
+            Time the creation of the groups of the given number of agents.
+        bench_brownian_motion(self, scale: int) -> dict:
+            Time a step of the brownian motion of the given number of agents.
+        bench_collision_resolution(self, scale: int) -> dict:
+            Time the collision index of the allocation of every group of the given number of agents.
+        bench_run(self, scale: int) -> dict:
+            Time a complete simulation of the given number of agents.
+        run(self) -> List[dict]:
+            Time every case at each of its scales.
+        save_results(self, filename: str) -> None:
+            Save the results as a JSON file in the content folder.
+        compare(self, baseline_path: str, tolerance: float) -> List[dict]:
+            Get the cases that are slower than in a baseline file.
+    """
+
+    default_scales = {
+        "allocation_score"    : [10, 100, 1000, 10000, 100000],
+        "allocation_capacity" : [10, 100, 1000, 10000, 100000],
+        "create_edges"        : [10, 100, 1000, 10000, 100000],
+        "create_groups"       : [10, 100, 1000, 10000, 100000],
+        "brownian_motion"     : [10, 100, 1000, 10000, 100000],
+        "collision_resolution": [10, 40, 160],
+        "run"                 : [10, 40, 160],
+    }
+
+    def __init__(self, scales: dict = None, repeats: int = 5, seed_id: int = scripts.constants.BENCHMARK_SEED_ID) -> None:
+        self.scales = self.default_scales if scales is None else scales
+        self.repeats = repeats
+        self.seed_id = seed_id
+        self.results = []
+
+    def create_network(self, num_agents: int, num_tasks: int) -> "AdHocNetwork":
+        """
+        Create a network of the given size.
+        The grid has four cells for each agent, so the agents are installed at the same density at every scale.
+
+            Parameters
+                num_agents (int): Number of agents
+                num_tasks (int): Number of tasks of each agent
+
+            Returns
+                return Ad Hoc network
+        """
+
+        side = float(math.ceil(math.sqrt(4*num_agents)))
+        return AdHocNetwork(
+            width=side, height=side, width_span=1.0, height_span=1.0, connection_probability=1.0,
+            num_agents=num_agents, num_tasks=num_tasks, iterations=1, mobility_model="brownian_motion",
+            seed_id=self.seed_id, render_mode="headless"
+        )
+
+    def measure(self, function: Callable, setup: Callable = None) -> dict:
+        """
+        Time the repeats of a function.
+        The setup isn't timed and its result is the argument of the function.
+        A function that times only a part of its work returns that time, which replaces the time of the call.
+
+            Parameters
+                function (Callable): Function to time
+                setup (Callable): Function that creates the argument of each repeat
+
+            Returns
+                return Dictionary with the minimum, median and mean time in seconds
+        """
+
+        times = []
+        for _ in range(self.repeats):
+            argument = setup() if setup is not None else None
+            start_time = time.perf_counter()
+            measured_time = function(argument)
+            times.append(measured_time if isinstance(measured_time, float) else time.perf_counter() - start_time)
+        return {"min" : min(times), "median" : statistics.median(times), "mean" : statistics.fmean(times), "repeats" : self.repeats}
+
+    def bench_allocation_score(self, scale: int) -> dict:
+        """
+        Time the knapsack of an agent with the given number of tasks.
+        The capacity is the value of the agent, so only the number of items of the knapsack grows.
+
+            Parameters
+                scale (int): Number of tasks of the agent
+
+            Returns
+                return Dictionary with the times
+        """
+
+        network = self.create_network(10, scale)
+        agent = max(network.graph.agents, key=lambda agent: agent.value)
+        return self.measure(lambda _: agent.get_allocation_resources_score())
+
+    def bench_allocation_capacity(self, scale: int) -> dict:
+        """
+        Time the knapsack of an agent with the given capacity.
+        The agent has a fixed number of tasks and its value is the scale, so only the capacity of the knapsack grows.
+
+            Parameters
+                scale (int): Value of the agent, the capacity of the knapsack
+
+            Returns
+                return Dictionary with the times
+        """
+
+        network = self.create_network(10, scripts.constants.BENCHMARK_CAPACITY_TASKS)
+        agent = network.graph.agents[0]
+        agent.value = scale
+        return self.measure(lambda _: agent.get_allocation_resources_score())
+
+    def bench_create_edges(self, scale: int) -> dict:
+        """
+        Time the creation of the edges of the given number of agents.
+
+            Parameters
+                scale (int): Number of agents
+
+            Returns
+                return Dictionary with the times
+        """
+
+        network = self.create_network(scale, 1)
+        return self.measure(lambda _: network.create_edges(network.graph))
+
+    def bench_create_groups(self, scale: int) -> dict:
+        """
+        Time the creation of the groups of the given number of agents.
+
+            Parameters
+                scale (int): Number of agents
+
+            Returns
+                return Dictionary with the times
+        """
+
+        network = self.create_network(scale, 1)
+        return self.measure(lambda _: network.graph.create_groups())
+
+    def bench_brownian_motion(self, scale: int) -> dict:
+        """
+        Time a step of the brownian motion of the given number of agents.
+
+            Parameters
+                scale (int): Number of agents
+
+            Returns
+                return Dictionary with the times
+        """
+
+        network = self.create_network(scale, 1)
+        return self.measure(lambda _: network.brownian_motion(scripts.constants.STEP_SIZE))
+
+    def bench_collision_resolution(self, scale: int) -> dict:
+        """
+        Time the collision index of the allocation of every group of the given number of agents.
+        Each repeat allocates new allocators of the initial tasks and only their collision time is kept,
+        the builds of the collision index and the resolution of the contested tasks, without the knapsacks.
+
+            Parameters
+                scale (int): Number of agents
+
+            Returns
+                return Dictionary with the times
+        """
+
+        network = self.create_network(scale, 5)
+        groups = network.graph.create_groups()
+        setup = lambda: [network.create_group_allocator(group, network.join_tasks(group)) for group in groups]
+        return self.measure(lambda allocators: float(sum(allocator.allocate().collision_time for allocator in allocators)), setup)
+
+    def bench_run(self, scale: int) -> dict:
+        """
+        Time a complete simulation of the given number of agents.
+
+            Parameters
+                scale (int): Number of agents
+
+            Returns
+                return Dictionary with the times
+        """
+
+        return self.measure(lambda network: network.run(), lambda: self.create_network(scale, 5))
+
+    def run(self) -> List[dict]:
+        """
+        Time every case at each of its scales.
+        The content folder is replaced by a temporary folder while the cases run.
+
+            Parameters
+                None
+
+            Returns
+                return List with the times of each case and scale
+        """
+
+        self.results = []
+        content_folder_path = scripts.constants.content_folder_path
+        with tempfile.TemporaryDirectory() as folder_path:
+            scripts.constants.content_folder_path = folder_path
+            try:
+                for case, scales in self.scales.items():
+                    for scale in scales:
+                        self.results.append({"case" : case, "scale" : scale, **getattr(self, f"bench_{case}")(scale)})
+            finally:
+                scripts.constants.content_folder_path = content_folder_path
+        return self.results
+
+    def save_results(self, filename: str) -> None:
+        """
+        Save the results as a JSON file in the content folder.
+
+            Parameters
+                filename (str): Name of the results file
+
+            Returns
+                return None
+        """
+
+        os.makedirs(scripts.constants.content_folder_path, exist_ok=True)
+        with open(scripts.constants.content_folder_path + f"\\{filename}", "w") as file:
+            json.dump({
+                "seed_id" : self.seed_id,
+                "python" : platform.python_version(),
+                "numpy" : np.__version__,
+                "machine" : platform.platform(),
+                "processor" : platform.processor(),
+                "results" : self.results,
+            }, file, indent=4)
+
+    def compare(self, baseline_path: str, tolerance: float = scripts.constants.BENCHMARK_TOLERANCE) -> List[dict]:
+        """
+        Get the cases that are slower than in a baseline file.
+        The median times are compared, only the cases and scales in both results are checked.
+
+            Parameters
+                baseline_path (str): Path of the baseline results file
+                tolerance (float): Allowed increase of the median time
+
+            Returns
+                return List with the case, scale and ratio of each regression
+        """
+
+        with open(baseline_path, "r") as file:
+            baseline = {(result["case"], result["scale"]) : result for result in json.load(file)["results"]}
+        regressions = []
+        for result in self.results:
+            baseline_result = baseline.get((result["case"], result["scale"]), None)
+            if baseline_result is not None and baseline_result["median"] > 0:
+                ratio = result["median"] / baseline_result["median"]
+                if ratio > 1 + tolerance:
+                    regressions.append({"case" : result["case"], "scale" : result["scale"], "ratio" : ratio})
+        return regressions
@@ -0,0 +1,86 @@
+from typing import List, Tuple
+from scripts.knapsack_solver import KnapsackSolver
+import bisect, itertools, scripts.constants, numpy as np
+
+
+class BranchBoundKnapsack(KnapsackSolver):
+    """
+    A class to represent a 0/1 knapsack solved with a depth first branch and bound.
+    The items are branched by value density and a node is pruned when the bound of its linear relaxation
+    is not better than the best score, so the search usually visits a small part of the tree.
+
+        Attributes
+        ----------
+
+        max_nodes : int
+            Maximum number of nodes of each search, the best score found is returned when it is reached
+
+        Same attributes as KnapsackSolver
+
+        Methods
+        -------
+
+        solve_capacity(self, capacity: int) -> Tuple[int, List[int], float]:
+            Solve the knapsack for a capacity.
+    """
+
+    def __init__(self, sizes: List[int], values: List[float], capacity: int, max_nodes: int = scripts.constants.KNAPSACK_BRANCH_BOUND_MAX_NODES, **options: dict) -> None:
+        super().__init__(sizes, values, capacity, **options)
+        self.max_nodes = max_nodes
+
+    def solve_capacity(self, capacity: int) -> Tuple[int, List[int], float]:
+        """
+        Solve the knapsack for a capacity.
+        The gap is 0 when the search is complete, otherwise it is the gap to the bound of the root.
+
+            Parameters
+                capacity (int): Capacity of the knapsack
+
+            Returns
+                return Tuple with the score, the selected items and the bound of the relative gap
+        """
+
+        items = self.get_items(capacity)
+        sizes, values = self.sizes[items].tolist(), self.values[items].tolist()
+        num_items = len(items)
+        cumulative_sizes = [0] + list(itertools.accumulate(sizes))
+        cumulative_values = [0] + list(itertools.accumulate(values))
+        # The score of integer values is an integer, so the part of an item is rounded down
+        integer_values = np.issubdtype(self.values.dtype, np.integer)
+        # The equal items are next to each other, after skipping one of them the next ones are skipped too
+        next_levels = list(range(1, num_items+1))
+        for level in range(num_items-2, -1, -1):
+            if sizes[level] == sizes[level+1] and values[level] == values[level+1]:
+                next_levels[level] = next_levels[level+1]
+
+        def get_bound(level: int, free: int) -> float:
+            # The items after the level are taken by density until one doesn't fit
+            last = bisect.bisect_right(cumulative_sizes, cumulative_sizes[level] + free, lo=level) - 1
+            bound = cumulative_values[last] - cumulative_values[level]
+            if last < num_items:
+                part = (free - cumulative_sizes[last] + cumulative_sizes[level]) * values[last]
+                bound += part // sizes[last] if integer_values == True else part / sizes[last]
+            return bound
+
+        # Each node has its level, free capacity, score and the selected items as a linked list
+        best_score, best_selected, nodes = 0, None, 0
+        stack = [(0, capacity, 0, None)]
+        while len(stack) > 0 and nodes < self.max_nodes:
+            level, free, score, selected = stack.pop()
+            nodes += 1
+            if score > best_score:
+                best_score, best_selected = score, selected
+            if level == num_items or score + get_bound(level, free) <= best_score:
+                continue
+            stack.append((next_levels[level], free, score, selected))
+            if sizes[level] <= free:
+                stack.append((level+1, free-sizes[level], score+values[level], (level, selected)))
+        self.cells += nodes
+
+        selected_items = []
+        while best_selected is not None:
+            level, best_selected = best_selected
+            selected_items.append(items[level].item())
+        selected_items.sort(reverse=True)
+        gap = 0.0 if len(stack) == 0 else KnapsackSolver.get_relative_gap(best_score, get_bound(0, capacity))
+        return best_score, selected_items, gap
@@ -0,0 +1,147 @@
+from typing import List
+import json, scipy.sparse, numpy as np
+
+
+class Checkpoint:
+    """
+    A class to represent the state of a simulation between two iterations saved in a compressed npz file.
+    The state has the agents, tasks, edges, groups, trajectory, random states and the counters of the metrics
+    and the mobility, so a run resumed from it gives the same iterations and counters as the uninterrupted run.
+
+        Attributes
+        ----------
+
+        None
+
+        Methods
+        -------
+
+        join_lists(lists: List[list]) -> tuple:
+            Join lists of integers into one array and the offset of each list.
+        split_lists(values: np.ndarray, offsets: np.ndarray) -> List[np.ndarray]:
+            Split an array into the lists of the offsets.
+        save(path: str, network: "AdHocNetwork", run_state: dict) -> None:
+            Save the state of the network and the run.
+        load(path: str, network: "AdHocNetwork") -> dict:
+            Load the state of the network and get the state of the run.
+    """
+
+    @staticmethod
+    def join_lists(lists: List[list]) -> tuple:
+        """
+        Join lists of integers into one array and the offset of each list.
+
+            Parameters
+                lists (List[list]): Lists of integers
+
+            Returns
+                return Tuple with the joined values and the offsets (number of lists + 1)
+        """
+
+        offsets = np.zeros(len(lists)+1, dtype=np.int64)
+        offsets[1:] = np.cumsum([len(values) for values in lists])
+        values = np.concatenate([np.asarray(values, dtype=np.int64) for values in lists]) if len(lists) > 0 else np.zeros(0, dtype=np.int64)
+        return values, offsets
+
+    @staticmethod
+    def split_lists(values: np.ndarray, offsets: np.ndarray) -> List[np.ndarray]:
+        """
+        Split an array into the lists of the offsets.
+
+            Parameters
+                values (np.ndarray): Joined values
+                offsets (np.ndarray): Offset of each list
+
+            Returns
+                return List with the values of each list
+        """
+
+        return [values[begin:end] for begin, end in zip(offsets[:-1].tolist(), offsets[1:].tolist())]
+
+    @staticmethod
+    def save(path: str, network: "AdHocNetwork", run_state: dict) -> None:
+        """
+        Save the state of the network and the run.
+
+            Parameters
+                path (str): Path of the checkpoint file
+                network ("AdHocNetwork"): Network to save
+                run_state (dict): Iteration, scores and time of the run
+
+            Returns
+                return None
+        """
+
+        graph, table, task_table = network.graph, network.graph.table, network.graph.task_table
+        size = len(graph.agents)
+        tasks, tasks_offsets = Checkpoint.join_lists([agent.tasks for agent in graph.agents])
+        selected_tasks, selected_tasks_offsets = Checkpoint.join_lists([agent.selected_tasks for agent in graph.agents])
+        groups, groups_offsets = Checkpoint.join_lists([[agent.slot for agent in group] for group in graph.groups])
+        with open(path, "wb") as file:
+            np.savez_compressed(
+                file,
+                run_state=np.array(json.dumps(run_state)),
+                tags=table.tags[:size], values=table.values[:size], radii=table.radii[:size],
+                rows=table.rows[:size], cols=table.cols[:size], states=table.states[:size],
+                task_sizes=task_table.sizes[:len(task_table)], task_values=task_table.values[:len(task_table)], task_times=task_table.times[:len(task_table)],
+                tasks=tasks, tasks_offsets=tasks_offsets,
+                selected_tasks=selected_tasks, selected_tasks_offsets=selected_tasks_offsets,
+                adjacency_indices=graph.adjacency.indices, adjacency_indptr=graph.adjacency.indptr,
+                labels=graph.labels, groups=groups, groups_offsets=groups_offsets,
+                trajectory=network.trajectory.positions[:network.trajectory.size],
+                trajectory_steps=np.array(network.trajectory.steps),
+                random_state=np.array(network.random_streams.get_state()),
+                metrics=np.array(json.dumps({"timers" : network.metrics.timers, "counters" : network.metrics.counters})),
+                mobility_counters=np.array([network.mobility.rounds, network.mobility.retries], dtype=np.int64),
+            )
+
+    @staticmethod
+    def load(path: str, network: "AdHocNetwork") -> dict:
+        """
+        Load the state of the network and get the state of the run.
+        The network must have the same number of agents as the saved network.
+
+            Parameters
+                path (str): Path of the checkpoint file
+                network ("AdHocNetwork"): Network to restore
+
+            Returns
+                return Dictionary with the iteration, scores and time of the run
+        """
+
+        graph, table, task_table = network.graph, network.graph.table, network.graph.task_table
+        with np.load(path, allow_pickle=False) as checkpoint:
+            size = len(checkpoint["tags"])
+            if size != len(graph.agents):
+                raise Exception(f"The checkpoint has {size} agents and the network has {len(graph.agents)} agents.")
+            table.tags[:size], table.values[:size], table.radii[:size] = checkpoint["tags"], checkpoint["values"], checkpoint["radii"]
+            table.states[:size] = checkpoint["states"]
+            graph.set_positions(checkpoint["rows"], checkpoint["cols"])
+            network.spatial_hash.build(checkpoint["rows"], checkpoint["cols"])
+
+            # Replace the tasks of the table
+            task_table.size = 0
+            task_table.add_tasks(checkpoint["task_sizes"], checkpoint["task_values"], checkpoint["task_times"])
+            agents_tasks = Checkpoint.split_lists(checkpoint["tasks"], checkpoint["tasks_offsets"])
+            agents_selected_tasks = Checkpoint.split_lists(checkpoint["selected_tasks"], checkpoint["selected_tasks_offsets"])
+            for agent, tasks, selected_tasks in zip(graph.agents, agents_tasks, agents_selected_tasks):
+                agent.tasks, agent.selected_tasks = tasks.copy(), selected_tasks.tolist()
+
+            graph.adjacency = scipy.sparse.csr_matrix(
+                (np.ones(len(checkpoint["adjacency_indices"]), dtype=np.bool_), checkpoint["adjacency_indices"], checkpoint["adjacency_indptr"]),
+                shape=(size, size)
+            )
+            graph.labels = checkpoint["labels"].copy()
+            graph.groups = [[graph.agents[slot] for slot in slots.tolist()] for slots in Checkpoint.split_lists(checkpoint["groups"], checkpoint["groups_offsets"])]
+
+            trajectory = checkpoint["trajectory"][:len(network.trajectory.positions)]
+            network.trajectory.positions[:len(trajectory)] = trajectory
+            network.trajectory.size, network.trajectory.steps = len(trajectory), checkpoint["trajectory_steps"].item()
+
+            network.random_streams.set_state(checkpoint["random_state"].item())
+            # The checkpoints of older versions don't have the counters
+            if "metrics" in checkpoint.files:
+                metrics = json.loads(checkpoint["metrics"].item())
+                network.metrics.timers, network.metrics.counters = metrics["timers"], metrics["counters"]
+                network.mobility.rounds, network.mobility.retries = checkpoint["mobility_counters"].tolist()
+            return json.loads(checkpoint["run_state"].item())
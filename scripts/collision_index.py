@@ -0,0 +1,204 @@
+from typing import List
+import numpy as np
+
+
+class CollisionIndex:
+    """
+    A class to represent a tournament tree of the selected tasks to get the most contested task.
+    The tree splits the tasks as the merge sort of the tasks, so the first task is the same
+    even when the comparison of the tasks with the same number of collisions isn't transitive.
+
+        Attributes
+        ----------
+
+        sizes : List[int]
+            Size of each task
+        values : List[int]
+            Value of each task
+        key_based : bool
+            Compare the tasks with the key (collisions, size, value, position) instead of the merge order
+        entries : List[tuple]
+            Task index and agents of each selected task, None if it was removed
+        leaves : List[int]
+            Node of each entry
+        parents : List[int]
+            Parent of each node, -1 for the root
+        lefts : List[int]
+            Left child of each node, -1 for the leaves
+        rights : List[int]
+            Right child of each node, -1 for the leaves
+        winners : List[int]
+            Entry that goes first in the range of each node
+
+        Methods
+        -------
+
+        goes_first(self, first: int, second: int) -> bool:
+            Check if the first entry goes before the second entry.
+        play(self, first: int, second: int) -> int:
+            Get the entry that goes first between two entries.
+        create_node(self, begin: int, end: int, parent: int) -> int:
+            Create the node of the entries from begin to end.
+        build(self, entries: List[tuple]) -> None:
+            Create the tree of the entries.
+        update(self, position: int, entry: tuple) -> None:
+            Change an entry and update the nodes above it.
+        remove(self, position: int) -> None:
+            Remove an entry.
+        get_top(self) -> tuple:
+            Get the entry that goes first.
+        pop_top(self) -> tuple:
+            Get and remove the entry that goes first.
+    """
+
+    def __init__(self, sizes: np.ndarray, values: np.ndarray, key_based: bool = False) -> None:
+        self.sizes = np.asarray(sizes).tolist()
+        self.values = np.asarray(values).tolist()
+        self.key_based = key_based
+        self.entries, self.leaves = [], []
+        self.parents, self.lefts, self.rights, self.winners = [], [], [], []
+
+    def goes_first(self, first: int, second: int) -> bool:
+        """
+        Check if the first entry goes before the second entry.
+
+            Parameters
+                first (int): Position of the first entry
+                second (int): Position of the second entry
+
+            Returns
+                return True if the first entry goes first otherwise False
+        """
+
+        (first_task, first_agents), (second_task, second_agents) = self.entries[first], self.entries[second]
+        if self.key_based == True:
+            return (-len(first_agents), self.sizes[first_task], -self.values[first_task], first) < (-len(second_agents), self.sizes[second_task], -self.values[second_task], second)
+        # More collisions go first
+        if len(first_agents) != len(second_agents):
+            return len(first_agents) > len(second_agents)
+        # With the same collisions the second task only goes first if it is smaller and its value isn't lower
+        return not (self.sizes[first_task] > self.sizes[second_task] and self.values[first_task] <= self.values[second_task])
+
+    def play(self, first: int, second: int) -> int:
+        """
+        Get the entry that goes first between two entries.
+
+            Parameters
+                first (int): Position of the first entry
+                second (int): Position of the second entry
+
+            Returns
+                return Position of the entry that goes first, -1 if both were removed
+        """
+
+        if first == -1 or self.entries[first] is None:
+            return -1 if second == -1 or self.entries[second] is None else second
+        if second == -1 or self.entries[second] is None:
+            return first
+        return first if self.goes_first(first, second) == True else second
+
+    def create_node(self, begin: int, end: int, parent: int) -> int:
+        """
+        Create the node of the entries from begin to end.
+
+            Parameters
+                begin (int): Position of the first entry
+                end (int): Position of the last entry
+                parent (int): Parent of the node
+
+            Returns
+                return Node of the entries
+        """
+
+        node = len(self.winners)
+        self.parents.append(parent)
+        self.lefts.append(-1)
+        self.rights.append(-1)
+        self.winners.append(begin)
+        if begin == end:
+            self.leaves[begin] = node
+            return node
+        mid = begin+(end-begin)//2
+        self.lefts[node] = self.create_node(begin, mid, node)
+        self.rights[node] = self.create_node(mid+1, end, node)
+        self.winners[node] = self.play(self.winners[self.lefts[node]], self.winners[self.rights[node]])
+        return node
+
+    def build(self, entries: List[tuple]) -> None:
+        """
+        Create the tree of the entries.
+
+            Parameters
+                entries (List[tuple]): Task index and agents of each selected task
+
+            Returns
+                return None
+        """
+
+        self.entries, self.leaves = list(entries), [-1]*len(entries)
+        self.parents, self.lefts, self.rights, self.winners = [], [], [], []
+        if len(self.entries) > 0:
+            self.create_node(0, len(self.entries)-1, -1)
+
+    def update(self, position: int, entry: tuple) -> None:
+        """
+        Change an entry and update the nodes above it.
+
+            Parameters
+                position (int): Position of the entry
+                entry (tuple): Task index and agents of the selected task, None to remove it
+
+            Returns
+                return None
+        """
+
+        self.entries[position] = entry
+        self.winners[self.leaves[position]] = position if entry is not None else -1
+        node = self.parents[self.leaves[position]]
+        while node != -1:
+            self.winners[node] = self.play(self.winners[self.lefts[node]], self.winners[self.rights[node]])
+            node = self.parents[node]
+
+    def remove(self, position: int) -> None:
+        """
+        Remove an entry.
+
+            Parameters
+                position (int): Position of the entry
+
+            Returns
+                return None
+        """
+
+        self.update(position, None)
+
+    def get_top(self) -> tuple:
+        """
+        Get the entry that goes first.
+
+            Parameters
+                None
+
+            Returns
+                return Task index and agents of the entry, None if there are no entries
+        """
+
+        if len(self.winners) == 0 or self.winners[0] == -1:
+            return None
+        return self.entries[self.winners[0]]
+
+    def pop_top(self) -> tuple:
+        """
+        Get and remove the entry that goes first.
+
+            Parameters
+                None
+
+            Returns
+                return Task index and agents of the entry, None if there are no entries
+        """
+
+        top = self.get_top()
+        if top is not None:
+            self.remove(self.winners[0])
+        return top
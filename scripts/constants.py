@@ -7,6 +7,9 @@ parameters_folder_path = current_directory + "\\parameters"
 # Separation character
 SEPARATION_CHAR = "="
 
+# Separation character of the values of a sweep
+SWEEP_SEPARATION_CHAR = ","
+
 # False and true value
 TRUE_VALUES = [
     "true", 
@@ -27,10 +30,107 @@ FALSE_VALUES = [
 # Step size
 STEP_SIZE = 1
 
+# Value of the free cells of the grid
+EMPTY_CELL = -1
+
+# Independent random streams of the subsystems, new streams are added at the end to keep the others
+RANDOM_STREAMS = [
+    "placement",
+    "tasks",
+    "edges",
+    "mobility",
+    "visuals",
+]
+
 # Mobility actions
 MOBILITY_ACTIONS = [-1, 0, 1]
 
 # Mobility models
 MOBILITY_MODELS = [
     "brownian_motion",
-]
\ No newline at end of file
+]
+
+# Collision resolutions
+COLLISION_RESOLUTIONS = [
+    "one_at_a_time",
+    "batched",
+]
+
+# Executors of the group allocation
+EXECUTORS = [
+    "serial",
+    "thread",
+    "process",
+]
+
+# Storages of the trajectory of the agents
+TRAJECTORY_STORAGES = [
+    "memory",
+    "memmap",
+]
+
+# Number of items between the saved best scores of the knapsack
+KNAPSACK_CHECKPOINT_INTERVAL = 32
+
+# Number of rows of the knapsack read at once while finding the selected items
+KNAPSACK_BACKTRACK_BLOCK = 64
+
+# Solvers of the knapsack, the exact dynamic programming is the default
+KNAPSACK_SOLVERS = [
+    "exact",
+    "greedy",
+    "fptas",
+    "branch_and_bound",
+]
+
+# Maximum relative gap to the best score of the approximation scheme
+KNAPSACK_EPSILON = 0.1
+
+# Maximum number of nodes of each search of the branch and bound
+KNAPSACK_BRANCH_BOUND_MAX_NODES = 100000
+
+# Order the tasks with the same collisions by (size, value) instead of the merge order
+COLLISION_KEY_BASED = False
+
+# Bytes buffered by the event log before writing in the file
+EVENT_LOG_BUFFER_SIZE = 1 << 16
+
+# Maximum number of agent tags drawn in a visual graph
+VISUAL_GRAPH_MAX_TAGS = 100
+
+# Maximum number of groups in the legend of a visual graph
+VISUAL_GRAPH_MAX_LEGENDS = 20
+
+# Render modes of the visual graph
+RENDER_MODES = [
+    "interactive",
+    "headless",
+]
+
+# Formats of the animation of the network, none to skip the recording
+ANIMATION_FORMATS = [
+    "none",
+    "gif",
+    "mp4",
+]
+
+# Frames per second of the animation
+ANIMATION_FPS = 2
+
+# Colormap of the groups in the animation
+ANIMATION_COLORMAP = "tab20"
+
+# Modes of the timers and counters of the simulation
+METRICS_MODES = [
+    "disabled",
+    "enabled",
+]
+
+# Seed id of the benchmark networks
+BENCHMARK_SEED_ID = 4070114561247836348
+
+# Number of tasks of the agent of the benchmark of the knapsack capacity
+BENCHMARK_CAPACITY_TASKS = 1000
+
+# Allowed increase of the median time of a benchmark before it is a regression
+BENCHMARK_TOLERANCE = 0.25
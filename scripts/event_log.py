@@ -0,0 +1,123 @@
+import json, scripts.constants
+
+
+class EventLog:
+    """
+    A class to represent a log of the simulation written as JSON Lines records while they happen.
+
+        Attributes
+        ----------
+
+        path : str
+            Path of the JSON Lines file
+        file : object
+            Buffered file of the records
+
+        Methods
+        -------
+
+        write(self, event: str, **fields: dict) -> None:
+            Write a record of the event.
+        flush(self) -> None:
+            Write the buffered records in the file.
+        close(self) -> None:
+            Close the file of the records.
+        render_record(record: dict) -> str:
+            Represents a record in the text format of the log.
+        render(path: str, text_path: str) -> None:
+            Write the text log of a JSON Lines file.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.file = open(path, "w", buffering=scripts.constants.EVENT_LOG_BUFFER_SIZE)
+
+    def write(self, event: str, **fields: dict) -> None:
+        """
+        Write a record of the event.
+
+            Parameters
+                event (str): Name of the event
+                fields (dict): Data of the event
+
+            Returns
+                return None
+        """
+
+        self.file.write(json.dumps({"event" : event, **fields}, separators=(",", ":")) + "\n")
+
+    def flush(self) -> None:
+        """
+        Write the buffered records in the file.
+
+            Parameters
+                None
+
+            Returns
+                return None
+        """
+
+        self.file.flush()
+
+    def close(self) -> None:
+        """
+        Close the file of the records.
+
+            Parameters
+                None
+
+            Returns
+                return None
+        """
+
+        self.file.close()
+
+    @staticmethod
+    def render_record(record: dict) -> str:
+        """
+        Represents a record in the text format of the log.
+
+            Parameters
+                record (dict): Record of an event
+
+            Returns
+                return The text of the record
+        """
+
+        event = record["event"]
+        if event == "start":
+            return f"Simulation stats\n\nRows: {record['rows']}\nColumns: {record['cols']}\nNumber of agents: {record['num_agents']}\nNumber of tasks: {record['num_tasks']}\nAgents:\n\n"
+        elif event == "agent":
+            return "(" + str(record["tag"]) + ", " + str(record["value"]) + ")\n"
+        elif event == "resume":
+            return f"\nResumed at iteration: {record['iteration']}\n"
+        elif event == "iteration":
+            return "\n"+"#"*50+f"\n\nIteration: {record['iteration']}\n\nNumber of groups: {record['num_groups']}\n"
+        elif event == "group":
+            return f"\nGroup: {record['group']}\n"
+        elif event == "allocation":
+            tasks = ", ".join("(" + str(size) + ", " + str(value) + ", " + str(time) + ")" for size, value, time in record["tasks"])
+            return "(" + str(record["tag"]) + ", " + str(record["value"]) + ")->[" + tasks + "]\n"
+        elif event == "group_stats":
+            return f"\nGroup stats\nTotal score: {record['score']}\nTotal number of tasks: {record['num_tasks']}\nIterations: {record['iterations']}\n"
+        elif event == "finish":
+            return f"\nSimulation finished\nSeed ID: {record['seed_id']}\nCollision resolution: {record['collision_resolution']}\nTotal iterations: {record['total_iterations']}\nTime: {record['time']}"
+        return ""
+
+    @staticmethod
+    def render(path: str, text_path: str) -> None:
+        """
+        Write the text log of a JSON Lines file.
+        The records are read and written one by one, so the log is never in memory.
+
+            Parameters
+                path (str): Path of the JSON Lines file
+                text_path (str): Path of the text log
+
+            Returns
+                return None
+        """
+
+        with open(path, "r") as file, open(text_path, "w") as text_file:
+            for line in file:
+                text_file.write(EventLog.render_record(json.loads(line)))
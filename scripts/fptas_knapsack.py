@@ -0,0 +1,76 @@
+from typing import List, Tuple
+from scripts.knapsack_solver import KnapsackSolver
+import scripts.constants, numpy as np
+
+
+class FptasKnapsack(KnapsackSolver):
+    """
+    A class to represent a 0/1 knapsack solved with a fully polynomial time approximation scheme.
+    The values are scaled down and the dynamic programming finds the smallest size of each scaled score,
+    so its score is at least (1 - epsilon) times the best score.
+
+        Attributes
+        ----------
+
+        epsilon : float
+            Maximum relative gap to the best score
+
+        Same attributes as KnapsackSolver
+
+        Methods
+        -------
+
+        solve_capacity(self, capacity: int) -> Tuple[int, List[int], float]:
+            Solve the knapsack for a capacity.
+    """
+
+    def __init__(self, sizes: List[int], values: List[float], capacity: int, epsilon: float = scripts.constants.KNAPSACK_EPSILON, **options: dict) -> None:
+        super().__init__(sizes, values, capacity, **options)
+        if epsilon <= 0:
+            raise Exception(f"The epsilon of the approximation must be positive, not {epsilon}.")
+        self.epsilon = epsilon
+
+    def solve_capacity(self, capacity: int) -> Tuple[int, List[int], float]:
+        """
+        Solve the knapsack for a capacity.
+        The values are integers, so a scale smaller than 1 is replaced by 1 and the result is the best score.
+
+            Parameters
+                capacity (int): Capacity of the knapsack
+
+            Returns
+                return Tuple with the score, the selected items and the bound of the relative gap
+        """
+
+        items = self.get_items(capacity)
+        items = items[self.values[items] > 0]
+        if len(items) == 0:
+            return 0, [], 0.0
+        scale = max(self.epsilon * self.values[items].max().item() / len(items), 1.0)
+        scaled_values = np.floor(self.values[items] / scale).astype(np.int64)
+        # No feasible selection has a score above the bound of the linear relaxation
+        bound = self.get_upper_bound(items, capacity)
+        total = min(scaled_values.sum().item(), int(bound / scale))
+        # Smallest size of each scaled score, the sizes bigger than the capacity are not reachable
+        dp = np.full(total+1, capacity+1, dtype=np.int64)
+        dp[0] = 0
+        choices = np.zeros((len(items), total+1), dtype=np.bool_)
+        for i, size, value in zip(range(len(items)), self.sizes[items].tolist(), scaled_values.tolist()):
+            if value > total:
+                continue
+            self.cells += total+1-value
+            candidates = dp[:total+1-value] + size
+            tail = dp[value:]
+            np.less(candidates, tail, out=choices[i, value:])
+            np.minimum(tail, candidates, out=tail)
+        best = np.flatnonzero(dp <= capacity)[-1].item()
+
+        selected_items, i = [], len(items)
+        while best > 0:
+            # Find the last item selected for the current scaled score
+            i = np.flatnonzero(choices[:i, best])[-1].item()
+            selected_items.append(items[i].item())
+            best -= scaled_values[i].item()
+        selected_items.sort(reverse=True)
+        score = self.values[selected_items].sum().item() if len(selected_items) > 0 else 0
+        return score, selected_items, min(self.epsilon, KnapsackSolver.get_relative_gap(score, bound))
@@ -1,5 +1,4 @@
-from typing import List
-import random
+import numpy as np
 
 
 class Generator:
@@ -11,25 +10,27 @@ class Generator:
 
         n : int
             Number of numbers to generate
+        rng : np.random.Generator
+            Generator of the random numbers
 
         Methods
         -------
         
         generate_random_number(self) -> float:
             Generate random number.
-        generate_unique_integer_numbers(self, min_value: int, max_value: int) -> List[int]:
+        generate_unique_integer_numbers(self, min_value: int, max_value: int) -> np.ndarray:
             Generate random unique numbers.
-        generate_integer_numbers(self, min_value: int, max_value: int) -> List[int]:
+        generate_integer_numbers(self, min_value: int, max_value: int) -> np.ndarray:
             Generate random integer numbers.
-        generate_float_numbers(self, min_value: float, max_value: float, precision: int) -> List[int]:
+        generate_float_numbers(self, min_value: float, max_value: float, precision: int) -> np.ndarray:
             Generate random float numbers.
-        generate_unique_pairs(self, min_value1: int, max_value1: int, min_value2: int, max_value2: int) -> List[int]:
+        generate_unique_pairs(self, min_value1: int, max_value1: int, min_value2: int, max_value2: int) -> np.ndarray:
             Generate random unique pairs of numbers.
     """
 
-    def __init__(self, n: int, seed_id: int) -> None:
+    def __init__(self, n: int, rng: np.random.Generator) -> None:
         self.n = n
-        self.seed_id = seed_id
+        self.rng = rng
 
     def generate_random_number(self) -> float:
         """
@@ -42,26 +43,27 @@ class Generator:
                 return Random number
         """
 
-        return random.random()
+        return self.rng.random()
 
-    def generate_unique_integer_numbers(self, min_value: int, max_value: int) -> List[int]:
+    def generate_unique_integer_numbers(self, min_value: int, max_value: int) -> np.ndarray:
         """
         Generate random unique numbers.
+        The numbers are sampled without replacement, so the range must have at least n numbers.
 
             Parameters
                 min_value (int): Minimal value
                 max_value (int): Maximal value
     
             Returns
-                return List with random unique numbers
+                return Array with random unique numbers
         """
 
-        unique_numbers = set()
-        while len(unique_numbers) < self.n:
-            unique_numbers.add(random.randint(min_value, max_value))
-        return list(unique_numbers)
+        num_values = max_value - min_value + 1
+        if self.n > num_values:
+            raise Exception(f"There aren't {self.n} unique numbers between {min_value} and {max_value}.")
+        return min_value + self.rng.choice(num_values, size=self.n, replace=False)
 
-    def generate_integer_numbers(self, min_value: int, max_value: int) -> List[int]:
+    def generate_integer_numbers(self, min_value: int, max_value: int) -> np.ndarray:
         """
         Generate random integer numbers.
 
@@ -70,12 +72,12 @@ class Generator:
                 max_value (int): Maximal integer value
     
             Returns
-                return List with random integer numbers
+                return Array with random integer numbers
         """
 
-        return [random.randint(min_value, max_value) for _ in range(self.n)]
+        return self.rng.integers(min_value, max_value+1, size=self.n)
 
-    def generate_float_numbers(self, min_value: float, max_value: float, precision: int) -> List[int]:
+    def generate_float_numbers(self, min_value: float, max_value: float, precision: int) -> np.ndarray:
         """
         Generate random float numbers.
 
@@ -85,22 +87,15 @@ class Generator:
                 precision (int): Precision of the random numbers
     
             Returns
-                return List with random float numbers
+                return Array with random float numbers
         """
 
-        random_float_numbers = []
-    
-        for _ in range(self.n):
-            random_float = random.uniform(min_value, max_value)
-            format_str = "{:." + str(precision) + "f}"
-            formatted_float = float(format_str.format(random_float))
-            random_float_numbers.append(formatted_float)
-        
-        return random_float_numbers
+        return np.round(self.rng.uniform(min_value, max_value, size=self.n), precision)
 
-    def generate_unique_pairs(self, min_value1: int, max_value1: int, min_value2: int, max_value2: int) -> List[int]:
+    def generate_unique_pairs(self, min_value1: int, max_value1: int, min_value2: int, max_value2: int) -> np.ndarray:
         """
         Generate random unique pairs of numbers.
+        The pairs are sampled without replacement from every pair of the ranges, so there must be at least n pairs.
 
             Parameters
                 min_value1 (int): First minimal value
@@ -109,12 +104,12 @@ class Generator:
                 max_value2 (int): Second maximal value
 
             Returns
-                return List with random unique pairs of numbers
+                return Array (n x 2) with random unique pairs of numbers
         """
 
-        pairs = set()
-        while len(pairs) < self.n:
-            num1 = random.randint(min_value1, max_value1)
-            num2 = random.randint(min_value2, max_value2)
-            pairs.add((num1, num2))
-        return list(pairs)
+        num_values1, num_values2 = max_value1 - min_value1 + 1, max_value2 - min_value2 + 1
+        if self.n > num_values1 * num_values2:
+            raise Exception(f"There aren't {self.n} unique pairs in a grid of {num_values1}x{num_values2}.")
+        # Each pair is a flattened cell of the ranges
+        cells = self.rng.choice(num_values1 * num_values2, size=self.n, replace=False)
+        return np.column_stack((min_value1 + cells // num_values2, min_value2 + cells % num_values2))
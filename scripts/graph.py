@@ -1,5 +1,8 @@
 from typing import List, Tuple
 from scripts.agent import Agent
+from scripts.agent_table import AgentTable
+from scripts.task_table import TaskTable
+import scripts.constants, numpy as np, scipy.sparse, scipy.sparse.csgraph
 
 
 class Graph:
@@ -9,8 +12,24 @@ class Graph:
         Attributes
         ----------
 
-        agents : dict
-            Dictionary with the graph agents
+        table : "AgentTable"
+            Table with the data of the agents
+        agents : List["Agent"]
+            List of agents indexed by their slot
+        grid : "Grid"
+            Grid where the agents are installed
+        task_table : "TaskTable"
+            Table with the data of the tasks of the agents
+        adjacency : scipy.sparse.csr_matrix
+            Adjacency matrix (slot x slot) of the directed edges, the staged edges are applied when it is read
+        sparse_adjacency : scipy.sparse.csr_matrix
+            Adjacency matrix without the staged edges
+        staged_edges : dict
+            Directed edges added (True) or removed (False) one by one and not applied to the adjacency yet
+        labels : np.ndarray
+            Group of each slot
+        groups : List[List["Agent"]]
+            Groups of bidirectional neighbors
 
         Methods
         -------
@@ -19,32 +38,96 @@ class Graph:
             Represents the graph in a string format.
         __repr__(self) -> str:
             Represents the graph in a string format for data structures.
-        add_agent(self, tag: str, value: float, radius: float) -> None:
+        add_agent(self, tag: int, value: int, radius: float) -> int:
             Add a new agent to the graph.
-        add_edge(self, tag1: str, tag2: str) -> None:
+        add_edge(self, slot1: int, slot2: int) -> None:
             Add a new edge to the graph.
-        remove_agent(self, tag: str) -> None:
+        remove_agent(self, slot: int) -> None:
             Remove a agent from the graph.
-        remove_edge(self, tag1: str, tag2: str) -> None:
+        remove_edge(self, slot1: int, slot2: int) -> None:
             Remove an edge from the graph.
+        set_edges(self, sources: np.ndarray, targets: np.ndarray) -> None:
+            Replace the edges of the graph.
+        clear_edges(self) -> None:
+            Remove all the edges of the graph.
+        apply_staged_edges(self) -> None:
+            Apply the staged edges to the adjacency matrix at once.
+        connect(self, slot1: int, slot2: int) -> None:
+            Stage the directed edge between two slots.
+        disconnect(self, slot1: int, slot2: int) -> None:
+            Stage the removal of the directed edge between two slots.
+        has_edge(self, slot1: int, slot2: int) -> bool:
+            Check if the directed edge between two slots exists.
+        get_neighbors(self, slot: int) -> List["Agent"]:
+            Get the neighbors of the agent in the slot.
+        get_radii(self) -> np.ndarray:
+            Get the radius of each slot.
+        get_positions(self) -> Tuple[np.ndarray, np.ndarray]:
+            Get the row and column of each slot.
+        set_positions(self, rows: np.ndarray, cols: np.ndarray) -> None:
+            Update the row and column of each slot.
         display(self) -> None:
             Display the graph agents.
-        bfs(self, start_value: str) -> None:
+        bfs(self, start_slot: int) -> None:
             BFS (Breadth first search).
-        dfs(self, start_value: str) -> None:
+        dfs(self, start_slot: int) -> None:
             DFS (Depth first search).
         get_max_value(self) -> float:
             Get the maximum value of the agents in the graph.
         get_min_value(self) -> float:
             Get the minimum value of the agents in the graph.
-        create_group(self, start_value: str) -> List[list]:
+        create_group(self, start_slot: int) -> List[list]:
             Create group of bidirectional neighbors using the BFS.
+        label_groups(self, slots: np.ndarray = None) -> Tuple[np.ndarray, np.ndarray]:
+            Get the group of each slot and the slots of each group in BFS order.
+        split_groups(self, slots: np.ndarray, labels: np.ndarray, order: np.ndarray) -> List[List["Agent"]]:
+            Split the slots sorted by group into lists of agents.
         create_groups(self) -> List[List["Agent"]]:
             Create groups of bidirectional neighbors using the BFS.
+        update_groups(self, changed_slots: np.ndarray) -> List[List["Agent"]]:
+            Update the groups after the edges of some slots changed.
     """
 
     def __init__(self) -> None:
-        self.agents = {}
+        self.table = AgentTable()
+        self.agents = []
+        self.grid = None
+        self.task_table = TaskTable()
+        self.sparse_adjacency = scipy.sparse.csr_matrix((0, 0), dtype=np.bool_)
+        self.staged_edges = {}
+        self.labels = np.zeros(0, dtype=np.int64)
+        self.groups = []
+
+    @property
+    def adjacency(self) -> scipy.sparse.csr_matrix:
+        """
+        Get the adjacency matrix with the staged edges applied.
+
+            Parameters
+                None
+    
+            Returns
+                return Adjacency matrix (slot x slot) of the directed edges
+        """
+
+        if len(self.staged_edges) > 0:
+            self.apply_staged_edges()
+        return self.sparse_adjacency
+
+    @adjacency.setter
+    def adjacency(self, adjacency: scipy.sparse.csr_matrix) -> None:
+        """
+        Replace the adjacency matrix, the staged edges are discarded.
+
+            Parameters
+                adjacency (scipy.sparse.csr_matrix): Adjacency matrix (slot x slot) of the directed edges
+    
+            Returns
+                return None
+        """
+
+        self.staged_edges = {}
+        self.sparse_adjacency = adjacency
 
     def __str__(self) -> str:
         """
@@ -72,69 +155,236 @@ class Graph:
 
         return str(self.agents)
 
-    def add_agent(self, tag: str, value: float, radius: float) -> None:
+    def add_agent(self, tag: int, value: int, radius: float) -> int:
         """
         Add a new agent to the graph.
 
             Parameters
-                tag (str): Tag/id of the agent
-                value (float): Value of the agent
+                tag (int): Tag/id of the agent
+                value (int): Value of the agent
                 radius (float): Radius of the agent
     
             Returns
-                return None
+                return Slot of the agent
         """
 
-        if tag not in self.agents:
-            self.agents[tag] = Agent(tag, value,radius)
+        agent = Agent(tag, value, radius, self.table)
+        agent.graph = self
+        self.agents.append(agent)
+        self.adjacency.resize((len(self.agents), len(self.agents)))
+        return agent.slot
 
-    def add_edge(self, tag1: str, tag2: str) -> None:
+    def add_edge(self, slot1: int, slot2: int) -> None:
         """
         Add a new edge to the graph.
 
             Parameters
-                tag1 (str): Tag/id of the first agent
-                tag1 (str): Tag/id of the second agent
+                slot1 (int): Slot of the first agent
+                slot2 (int): Slot of the second agent
     
             Returns
                 return None
         """
 
-        if tag1 in self.agents and tag2 in self.agents:
-            self.agents[tag1].add_neighbor(self.agents[tag2])
+        if 0 <= slot1 < len(self.agents) and 0 <= slot2 < len(self.agents):
+            self.agents[slot1].add_neighbor(self.agents[slot2])
 
-    def remove_agent(self, tag: str) -> None:
+    def remove_agent(self, slot: int) -> None:
         """
         Remove a agent from the graph.
 
             Parameters
-                tag (str): Tag/id of the agent
+                slot (int): Slot of the agent
     
             Returns
                 return None
         """
 
-        if tag in self.agents:
-            agent_to_remove = self.agents[tag]
-            for neighbor in agent_to_remove.neighbors:
-                neighbor.remove_neighbor(agent_to_remove)
-            del self.agents[tag]
-
-    def remove_edge(self, tag1: str, tag2: str) -> None:
+        if 0 <= slot < len(self.agents):
+            agent_to_remove = self.agents.pop(slot)
+            if self.grid is not None and agent_to_remove.row is not None:
+                self.grid.values[agent_to_remove.row, agent_to_remove.col] = scripts.constants.EMPTY_CELL
+            # Remove the row and column of the agent and move the next agents to the previous slot
+            keep = np.arange(len(self.agents)+1) != slot
+            self.adjacency = self.adjacency[keep][:, keep]
+            agent_to_remove.table = self.table.pop_agent(slot)
+            for next_slot in range(slot, len(self.agents)):
+                self.agents[next_slot].slot = next_slot
+            if self.grid is not None:
+                self.grid.values[self.grid.values > slot] -= 1
+            agent_to_remove.graph, agent_to_remove.slot = None, 0
+
+    def remove_edge(self, slot1: int, slot2: int) -> None:
         """
         Remove an edge from the graph.
 
             Parameters
-                tag1 (str): Tag/id of the first agent
-                tag1 (str): Tag/id of the second agent
+                slot1 (int): Slot of the first agent
+                slot2 (int): Slot of the second agent
     
             Returns
                 return None
         """
 
-        if tag1 in self.agents and tag2 in self.agents:
-            self.agents[tag1].remove_neighbor(self.agents[tag2])
-            self.agents[tag2].remove_neighbor(self.agents[tag1])
+        if 0 <= slot1 < len(self.agents) and 0 <= slot2 < len(self.agents):
+            self.agents[slot1].remove_neighbor(self.agents[slot2])
+            self.agents[slot2].remove_neighbor(self.agents[slot1])
+
+    def set_edges(self, sources: np.ndarray, targets: np.ndarray) -> None:
+        """
+        Replace the edges of the graph.
+
+            Parameters
+                sources (np.ndarray): Slots of the first agents of the edges
+                targets (np.ndarray): Slots of the second agents of the edges
+
+            Returns
+                return None
+        """
+
+        self.adjacency = scipy.sparse.csr_matrix(
+            (np.ones(len(sources), dtype=np.bool_), (sources, targets)),
+            shape=(len(self.agents), len(self.agents))
+        )
+        self.adjacency.sum_duplicates()
+
+    def clear_edges(self) -> None:
+        """
+        Remove all the edges of the graph.
+
+            Parameters
+                None
+
+            Returns
+                return None
+        """
+
+        self.adjacency = scipy.sparse.csr_matrix((len(self.agents), len(self.agents)), dtype=np.bool_)
+
+    def apply_staged_edges(self) -> None:
+        """
+        Apply the staged edges to the adjacency matrix at once.
+        The matrix is rebuilt once for all the staged edges, so a loop of single edge changes costs one rebuild.
+
+            Parameters
+                None
+
+            Returns
+                return None
+        """
+
+        slots = np.array(list(self.staged_edges.keys()), dtype=np.int64).reshape(-1, 2)
+        added = np.array(list(self.staged_edges.values()), dtype=np.bool_)
+        edges = self.sparse_adjacency.tocoo()
+        # The staged edges replace the edges of the matrix between the same slots
+        num_slots = len(self.agents)
+        keep = ~np.isin(edges.row.astype(np.int64)*num_slots + edges.col, slots[:, 0]*num_slots + slots[:, 1])
+        self.set_edges(np.concatenate((edges.row[keep], slots[added, 0])), np.concatenate((edges.col[keep], slots[added, 1])))
+
+    def connect(self, slot1: int, slot2: int) -> None:
+        """
+        Stage the directed edge between two slots.
+        The single edge changes are kept for the agents API, the simulation replaces the edges with set_edges.
+
+            Parameters
+                slot1 (int): Slot of the first agent
+                slot2 (int): Slot of the second agent
+
+            Returns
+                return None
+        """
+
+        self.staged_edges[(slot1, slot2)] = True
+
+    def disconnect(self, slot1: int, slot2: int) -> None:
+        """
+        Stage the removal of the directed edge between two slots.
+        The single edge changes are kept for the agents API, the simulation replaces the edges with set_edges.
+
+            Parameters
+                slot1 (int): Slot of the first agent
+                slot2 (int): Slot of the second agent
+
+            Returns
+                return None
+        """
+
+        self.staged_edges[(slot1, slot2)] = False
+
+    def has_edge(self, slot1: int, slot2: int) -> bool:
+        """
+        Check if the directed edge between two slots exists.
+
+            Parameters
+                slot1 (int): Slot of the first agent
+                slot2 (int): Slot of the second agent
+
+            Returns
+                return True if the edge exists otherwise False
+        """
+
+        if (slot1, slot2) in self.staged_edges:
+            return self.staged_edges[(slot1, slot2)]
+        # The indices of each row are sorted
+        row = self.sparse_adjacency.indices[self.sparse_adjacency.indptr[slot1]:self.sparse_adjacency.indptr[slot1+1]]
+        position = np.searchsorted(row, slot2)
+        return bool(position < len(row) and row[position] == slot2)
+
+    def get_neighbors(self, slot: int) -> List["Agent"]:
+        """
+        Get the neighbors of the agent in the slot.
+
+            Parameters
+                slot (int): Slot of the agent
+
+            Returns
+                return List of neighbor agents sorted by slot
+        """
+
+        return [self.agents[neighbor] for neighbor in self.adjacency.indices[self.adjacency.indptr[slot]:self.adjacency.indptr[slot+1]].tolist()]
+
+    def get_radii(self) -> np.ndarray:
+        """
+        Get the radius of each slot.
+
+            Parameters
+                None
+
+            Returns
+                return Radius of the agents
+        """
+
+        return self.table.radii[:len(self.agents)].copy()
+
+    def get_positions(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the row and column of each slot.
+
+            Parameters
+                None
+
+            Returns
+                return Tuple with the rows and columns of the agents
+        """
+
+        return self.table.rows[:len(self.agents)].copy(), self.table.cols[:len(self.agents)].copy()
+
+    def set_positions(self, rows: np.ndarray, cols: np.ndarray) -> None:
+        """
+        Update the row and column of each slot.
+
+            Parameters
+                rows (np.ndarray): New row of each slot
+                cols (np.ndarray): New column of each slot
+
+            Returns
+                return None
+        """
+
+        if self.grid is not None:
+            old_rows, old_cols = self.get_positions()
+            self.grid.move_values(np.arange(len(self.agents)), old_rows, old_cols, rows, cols)
+        self.table.rows[:len(self.agents)], self.table.cols[:len(self.agents)] = rows, cols
 
     def display(self) -> None:
         """
@@ -147,26 +397,26 @@ class Graph:
                 return None
         """
 
-        for agent in self.agents.values():
+        for agent in self.agents:
             neighbors = [neighbor.tag for neighbor in agent.neighbors]
             print(f"{agent.tag}: {neighbors}")
 
-    def bfs(self, start_value: str) -> None:
+    def bfs(self, start_slot: int) -> None:
         """
         BFS (Breadth first search).
 
             Parameters
-                start_value (str): Initial agent
+                start_slot (int): Slot of the initial agent
 
             Returns
                 return None
         """
 
-        if start_value not in self.agents:
+        if not 0 <= start_slot < len(self.agents):
             return
 
         visited = set()
-        queue = [self.agents[start_value]]
+        queue = [self.agents[start_slot]]
 
         while queue:
             agent = queue.pop(0)
@@ -176,22 +426,22 @@ class Graph:
                 queue.extend(set(agent.neighbors) - visited)
         print()
 
-    def dfs(self, start_value: str) -> None:
+    def dfs(self, start_slot: int) -> None:
         """
         DFS (Depth first search).
 
             Parameters
-                start_value (str): Initial agent
+                start_slot (int): Slot of the initial agent
 
             Returns
                 return None
         """
 
-        if start_value not in self.agents:
+        if not 0 <= start_slot < len(self.agents):
             return
 
         visited = set()
-        stack = [self.agents[start_value]]
+        stack = [self.agents[start_slot]]
 
         while stack:
             agent = stack.pop()
@@ -212,10 +462,9 @@ class Graph:
                 return Maximum size
         """
 
-        max_value = float("-inf")
-        for agent_tag in self.agents:
-            max_value = max(max_value, self.agents[agent_tag].value)
-        return max_value
+        if len(self.agents) == 0:
+            return float("-inf")
+        return self.table.values[:len(self.agents)].max().item()
 
     def get_min_value(self) -> float:
         """
@@ -228,28 +477,28 @@ class Graph:
                 return Maximum size
         """
 
-        min_value = float("inf")
-        for agent_tag in self.agents:
-            min_value = min(min_value, self.agents[agent_tag].value)
-        return min_value
+        if len(self.agents) == 0:
+            return float("inf")
+        return self.table.values[:len(self.agents)].min().item()
 
-    def create_group(self, start_value: str) -> Tuple[List["Agent"], List["Agent"]]:
+    def create_group(self, start_slot: int) -> Tuple[List["Agent"], List["Agent"]]:
         """
         Create group of bidirectional neighbors using the BFS.
 
             Parameters
-                start_value (str): Initial agent
+                start_slot (int): Slot of the initial agent
 
             Returns
                 return List of agents of the same group and the visited agents
-                return None if the agent is not in the dict of agents
+                return None if the slot is not in the list of agents
         """
 
-        if start_value not in self.agents:
+        if not 0 <= start_slot < len(self.agents):
             return
 
         visited = set()
-        group = [self.agents[start_value]]
+        group = [self.agents[start_slot]]
+        queued = {self.agents[start_slot]}
         index = 0
 
         while index < len(group):
@@ -259,11 +508,63 @@ class Graph:
                 # Save the neighbors
                 for neighbor in agent.neighbors:
                     # Check the neighbors who have not been visited and have a two-way connection
-                    if (neighbor not in visited) and (neighbor not in group) and (agent.is_bidirectional(neighbor) == True):
+                    if (neighbor not in visited) and (neighbor not in queued) and (agent.is_bidirectional(neighbor) == True):
                         group.append(neighbor)
+                        queued.add(neighbor)
                 visited.add(agent)
         return group, visited
 
+    def label_groups(self, slots: np.ndarray = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the group of each slot and the slots of each group in BFS order.
+        The groups are numbered by their first slot and each BFS starts from it.
+
+            Parameters
+                slots (np.ndarray): Sorted slots to group, all the slots if None
+
+            Returns
+                return Tuple with the group of each slot and the slots sorted by group
+                (both as positions in the given slots)
+        """
+
+        adjacency = self.adjacency if slots is None else self.adjacency[slots][:, slots]
+        num_slots = adjacency.shape[0]
+        # Keep the two-way connections
+        mutual = adjacency.multiply(adjacency.T).tocsr()
+        mutual.eliminate_zeros()
+        mutual.sort_indices()
+        _, labels = scipy.sparse.csgraph.connected_components(mutual, directed=False)
+        _, first_slots = np.unique(labels, return_index=True)
+        first_slots = np.sort(first_slots)
+        ranks = np.empty(len(first_slots), dtype=np.int64)
+        ranks[labels[first_slots]] = np.arange(len(first_slots))
+        labels = ranks[labels]
+        # A single BFS from an extra slot connected to the first slot of each group keeps the order inside each group
+        indices = np.concatenate((mutual.indices, first_slots))
+        indptr = np.append(mutual.indptr, mutual.indptr[-1]+len(first_slots))
+        extended = scipy.sparse.csr_matrix((np.ones(len(indices), dtype=np.bool_), indices, indptr), shape=(num_slots+1, num_slots+1))
+        order = scipy.sparse.csgraph.breadth_first_order(extended, num_slots, directed=True, return_predecessors=False)[1:]
+        return labels, order[np.argsort(labels[order], kind="stable")]
+
+    def split_groups(self, slots: np.ndarray, labels: np.ndarray, order: np.ndarray) -> List[List["Agent"]]:
+        """
+        Split the slots sorted by group into lists of agents.
+
+            Parameters
+                slots (np.ndarray): Slots of the positions
+                labels (np.ndarray): Group of each position
+                order (np.ndarray): Positions sorted by group
+
+            Returns
+                return List of groups
+        """
+
+        order, groups, begin = slots[order].tolist(), [], 0
+        for end in np.cumsum(np.bincount(labels)).tolist():
+            groups.append([self.agents[slot] for slot in order[begin:end]])
+            begin = end
+        return groups
+
     def create_groups(self) -> List[List["Agent"]]:
         """
         Create groups of bidirectional neighbors using the BFS.
@@ -275,10 +576,43 @@ class Graph:
                 return List of groups
         """
 
-        groups, visited = [], set()
-        for agent in self.agents:
-            if self.agents[agent] not in visited:
-                group, aux_visited = self.create_group(agent)
-                groups.append(group)
-                visited = visited.union(aux_visited)
-        return groups
+        self.labels, order = self.label_groups()
+        self.groups = self.split_groups(np.arange(len(self.agents)), self.labels, order)
+        return self.groups
+
+    def update_groups(self, changed_slots: np.ndarray) -> List[List["Agent"]]:
+        """
+        Update the groups after the edges of some slots changed.
+        Only the groups of the changed slots are created again, the other groups keep their agents.
+
+            Parameters
+                changed_slots (np.ndarray): Slots whose edges changed since the last groups
+
+            Returns
+                return List of groups
+        """
+
+        if len(self.labels) != len(self.agents):
+            return self.create_groups()
+        if len(changed_slots) == 0:
+            return self.groups
+        affected_groups = np.zeros(len(self.groups), dtype=np.bool_)
+        affected_groups[self.labels[changed_slots]] = True
+        affected_slots = np.flatnonzero(affected_groups[self.labels])
+        sub_labels, sub_order = self.label_groups(affected_slots)
+        kept_groups = np.flatnonzero(~affected_groups)
+        groups = [self.groups[label] for label in kept_groups.tolist()] + self.split_groups(affected_slots, sub_labels, sub_order)
+        # Sort the groups by their first slot
+        first_slots = np.full(len(self.groups), len(self.agents))
+        np.minimum.at(first_slots, self.labels, np.arange(len(self.agents)))
+        sub_first_slots = np.full(sub_labels.max()+1, len(self.agents))
+        np.minimum.at(sub_first_slots, sub_labels, affected_slots)
+        order = np.argsort(np.concatenate((first_slots[kept_groups], sub_first_slots)))
+        ranks = np.empty(len(order), dtype=np.int64)
+        ranks[order] = np.arange(len(order))
+        old_ranks = np.full(len(self.groups), -1)
+        old_ranks[kept_groups] = ranks[:len(kept_groups)]
+        self.labels = old_ranks[self.labels]
+        self.labels[affected_slots] = ranks[len(kept_groups)+sub_labels]
+        self.groups = [groups[idx] for idx in order.tolist()]
+        return self.groups
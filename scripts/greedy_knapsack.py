@@ -0,0 +1,46 @@
+from typing import List, Tuple
+from scripts.knapsack_solver import KnapsackSolver
+
+
+class GreedyKnapsack(KnapsackSolver):
+    """
+    A class to represent a 0/1 knapsack solved by taking the items by value density.
+    The result is the best of the greedy items and the best single item, so its score is at least half of the best score.
+
+        Attributes
+        ----------
+
+        Same attributes as KnapsackSolver
+
+        Methods
+        -------
+
+        solve_capacity(self, capacity: int) -> Tuple[int, List[int], float]:
+            Solve the knapsack for a capacity.
+    """
+
+    def solve_capacity(self, capacity: int) -> Tuple[int, List[int], float]:
+        """
+        Solve the knapsack for a capacity.
+
+            Parameters
+                capacity (int): Capacity of the knapsack
+
+            Returns
+                return Tuple with the score, the selected items and the bound of the relative gap
+        """
+
+        items = self.get_items(capacity)
+        self.cells += len(items)
+        selected_items, score, free = [], 0, capacity
+        for item, size, value in zip(items.tolist(), self.sizes[items].tolist(), self.values[items].tolist()):
+            if size <= free:
+                selected_items.append(item)
+                score, free = score + value, free - size
+        # Every item fits alone, so the best single item can be better than the greedy items
+        if len(items) > 0:
+            best_item = items[self.values[items].argmax()].item()
+            if self.values[best_item].item() > score:
+                selected_items, score = [best_item], self.values[best_item].item()
+        selected_items.sort(reverse=True)
+        return score, selected_items, KnapsackSolver.get_relative_gap(score, self.get_upper_bound(items, capacity))
@@ -1,4 +1,5 @@
-import numpy as np
+from typing import List, Tuple
+import scripts.constants, numpy as np
 
 
 class Grid:
@@ -12,6 +13,8 @@ class Grid:
             Rows of the grid
         cols : int
             Columns of the grid
+        values : np.ndarray
+            Slot of the agent in each cell, EMPTY_CELL if the cell is free
 
         Methods
         -------
@@ -22,6 +25,14 @@ class Grid:
             Represents the grid in a string format for data structures.
         create_grid(self) -> np.ndarray:
             Create an empty numpy array for save the agents.
+        is_free(self, row: int, col: int) -> bool:
+            Check if the cell is free.
+        move_value(self, value: int, old_row: int, old_col: int, new_row: int, new_col: int) -> None:
+            Move the value of a cell to another cell.
+        move_values(self, values: np.ndarray, old_rows: np.ndarray, old_cols: np.ndarray, new_rows: np.ndarray, new_cols: np.ndarray) -> None:
+            Move the values of some cells to other cells at once.
+        get_free_cells(self, row: int, col: int, step_size: int) -> List[Tuple[int, int]]:
+            Get the free cells in the limits around the cell.
     """
 
     def __init__(self, rows: int, cols: int) -> None:
@@ -65,5 +76,79 @@ class Grid:
                 return Numpy array for save agents
         """
 
-        return np.zeros(shape=(self.rows, self.cols), dtype=str)
+        return np.full(shape=(self.rows, self.cols), fill_value=scripts.constants.EMPTY_CELL, dtype=np.int64)
+
+    def is_free(self, row: int, col: int) -> bool:
+        """
+        Check if the cell is free.
+
+            Parameters
+                row (int): Row of the cell
+                col (int): Column of the cell
+    
+            Returns
+                return True if the cell is free otherwise False
+        """
+
+        return self.values[row, col] == scripts.constants.EMPTY_CELL
+
+    def move_value(self, value: int, old_row: int, old_col: int, new_row: int, new_col: int) -> None:
+        """
+        Move the value of a cell to another cell.
+
+            Parameters
+                value (int): Value to move
+                old_row (int): Old row of the value, None if it wasn't in the grid
+                old_col (int): Old column of the value, None if it wasn't in the grid
+                new_row (int): New row of the value
+                new_col (int): New column of the value
+    
+            Returns
+                return None
+        """
+
+        if old_row is not None and old_col is not None and self.values[old_row, old_col] == value:
+            self.values[old_row, old_col] = scripts.constants.EMPTY_CELL
+        self.values[new_row, new_col] = value
+
+    def move_values(self, values: np.ndarray, old_rows: np.ndarray, old_cols: np.ndarray, new_rows: np.ndarray, new_cols: np.ndarray) -> None:
+        """
+        Move the values of some cells to other cells at once.
+
+            Parameters
+                values (np.ndarray): Values to move
+                old_rows (np.ndarray): Old row of each value, EMPTY_CELL if it wasn't in the grid
+                old_cols (np.ndarray): Old column of each value, EMPTY_CELL if it wasn't in the grid
+                new_rows (np.ndarray): New row of each value
+                new_cols (np.ndarray): New column of each value
+    
+            Returns
+                return None
+        """
+
+        placed = (old_rows != scripts.constants.EMPTY_CELL) & (old_cols != scripts.constants.EMPTY_CELL)
+        # All the old cells are cleared before filling the new ones, so a value can take the old cell of another
+        self.values[old_rows[placed], old_cols[placed]] = scripts.constants.EMPTY_CELL
+        self.values[new_rows, new_cols] = values
+
+    def get_free_cells(self, row: int, col: int, step_size: int) -> List[Tuple[int, int]]:
+        """
+        Get the free cells in the limits around the cell.
+
+            Parameters
+                row (int): Row of the cell
+                col (int): Column of the cell
+                step_size (int): Size of each step
+    
+            Returns
+                return List with the rows and columns of the free cells
+        """
+
+        free_cells = []
+        for dx in scripts.constants.MOBILITY_ACTIONS:
+            for dy in scripts.constants.MOBILITY_ACTIONS:
+                new_row, new_col = row+dx*step_size, col+dy*step_size
+                if (0 <= new_row < self.rows) and (0 <= new_col < self.cols) and self.values[new_row, new_col] == scripts.constants.EMPTY_CELL:
+                    free_cells.append((new_row, new_col))
+        return free_cells
 
@@ -0,0 +1,272 @@
+from typing import List
+from scripts.solver_registry import SolverRegistry
+from scripts.collision_index import CollisionIndex
+import time, scripts.constants, numpy as np
+
+
+class GroupAllocator:
+    """
+    A class to represent the allocation of the joined tasks of a group of agents.
+    The agents are the positions in the group and the tasks are the positions in the joined tasks,
+    so the allocator doesn't share objects with the network and can run in another process.
+
+        Attributes
+        ----------
+
+        values : List[int]
+            Value of each agent of the group
+        sizes : np.ndarray
+            Size of each joined task
+        task_values : np.ndarray
+            Value of each joined task
+        collision_resolution : str
+            Resolve one contested task per round or a batch of independent contested tasks
+        key_based : bool
+            Order the tasks with the same collisions by their key in the collision index
+        solver : str
+            Name of the knapsack solver
+        epsilon : float
+            Maximum relative gap of the approximation scheme
+        selected_tasks : List[List[int]]
+            Selected tasks of each agent of the group
+        alive : np.ndarray
+            True for each joined task that wasn't assigned in a collision
+        iterations : int
+            Number of rounds of the allocation
+        collision_rounds : int
+            Number of rounds with collisions
+        knapsack_updates : int
+            Number of times the knapsack was solved
+        knapsack_cells : int
+            Number of cells of the knapsack evaluated
+        max_gap : float
+            Biggest bound of the relative gap to the best score of the agents results
+        allocation_time : float
+            Seconds of the allocation
+        collision_time : float
+            Seconds of the collision index and the collision resolution
+
+        Methods
+        -------
+
+        create_knapsack(self) -> "Knapsack":
+            Create and solve the knapsack of the group with the solver and the maximum value of the agents.
+        allocate_group(self, knapsack: "Knapsack") -> dict:
+            Get the best allocation score and the selected tasks of each agent in the group.
+        count_collisions(self, agents_results: dict) -> dict:
+            Get the agents in the selected tasks.
+        check_collisions(self, tasks_counter: dict) -> bool:
+            Check the collisions in the selected tasks.
+        select_task_agent(self, task_agents: List[int], size: int) -> int:
+            Get the agent that takes a contested task.
+        resolve_collisions(self, collision_index: "CollisionIndex", tasks_counter: dict) -> List[tuple]:
+            Get the contested tasks resolved in the round and the agent of each one.
+        assign_task(self, agent: int, task_idx: int) -> None:
+            Assign the task to the agent.
+        allocate(self) -> "GroupAllocator":
+            Allocate the joined tasks to the agents of the group.
+    """
+
+    def __init__(self, values: List[int], sizes: np.ndarray, task_values: np.ndarray, collision_resolution: str, key_based: bool, solver: str = scripts.constants.KNAPSACK_SOLVERS[0], epsilon: float = scripts.constants.KNAPSACK_EPSILON) -> None:
+        self.values = list(values)
+        self.sizes = sizes
+        self.task_values = task_values
+        self.collision_resolution = collision_resolution
+        self.key_based = key_based
+        self.solver = solver
+        self.epsilon = epsilon
+        self.selected_tasks = [[] for _ in self.values]
+        self.alive = np.ones(len(sizes), dtype=np.bool_)
+        self.iterations = 0
+        self.collision_rounds, self.knapsack_updates, self.knapsack_cells = 0, 0, 0
+        self.max_gap = 0.0
+        self.allocation_time, self.collision_time = 0.0, 0.0
+
+    def create_knapsack(self) -> "Knapsack":
+        """
+        Create and solve the knapsack of the group with the solver and the maximum value of the agents.
+
+            Parameters
+                None
+
+            Returns
+                return Knapsack of the group
+        """
+
+        knapsack = SolverRegistry.create(self.solver, self.sizes, self.task_values, max(self.values), epsilon=self.epsilon)
+        knapsack.solve()
+        return knapsack
+
+    def allocate_group(self, knapsack: "Knapsack") -> dict:
+        """
+        Get the best allocation score and the selected tasks of each agent in the group.
+        The knapsack is shared by the group and each agent reads its result with its own value.
+        The biggest gap of the results is saved, it is 0 for the exact solvers.
+
+            Parameters
+                knapsack ("Knapsack"): Knapsack of the group
+
+            Returns
+                return Dictionary with the agents results
+        """
+
+        agents_results = {}
+        for agent, value in enumerate(self.values):
+            agents_results[agent] = {
+                "score" : knapsack.get_score(value),
+                "selected_tasks" : knapsack.get_selected_items(value)
+            }
+            self.max_gap = max(self.max_gap, knapsack.get_gap(value))
+        return agents_results
+
+    def count_collisions(self, agents_results: dict) -> dict:
+        """
+        Get the agents in the selected tasks.
+
+            Parameters
+                agents_results (dict): Dictionary with the agents results
+
+            Returns
+                return Dictionary with the agents for each selected task
+        """
+
+        tasks_counter = {}
+        for agent in agents_results:
+            for task_idx in agents_results[agent]["selected_tasks"]:
+                # The task doesn"t exist in the counter
+                if tasks_counter.get(task_idx, None) == None:
+                    tasks_counter[task_idx] = [agent]
+                else:
+                    tasks_counter[task_idx].append(agent)
+        return tasks_counter
+
+    def check_collisions(self, tasks_counter: dict) -> bool:
+        """
+        Check the collisions in the selected tasks.
+
+            Parameters
+                tasks_counter (dict): Dictionary with the agents of each selected task
+
+            Returns
+                return True if exist a collision otherwise False
+        """
+
+        for task_idx in tasks_counter:
+            if len(tasks_counter[task_idx]) > 1:
+                return True
+        return False
+
+    def select_task_agent(self, task_agents: List[int], size: int) -> int:
+        """
+        Get the agent that takes a contested task.
+        The agent with the smallest value equal to the size is the perfect agent, otherwise the agent with the biggest value.
+
+            Parameters
+                task_agents (List[int]): Agents that selected the task
+                size (int): Size of the task
+
+            Returns
+                return Agent for the task
+        """
+
+        # Sort tasks_agents in function of the value (size)
+        sorted_task_agents = sorted(task_agents, key=lambda agent: self.values[agent])
+        # Check if exist the best agent for the task
+        for agent in sorted_task_agents:
+            # Perfect case
+            if self.values[agent] == size:
+                return agent
+        return sorted_task_agents.pop()
+
+    def resolve_collisions(self, collision_index: "CollisionIndex", tasks_counter: dict) -> List[tuple]:
+        """
+        Get the contested tasks resolved in the round and the agent of each one.
+        The task with more collisions is always resolved. In the batched mode the next contested tasks
+        are also resolved when their agents are not in another resolved task and their agent is unambiguous.
+
+            Parameters
+                collision_index ("CollisionIndex"): Collision index of the joined tasks
+                tasks_counter (dict): Dictionary with the agents of each selected task
+
+            Returns
+                return List with the index of each resolved task and its agent
+        """
+
+        collision_index.build(list(tasks_counter.items()))
+        # Select the task with more collisions
+        task_idx, task_agents = collision_index.pop_top()
+        resolutions = [(task_idx, self.select_task_agent(task_agents, self.sizes[task_idx].item()))]
+        if self.collision_resolution == "batched":
+            used_agents = set(task_agents)
+            top = collision_index.pop_top()
+            while top is not None and len(top[1]) > 1:
+                task_idx, task_agents = top
+                if used_agents.isdisjoint(task_agents):
+                    agent = self.select_task_agent(task_agents, self.sizes[task_idx].item())
+                    # Another agent with the same value could take the task
+                    if sum(1 for other in task_agents if self.values[other] == self.values[agent]) == 1:
+                        resolutions.append((task_idx, agent))
+                        used_agents.update(task_agents)
+                top = collision_index.pop_top()
+        return resolutions
+
+    def assign_task(self, agent: int, task_idx: int) -> None:
+        """
+        Assign the task to the agent.
+
+            Parameters
+                agent (int): Position of the agent in the group
+                task_idx (int): Position of the task in the joined tasks
+
+            Returns
+                return None
+        """
+
+        self.selected_tasks[agent].append(task_idx)
+        self.values[agent] -= self.sizes[task_idx].item()
+
+    def allocate(self) -> "GroupAllocator":
+        """
+        Allocate the joined tasks to the agents of the group.
+        The contested tasks are assigned round by round and removed from the knapsack,
+        until no task has more than one agent and every agent takes its selected tasks.
+        The collision index is built each round over the selected tasks in the order the agents selected them,
+        the order of the merge sort it replaced, so the tasks with the same collisions are ranked the same way.
+
+            Parameters
+                None
+
+            Returns
+                return The allocator with the results of the group
+        """
+
+        start_time = time.perf_counter()
+        knapsack = self.create_knapsack()
+        collision_index = CollisionIndex(self.sizes, self.task_values, self.key_based)
+        # The removed tasks keep their index in the joined tasks and the knapsack
+        num_alive = len(self.sizes)
+        while num_alive > 0:
+            self.iterations += 1
+            agents_results = self.allocate_group(knapsack)
+            collision_start_time = time.perf_counter()
+            tasks_counter = self.count_collisions(agents_results)
+            if self.check_collisions(tasks_counter) == True:
+                self.collision_rounds += 1
+                resolutions = self.resolve_collisions(collision_index, tasks_counter)
+                for task_idx, agent in resolutions:
+                    self.assign_task(agent, task_idx)
+                    self.alive[task_idx], num_alive = False, num_alive-1
+                self.collision_time += time.perf_counter() - collision_start_time
+                # Remove the tasksk and update the knapsack from the removed tasks
+                knapsack.set_capacity(max(self.values))
+                knapsack.remove_items([task_idx for task_idx, _ in resolutions])
+            else:
+                self.collision_time += time.perf_counter() - collision_start_time
+                for agent in agents_results:
+                    if agents_results[agent]["score"] > 0:
+                        for task_idx in agents_results[agent]["selected_tasks"]:
+                            self.assign_task(agent, task_idx)
+                break
+        self.knapsack_updates, self.knapsack_cells = knapsack.updates, knapsack.cells
+        self.allocation_time = time.perf_counter() - start_time
+        return self
@@ -0,0 +1,220 @@
+from typing import List
+import scripts.constants, numpy as np
+
+
+class Knapsack:
+    """
+    A class to represent a 0/1 knapsack solved with a vectorized dynamic programming.
+    A removal re-solves the rows from the checkpoint of the block of the first removed item to the last item,
+    so a round of the collision loop costs a partial solve, up to a full solve when an early item is removed.
+
+        Attributes
+        ----------
+
+        sizes : np.ndarray
+            Sizes of the items
+        values : np.ndarray
+            Values of the items
+        capacity : int
+            Maximum capacity of the knapsack
+        dp : np.ndarray
+            Best score for each capacity
+        choices : np.ndarray
+            Table (items x capacity) with the selected items
+        removed : np.ndarray
+            True for each removed item, the removed items keep their index but are never selected
+        checkpoints : np.ndarray
+            Best scores saved before each block of items, used to re-solve after a removal
+        updates : int
+            Number of times the rows were solved
+        cells : int
+            Number of cells of the dynamic programming evaluated
+
+        Methods
+        -------
+
+        solve(self) -> None:
+            Solve the knapsack for every capacity up to the maximum capacity.
+        update_rows(self, begin: int) -> None:
+            Update the best scores and the selected items with the items from begin to the end.
+        remove_item(self, index: int) -> None:
+            Remove an item and update the rows after it.
+        remove_items(self, indexes: List[int]) -> None:
+            Remove some items and update the rows after the first of them.
+        set_capacity(self, capacity: int) -> None:
+            Set a new maximum capacity of the knapsack.
+        get_score(self, capacity: int) -> float:
+            Get the best score for the given capacity.
+        get_selected_items(self, capacity: int) -> List[int]:
+            Get the selected items for the given capacity.
+        get_gap(self, capacity: int) -> float:
+            Get the bound of the relative gap to the best score for the given capacity.
+    """
+
+    def __init__(self, sizes: List[int], values: List[float], capacity: int, **options: dict) -> None:
+        self.sizes = np.asarray(sizes, dtype=np.int64)
+        self.values = np.asarray(values) if len(values) > 0 else np.zeros(0, dtype=np.int64)
+        self.capacity = capacity
+        self.removed = np.zeros(len(self.sizes), dtype=np.bool_)
+        self.dp = None
+        self.choices = None
+        self.checkpoints = None
+        self.updates = 0
+        self.cells = 0
+
+    def solve(self) -> None:
+        """
+        Solve the knapsack for every capacity up to the maximum capacity.
+
+            Parameters
+                None
+
+            Returns
+                return None
+        """
+
+        self.dp = np.zeros(self.capacity+1, dtype=np.result_type(self.values, np.int64))
+        self.choices = np.zeros((len(self.sizes), self.capacity+1), dtype=np.bool_)
+        num_checkpoints = -(-len(self.sizes) // scripts.constants.KNAPSACK_CHECKPOINT_INTERVAL)
+        self.checkpoints = np.zeros((num_checkpoints, self.capacity+1), dtype=self.dp.dtype)
+        self.update_rows(0)
+
+    def update_rows(self, begin: int) -> None:
+        """
+        Update the best scores and the selected items with the items from begin to the end.
+        The best scores must be the ones before the item begin, which is the first item of a block.
+
+            Parameters
+                begin (int): Index of the first item to update
+
+            Returns
+                return None
+        """
+
+        dp, choices, capacity = self.dp, self.choices, self.capacity
+        interval = scripts.constants.KNAPSACK_CHECKPOINT_INTERVAL
+        choices[begin:] = False
+        self.updates += 1
+        for block in range(begin, len(self.sizes), interval):
+            self.checkpoints[block // interval] = dp
+            # Only the items that fit in the knapsack can change the best scores
+            fitting = block + np.flatnonzero((self.sizes[block:block+interval] <= capacity) & ~self.removed[block:block+interval])
+            for i, size, value in zip(fitting.tolist(), self.sizes[fitting].tolist(), self.values[fitting].tolist()):
+                start = max(size, 1)
+                self.cells += capacity+1-start
+                # The candidates are computed from the previous row before updating the tail in place
+                candidates = dp[start-size:capacity+1-size] + value
+                tail = dp[start:]
+                np.less(tail, candidates, out=choices[i, start:])
+                np.maximum(tail, candidates, out=tail)
+
+    def remove_item(self, index: int) -> None:
+        """
+        Remove an item and update the rows after it.
+        The rows before the block of the item don't change, so the update starts from its checkpoint.
+        The indexes of the other items don't change.
+
+            Parameters
+                index (int): Index of the item to remove
+
+            Returns
+                return None
+        """
+
+        self.remove_items([index])
+
+    def remove_items(self, indexes: List[int]) -> None:
+        """
+        Remove some items and update the rows after the first of them.
+        All the items are removed before the update, so the rows are solved only once.
+        The update costs (items after the block of the first removed item) x capacity cells, it isn't
+        the offline deletion of a segment tree, so the removals of the early items re-solve almost every row.
+
+            Parameters
+                indexes (List[int]): Indexes of the items to remove
+
+            Returns
+                return None
+        """
+
+        if len(indexes) == 0:
+            return
+        self.removed[indexes] = True
+        block = min(indexes) // scripts.constants.KNAPSACK_CHECKPOINT_INTERVAL
+        self.dp[:] = self.checkpoints[block]
+        self.update_rows(block * scripts.constants.KNAPSACK_CHECKPOINT_INTERVAL)
+
+    def set_capacity(self, capacity: int) -> None:
+        """
+        Set a new maximum capacity of the knapsack.
+        The scores of the smaller capacities don't depend on the bigger ones, so a smaller
+        capacity only drops columns, while a bigger capacity solves the knapsack again.
+
+            Parameters
+                capacity (int): New maximum capacity
+
+            Returns
+                return None
+        """
+
+        if capacity <= self.capacity:
+            self.dp = self.dp[:capacity+1]
+            self.choices = self.choices[:, :capacity+1]
+            self.checkpoints = self.checkpoints[:, :capacity+1]
+            self.capacity = capacity
+        else:
+            self.capacity = capacity
+            self.solve()
+
+    def get_score(self, capacity: int) -> float:
+        """
+        Get the best score for the given capacity.
+
+            Parameters
+                capacity (int): Capacity of the knapsack
+
+            Returns
+                return Best score
+        """
+
+        return self.dp[capacity].item()
+
+    def get_selected_items(self, capacity: int) -> List[int]:
+        """
+        Get the selected items for the given capacity.
+        The rows are walked down once by blocks, so each row of the column of the current capacity is read once.
+
+            Parameters
+                capacity (int): Capacity of the knapsack
+
+            Returns
+                return A list with the indexes of the selected items
+        """
+
+        selected_items, w, end = [], capacity, len(self.sizes)
+        block = scripts.constants.KNAPSACK_BACKTRACK_BLOCK
+        while end > 0:
+            # Find the last item of the block selected for the current capacity
+            begin = max(end-block, 0)
+            selected = np.flatnonzero(self.choices[begin:end, w])
+            if len(selected) == 0:
+                end = begin
+                continue
+            end = begin + selected[-1].item()
+            selected_items.append(end)
+            w -= int(self.sizes[end])
+        return selected_items
+
+    def get_gap(self, capacity: int) -> float:
+        """
+        Get the bound of the relative gap to the best score for the given capacity.
+        The dynamic programming is exact, so the gap is always 0.
+
+            Parameters
+                capacity (int): Capacity of the knapsack
+
+            Returns
+                return Bound of (best score - score) / best score
+        """
+
+        return 0.0
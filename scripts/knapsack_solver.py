@@ -0,0 +1,255 @@
+from typing import List, Tuple
+import abc, numpy as np
+
+
+class KnapsackSolver(abc.ABC):
+    """
+    A class to represent a 0/1 knapsack solved for each capacity when its result is needed.
+    It has the same methods as the dynamic programming knapsack, so the solvers can replace it.
+    The solvers implement the abstract solve_capacity and the results are saved until an item is removed.
+    The solvers take the options of the registry as keyword arguments and ignore the ones they don't use.
+
+        Attributes
+        ----------
+
+        sizes : np.ndarray
+            Sizes of the items
+        values : np.ndarray
+            Values of the items
+        capacity : int
+            Maximum capacity of the knapsack
+        removed : np.ndarray
+            True for each removed item, the removed items keep their index but are never selected
+        results : dict
+            Score, selected items and gap of each solved capacity
+        updates : int
+            Number of solved capacities
+        cells : int
+            Number of cells or nodes evaluated by the solver
+
+        Methods
+        -------
+
+        solve(self) -> None:
+            Forget the results of the capacities.
+        get_items(self, capacity: int) -> np.ndarray:
+            Get the items that fit in the capacity sorted by value density.
+        get_upper_bound(self, items: np.ndarray, capacity: int) -> float:
+            Get the bound of the linear relaxation of the items.
+        get_relative_gap(score: int, bound: float) -> float:
+            Get the relative gap between a score and an upper bound of the best score.
+        solve_capacity(self, capacity: int) -> Tuple[int, List[int], float]:
+            Solve the knapsack for a capacity.
+        get_result(self, capacity: int) -> Tuple[int, List[int], float]:
+            Get the result of a capacity and solve it if it wasn't solved.
+        remove_item(self, index: int) -> None:
+            Remove an item.
+        remove_items(self, indexes: List[int]) -> None:
+            Remove some items.
+        set_capacity(self, capacity: int) -> None:
+            Set a new maximum capacity of the knapsack.
+        get_score(self, capacity: int) -> float:
+            Get the score for the given capacity.
+        get_selected_items(self, capacity: int) -> List[int]:
+            Get the selected items for the given capacity.
+        get_gap(self, capacity: int) -> float:
+            Get the bound of the relative gap to the best score for the given capacity.
+    """
+
+    def __init__(self, sizes: List[int], values: List[float], capacity: int, **options: dict) -> None:
+        self.sizes = np.asarray(sizes, dtype=np.int64)
+        self.values = np.asarray(values) if len(values) > 0 else np.zeros(0, dtype=np.int64)
+        self.capacity = capacity
+        self.removed = np.zeros(len(self.sizes), dtype=np.bool_)
+        self.results = {}
+        self.updates = 0
+        self.cells = 0
+
+    def solve(self) -> None:
+        """
+        Forget the results of the capacities.
+        Each capacity is solved the first time its result is needed.
+
+            Parameters
+                None
+
+            Returns
+                return None
+        """
+
+        self.results = {}
+
+    def get_items(self, capacity: int) -> np.ndarray:
+        """
+        Get the items that fit in the capacity sorted by value density.
+        The items without size go first, the items with the same density are sorted by size and then keep their order.
+        The equal items are next to each other and only the ones that fit together in the capacity are kept.
+
+            Parameters
+                capacity (int): Capacity of the knapsack
+
+            Returns
+                return Indexes of the items
+        """
+
+        items = np.flatnonzero((self.sizes <= capacity) & ~self.removed)
+        sizes = self.sizes[items]
+        densities = np.full(len(items), np.inf)
+        np.divide(self.values[items], sizes, out=densities, where=sizes > 0)
+        order = np.lexsort((items, sizes, -densities))
+        items, sizes, densities = items[order], sizes[order], densities[order]
+        # Position of each item in its run of equal items
+        starts = np.ones(len(items), dtype=np.bool_)
+        starts[1:] = (sizes[1:] != sizes[:-1]) | (densities[1:] != densities[:-1])
+        positions = np.arange(len(items))
+        ranks = positions - np.maximum.accumulate(np.where(starts, positions, 0))
+        return items[(sizes == 0) | (ranks < capacity // np.maximum(sizes, 1))]
+
+    def get_upper_bound(self, items: np.ndarray, capacity: int) -> float:
+        """
+        Get the bound of the linear relaxation of the items.
+        The items are taken by value density and the first item that doesn't fit is taken in part.
+
+            Parameters
+                items (np.ndarray): Indexes of the items sorted by value density
+                capacity (int): Capacity of the knapsack
+
+            Returns
+                return Upper bound of the best score
+        """
+
+        cumulative_sizes = np.cumsum(self.sizes[items])
+        num_items = np.searchsorted(cumulative_sizes, capacity, side="right")
+        bound = float(self.values[items[:num_items]].sum())
+        if num_items < len(items):
+            used = cumulative_sizes[num_items-1].item() if num_items > 0 else 0
+            bound += (capacity - used) * self.values[items[num_items]].item() / self.sizes[items[num_items]].item()
+        return bound
+
+    @staticmethod
+    def get_relative_gap(score: int, bound: float) -> float:
+        """
+        Get the relative gap between a score and an upper bound of the best score.
+        The best score is between both, so the gap is a bound of the gap to the best score.
+
+            Parameters
+                score (int): Score of the selected items
+                bound (float): Upper bound of the best score
+
+            Returns
+                return (bound - score) / bound, 0 if the bound is 0
+        """
+
+        return max(bound - score, 0.0) / bound if bound > 0 else 0.0
+
+    @abc.abstractmethod
+    def solve_capacity(self, capacity: int) -> Tuple[int, List[int], float]:
+        """
+        Solve the knapsack for a capacity.
+
+            Parameters
+                capacity (int): Capacity of the knapsack
+
+            Returns
+                return Tuple with the score, the selected items and the bound of the relative gap
+        """
+
+    def get_result(self, capacity: int) -> Tuple[int, List[int], float]:
+        """
+        Get the result of a capacity and solve it if it wasn't solved.
+
+            Parameters
+                capacity (int): Capacity of the knapsack
+
+            Returns
+                return Tuple with the score, the selected items and the bound of the relative gap
+        """
+
+        if capacity not in self.results:
+            self.updates += 1
+            self.results[capacity] = self.solve_capacity(capacity)
+        return self.results[capacity]
+
+    def remove_item(self, index: int) -> None:
+        """
+        Remove an item.
+        The indexes of the other items don't change.
+
+            Parameters
+                index (int): Index of the item to remove
+
+            Returns
+                return None
+        """
+
+        self.remove_items([index])
+
+    def remove_items(self, indexes: List[int]) -> None:
+        """
+        Remove some items.
+        The results of every capacity are solved again when they are needed.
+
+            Parameters
+                indexes (List[int]): Indexes of the items to remove
+
+            Returns
+                return None
+        """
+
+        if len(indexes) == 0:
+            return
+        self.removed[indexes] = True
+        self.results = {}
+
+    def set_capacity(self, capacity: int) -> None:
+        """
+        Set a new maximum capacity of the knapsack.
+        The result of a capacity doesn't depend on the maximum capacity, so the results are kept.
+
+            Parameters
+                capacity (int): New maximum capacity
+
+            Returns
+                return None
+        """
+
+        self.capacity = capacity
+
+    def get_score(self, capacity: int) -> float:
+        """
+        Get the score for the given capacity.
+
+            Parameters
+                capacity (int): Capacity of the knapsack
+
+            Returns
+                return Score of the selected items
+        """
+
+        return self.get_result(capacity)[0]
+
+    def get_selected_items(self, capacity: int) -> List[int]:
+        """
+        Get the selected items for the given capacity.
+
+            Parameters
+                capacity (int): Capacity of the knapsack
+
+            Returns
+                return A list with the indexes of the selected items
+        """
+
+        return list(self.get_result(capacity)[1])
+
+    def get_gap(self, capacity: int) -> float:
+        """
+        Get the bound of the relative gap to the best score for the given capacity.
+
+            Parameters
+                capacity (int): Capacity of the knapsack
+
+            Returns
+                return Bound of (best score - score) / best score
+        """
+
+        return self.get_result(capacity)[2]
@@ -0,0 +1,137 @@
+import json, time
+
+
+class Metrics:
+    """
+    A class to represent the timers and counters of the phases of a simulation.
+    When it is disabled every method returns before measuring, so the instrumentation costs a function call.
+
+        Attributes
+        ----------
+
+        enabled : bool
+            Measure the timers and counters
+        timers : dict
+            Seconds of each measure of each phase
+        counters : dict
+            Total of each counter
+
+        Methods
+        -------
+
+        start(self) -> float:
+            Get the start time of a measure.
+        stop(self, name: str, start_time: float) -> None:
+            Save the seconds since the start time of a measure.
+        add_time(self, name: str, seconds: float) -> None:
+            Save the seconds of a measure of a phase.
+        count(self, name: str, amount: int) -> None:
+            Increase a counter.
+        get_report(self) -> dict:
+            Get the summary of the timers and the counters.
+        save_report(self, path: str) -> None:
+            Save the report and the measures as a JSON file.
+    """
+
+    def __init__(self, enabled: bool = False) -> None:
+        self.enabled = enabled
+        self.timers = {}
+        self.counters = {}
+
+    def start(self) -> float:
+        """
+        Get the start time of a measure.
+
+            Parameters
+                None
+
+            Returns
+                return Current time in seconds, 0 if the metrics are disabled
+        """
+
+        if self.enabled == False:
+            return 0.0
+        return time.perf_counter()
+
+    def stop(self, name: str, start_time: float) -> None:
+        """
+        Save the seconds since the start time of a measure.
+
+            Parameters
+                name (str): Name of the phase
+                start_time (float): Start time of the measure
+
+            Returns
+                return None
+        """
+
+        if self.enabled == False:
+            return
+        self.add_time(name, time.perf_counter() - start_time)
+
+    def add_time(self, name: str, seconds: float) -> None:
+        """
+        Save the seconds of a measure of a phase.
+
+            Parameters
+                name (str): Name of the phase
+                seconds (float): Seconds of the measure
+
+            Returns
+                return None
+        """
+
+        if self.enabled == False:
+            return
+        if name not in self.timers:
+            self.timers[name] = []
+        self.timers[name].append(seconds)
+
+    def count(self, name: str, amount: int = 1) -> None:
+        """
+        Increase a counter.
+
+            Parameters
+                name (str): Name of the counter
+                amount (int): Amount to add
+
+            Returns
+                return None
+        """
+
+        if self.enabled == False:
+            return
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def get_report(self) -> dict:
+        """
+        Get the summary of the timers and the counters.
+
+            Parameters
+                None
+
+            Returns
+                return Dictionary with the calls, total, mean and maximum seconds of each phase and the counters
+        """
+
+        return {
+            "timers" : {
+                name : {"calls" : len(measures), "total" : sum(measures), "mean" : sum(measures)/len(measures), "max" : max(measures)}
+                for name, measures in self.timers.items()
+            },
+            "counters" : dict(self.counters),
+        }
+
+    def save_report(self, path: str) -> None:
+        """
+        Save the report and the measures as a JSON file.
+
+            Parameters
+                path (str): Path of the report file
+
+            Returns
+                return None
+        """
+
+        with open(path, "w") as file:
+            json.dump({**self.get_report(), "measures" : self.timers}, file, indent=4)
@@ -0,0 +1,103 @@
+from typing import Tuple
+import scripts.constants, numpy as np
+
+
+class Mobility:
+    """
+    A class to represent the mobility of all the agents of the grid in a single step.
+
+        Attributes
+        ----------
+
+        grid : "Grid"
+            Grid with the slots of the agents
+        rng : np.random.Generator
+            Generator of the random moves
+        d_rows : np.ndarray
+            Row displacement of each move
+        d_cols : np.ndarray
+            Column displacement of each move
+        rounds : int
+            Number of rounds of the moves
+        retries : int
+            Number of times an agent lost its target cell and tried again
+
+        Methods
+        -------
+
+        get_free_moves(self, occupied: np.ndarray, rows: np.ndarray, cols: np.ndarray, step_size: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+            Get the target cells of the moves and which of them are free and in the limits.
+        brownian_motion(self, rows: np.ndarray, cols: np.ndarray, step_size: int) -> Tuple[np.ndarray, np.ndarray]:
+            Brownian motion for all the agents.
+    """
+
+    def __init__(self, grid: "Grid", rng: np.random.Generator) -> None:
+        self.grid = grid
+        self.rng = rng
+        actions = np.array(scripts.constants.MOBILITY_ACTIONS, dtype=np.int64)
+        self.d_rows, self.d_cols = np.repeat(actions, len(actions)), np.tile(actions, len(actions))
+        self.rounds, self.retries = 0, 0
+
+    def get_free_moves(self, occupied: np.ndarray, rows: np.ndarray, cols: np.ndarray, step_size: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Get the target cells of the moves and which of them are free and in the limits.
+
+            Parameters
+                occupied (np.ndarray): True for each occupied cell of the grid
+                rows (np.ndarray): Row position of each agent
+                cols (np.ndarray): Column position of each agent
+                step_size (int): Size of each step
+
+            Returns
+                return Tuple with the target rows, the target columns and the free moves (agents x moves)
+        """
+
+        target_rows = rows[:, None] + self.d_rows*step_size
+        target_cols = cols[:, None] + self.d_cols*step_size
+        free = (0 <= target_rows) & (target_rows < self.grid.rows) & (0 <= target_cols) & (target_cols < self.grid.cols)
+        # The current cell of the agent is occupied by itself, so staying is never a free move
+        free[free] = ~occupied[target_rows[free], target_cols[free]]
+        return target_rows, target_cols, free
+
+    def brownian_motion(self, rows: np.ndarray, cols: np.ndarray, step_size: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Brownian motion for all the agents.
+        Each round the pending agents pick one of their free moves, the agents with the same
+        target cell are ordered by a random permutation and only the first one moves.
+        An agent without free moves stays in its cell.
+
+            Parameters
+                rows (np.ndarray): Row position of each agent
+                cols (np.ndarray): Column position of each agent
+                step_size (int): Size of each step
+
+            Returns
+                return Tuple with the new rows and columns of the agents
+        """
+
+        occupied = self.grid.values != scripts.constants.EMPTY_CELL
+        new_rows, new_cols = rows.copy(), cols.copy()
+        pending = np.arange(len(rows))
+        while len(pending) > 0:
+            target_rows, target_cols, free = self.get_free_moves(occupied, new_rows[pending], new_cols[pending], step_size)
+            counts = free.sum(axis=1)
+            movable = counts > 0
+            pending, target_rows, target_cols, free, counts = pending[movable], target_rows[movable], target_cols[movable], free[movable], counts[movable]
+            if len(pending) == 0:
+                break
+            # Pick uniformly one of the free moves of each agent
+            picks = (self.rng.random(len(pending))*counts).astype(np.int64)
+            moves = np.argmax(np.cumsum(free, axis=1) > picks[:, None], axis=1)
+            chosen_rows, chosen_cols = target_rows[np.arange(len(pending)), moves], target_cols[np.arange(len(pending)), moves]
+            # The first agent of each target cell in a random priority wins the cell
+            keys = chosen_rows*self.grid.cols + chosen_cols
+            order = np.lexsort((self.rng.permutation(len(pending)), keys))
+            winners = order[np.concatenate(([True], keys[order][1:] != keys[order][:-1]))]
+            movers = pending[winners]
+            occupied[new_rows[movers], new_cols[movers]] = False
+            occupied[chosen_rows[winners], chosen_cols[winners]] = True
+            new_rows[movers], new_cols[movers] = chosen_rows[winners], chosen_cols[winners]
+            pending = np.delete(pending, winners)
+            self.rounds += 1
+            self.retries += len(pending)
+        return new_rows, new_cols
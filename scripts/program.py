@@ -1,4 +1,5 @@
-import os, shutil, scripts.constants
+from typing import List
+import os, shutil, itertools, scripts.constants
 
 
 class Program:
@@ -21,8 +22,14 @@ class Program:
             Check if the value is a boolean.
         string_to_bool(self, value: str) -> bool:
             Convert string into boolean.
+        parse_value(self, value: str) -> object:
+            Convert the value of a parameter into its data type.
         read_parameters(self, filename: str) -> dict:
             Get the content of the parameters file.
+        read_sweep(self, filename: str) -> dict:
+            Get the values of each parameter of the sweep file.
+        expand_sweep(self, sweep: dict) -> List[dict]:
+            Get the parameters of every combination of the values of the sweep.
     """
 
     def __init__(self) -> None:
@@ -99,6 +106,28 @@ class Program:
         else:
             raise ValueError(f"Cannot convert {value} to a boolean value")
 
+    def parse_value(self, value: str) -> object:
+        """
+        Convert the value of a parameter into its data type.
+
+            Parameters
+                value (str): Value of the parameter
+    
+            Returns
+                return The value as an int, float or string
+        """
+
+        # Check value type
+        value_is_number = self.check_number_type(value)
+        if value_is_number == int:
+            value = int(value)
+        elif value_is_number == float:
+            value = float(value)
+        elif value_is_number == None:
+            if self.is_boolean(value) == True:
+                value == self.string_to_bool(value)
+        return value
+
     def read_parameters(self, filename: str) -> dict:
         """
         Get the content of the parameters file.
@@ -114,14 +143,40 @@ class Program:
             parameters = {}
             for line in file:
                 key, value = line.replace(" ", "").strip().split(scripts.constants.SEPARATION_CHAR)
-                # Check value type
-                value_is_number = self.check_number_type(value)
-                if value_is_number == int:
-                    value = int(value)
-                elif value_is_number == float:
-                    value = float(value)
-                elif value_is_number == None:
-                    if self.is_boolean(value) == True:
-                        value == self.string_to_bool(value)
-                parameters[key] = value
+                parameters[key] = self.parse_value(value)
         return parameters
+
+    def read_sweep(self, filename: str) -> dict:
+        """
+        Get the values of each parameter of the sweep file.
+        Each line is a parameter with one value or a list of values separated by commas.
+        The run id is given by the sweep to each run, so it can't be a parameter of the file.
+
+            Parameters
+                filename (str): Name of the sweep file
+    
+            Returns
+                return Dictionary with the list of values of each parameter
+        """
+
+        with open(scripts.constants.parameters_folder_path + f"\\{filename}", "r") as file:
+            sweep = {}
+            for line in file:
+                key, values = line.replace(" ", "").strip().split(scripts.constants.SEPARATION_CHAR)
+                if key == "run_id":
+                    raise Exception(f"The sweep file ({filename}) can't set the run_id, it is given to each run by the sweep.")
+                sweep[key] = [self.parse_value(value) for value in values.split(scripts.constants.SWEEP_SEPARATION_CHAR)]
+        return sweep
+
+    def expand_sweep(self, sweep: dict) -> List[dict]:
+        """
+        Get the parameters of every combination of the values of the sweep.
+
+            Parameters
+                sweep (dict): Dictionary with the list of values of each parameter
+    
+            Returns
+                return List with the parameters of each run
+        """
+
+        return [dict(zip(sweep.keys(), values)) for values in itertools.product(*sweep.values())]
@@ -0,0 +1,66 @@
+import json, scripts.constants, numpy as np
+
+
+class RandomStreams:
+    """
+    A class to represent the independent random generators of the subsystems of a simulation.
+    Each stream is spawned from the seed sequence of the seed id, so the numbers of a subsystem
+    don't depend on the numbers drawn by the other subsystems.
+
+        Attributes
+        ----------
+
+        seed_id : int
+            Seed id of the simulation
+        placement : np.random.Generator
+            Generator of the tags, values, radii and positions of the agents
+        tasks : np.random.Generator
+            Generator of the tasks
+        edges : np.random.Generator
+            Generator of the connections between agents
+        mobility : np.random.Generator
+            Generator of the moves of the agents
+        visuals : np.random.Generator
+            Generator of the colors of the visual graphs
+
+        Methods
+        -------
+
+        get_state(self) -> str:
+            Get the state of every stream.
+        set_state(self, state: str) -> None:
+            Set the state of every stream.
+    """
+
+    def __init__(self, seed_id: int) -> None:
+        self.seed_id = seed_id
+        seed_sequences = np.random.SeedSequence(seed_id).spawn(len(scripts.constants.RANDOM_STREAMS))
+        for name, seed_sequence in zip(scripts.constants.RANDOM_STREAMS, seed_sequences):
+            setattr(self, name, np.random.Generator(np.random.PCG64(seed_sequence)))
+
+    def get_state(self) -> str:
+        """
+        Get the state of every stream.
+
+            Parameters
+                None
+
+            Returns
+                return JSON string with the state of the bit generator of each stream
+        """
+
+        return json.dumps({name : getattr(self, name).bit_generator.state for name in scripts.constants.RANDOM_STREAMS})
+
+    def set_state(self, state: str) -> None:
+        """
+        Set the state of every stream.
+
+            Parameters
+                state (str): JSON string with the state of the bit generator of each stream
+
+            Returns
+                return None
+        """
+
+        for name, stream_state in json.loads(state).items():
+            getattr(self, name).bit_generator.state = stream_state
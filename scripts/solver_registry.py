@@ -0,0 +1,76 @@
+from typing import List
+from scripts.knapsack import Knapsack
+from scripts.knapsack_solver import KnapsackSolver
+from scripts.greedy_knapsack import GreedyKnapsack
+from scripts.fptas_knapsack import FptasKnapsack
+from scripts.branch_bound_knapsack import BranchBoundKnapsack
+
+
+class SolverRegistry:
+    """
+    A class to represent the registry of the knapsack solvers.
+    Every solver has the methods of the dynamic programming knapsack and reports the gap of its results.
+
+        Attributes
+        ----------
+
+        solvers : dict
+            Class of each solver name
+
+        Methods
+        -------
+
+        register(name: str, solver: type) -> None:
+            Add a solver to the registry.
+        create(name: str, sizes: List[int], values: List[float], capacity: int, **options: dict) -> "Knapsack":
+            Create the knapsack of a solver.
+    """
+
+    solvers = {
+        "exact"            : Knapsack,
+        "greedy"           : GreedyKnapsack,
+        "fptas"            : FptasKnapsack,
+        "branch_and_bound" : BranchBoundKnapsack,
+    }
+
+    @staticmethod
+    def register(name: str, solver: type) -> None:
+        """
+        Add a solver to the registry.
+        The solver is created with the sizes, values and capacity of the knapsack and the options as keyword arguments.
+
+            Parameters
+                name (str): Name of the solver
+                solver (type): Class of the solver, a subclass of KnapsackSolver
+
+            Returns
+                return None
+        """
+
+        if name in SolverRegistry.solvers:
+            raise Exception(f"The solver {name} already exists.")
+        if not issubclass(solver, KnapsackSolver):
+            raise Exception(f"The solver {name} must be a subclass of KnapsackSolver.")
+        SolverRegistry.solvers[name] = solver
+
+    @staticmethod
+    def create(name: str, sizes: List[int], values: List[float], capacity: int, **options: dict) -> "Knapsack":
+        """
+        Create the knapsack of a solver.
+        The knapsack must be solved before reading its results. Every solver gets the same options
+        and uses the ones it knows, like the epsilon of the approximation scheme.
+
+            Parameters
+                name (str): Name of the solver
+                sizes (List[int]): Sizes of the items
+                values (List[float]): Values of the items
+                capacity (int): Maximum capacity of the knapsack
+                options (dict): Options of the solvers
+
+            Returns
+                return Knapsack of the solver
+        """
+
+        if name not in SolverRegistry.solvers:
+            raise Exception(f"The solver {name} doesn't exist, the solvers are {list(SolverRegistry.solvers)}.")
+        return SolverRegistry.solvers[name](sizes, values, capacity, **options)
@@ -0,0 +1,141 @@
+from typing import Tuple
+import math, numpy as np
+
+
+class SpatialHash:
+    """
+    A class to represent a spatial hash of the agents in the grid.
+
+        Attributes
+        ----------
+
+        rows : int
+            Rows of the grid
+        cols : int
+            Columns of the grid
+        cell_size : int
+            Number of rows and columns of the grid in each cell
+        num_cell_rows : int
+            Number of rows of cells
+        num_cell_cols : int
+            Number of columns of cells
+        agent_cell_rows : np.ndarray
+            Row of the cell of each agent
+        agent_cell_cols : np.ndarray
+            Column of the cell of each agent
+        order : np.ndarray
+            Indexes of the agents sorted by cell
+        starts : np.ndarray
+            Position in the order where each cell starts
+
+        Methods
+        -------
+
+        get_cells(self, rows: np.ndarray, cols: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+            Get the cells of the positions of the grid.
+        build(self, rows: np.ndarray, cols: np.ndarray) -> None:
+            Save the agents in their cells.
+        move(self, agents: np.ndarray, rows: np.ndarray, cols: np.ndarray) -> None:
+            Move some agents to the cells of their new positions.
+        query_pairs(self, reach: int, agents: np.ndarray = None) -> Tuple[np.ndarray, np.ndarray]:
+            Get the pairs of agents whose cells are at most reach cells apart.
+    """
+
+    def __init__(self, rows: int, cols: int, cell_size: int) -> None:
+        self.rows, self.cols = rows, cols
+        self.cell_size = cell_size
+        self.num_cell_rows, self.num_cell_cols = math.ceil(rows/cell_size), math.ceil(cols/cell_size)
+        self.agent_cell_rows, self.agent_cell_cols = None, None
+        self.order, self.starts = None, None
+
+    def get_cells(self, rows: np.ndarray, cols: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the cells of the positions of the grid.
+
+            Parameters
+                rows (np.ndarray): Row positions
+                cols (np.ndarray): Column positions
+
+            Returns
+                return Tuple with the rows and columns of the cells
+        """
+
+        return rows // self.cell_size, cols // self.cell_size
+
+    def build(self, rows: np.ndarray, cols: np.ndarray) -> None:
+        """
+        Save the agents in their cells.
+
+            Parameters
+                rows (np.ndarray): Row position of each agent
+                cols (np.ndarray): Column position of each agent
+
+            Returns
+                return None
+        """
+
+        self.agent_cell_rows, self.agent_cell_cols = self.get_cells(rows, cols)
+        keys = self.agent_cell_rows*self.num_cell_cols + self.agent_cell_cols
+        self.order = np.argsort(keys, kind="stable")
+        counts = np.bincount(keys, minlength=self.num_cell_rows*self.num_cell_cols)
+        self.starts = np.concatenate(([0], np.cumsum(counts)))
+
+    def move(self, agents: np.ndarray, rows: np.ndarray, cols: np.ndarray) -> None:
+        """
+        Move some agents to the cells of their new positions.
+        Only the agents that change their cell are taken out of the order and inserted at the end of
+        their new cell, so a step without cell changes doesn't touch the order.
+
+            Parameters
+                agents (np.ndarray): Indexes of the agents
+                rows (np.ndarray): New row position of each agent
+                cols (np.ndarray): New column position of each agent
+
+            Returns
+                return None
+        """
+
+        cell_rows, cell_cols = self.get_cells(rows, cols)
+        changed = (cell_rows != self.agent_cell_rows[agents]) | (cell_cols != self.agent_cell_cols[agents])
+        agents, cell_rows, cell_cols = agents[changed], cell_rows[changed], cell_cols[changed]
+        if len(agents) == 0:
+            return
+        old_keys = self.agent_cell_rows[agents]*self.num_cell_cols + self.agent_cell_cols[agents]
+        new_keys = cell_rows*self.num_cell_cols + cell_cols
+        self.agent_cell_rows[agents], self.agent_cell_cols[agents] = cell_rows, cell_cols
+        moving = np.zeros(len(self.order), dtype=np.bool_)
+        moving[agents] = True
+        counts = np.diff(self.starts) - np.bincount(old_keys, minlength=len(self.starts)-1)
+        order = self.order[~moving[self.order]]
+        # The agents go after the last agent of their new cell in the order without them, the empty cells
+        # between two cells have the same position, so the agents are inserted sorted by cell
+        new_order = np.argsort(new_keys, kind="stable")
+        self.order = np.insert(order, np.cumsum(counts)[new_keys[new_order]], agents[new_order])
+        self.starts = np.concatenate(([0], np.cumsum(counts + np.bincount(new_keys, minlength=len(counts)))))
+
+    def query_pairs(self, reach: int, agents: np.ndarray = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the pairs of agents whose cells are at most reach cells apart.
+
+            Parameters
+                reach (int): Number of cells to search in each direction
+                agents (np.ndarray): Indexes of the first agents of the pairs, all the agents if None
+
+            Returns
+                return Tuple with the indexes of the first and second agents of the pairs
+        """
+
+        if agents is None:
+            agents = np.arange(len(self.order))
+        sources, targets = [np.zeros(0, dtype=np.int64)], [np.zeros(0, dtype=np.int64)]
+        for d_row in range(-reach, reach+1):
+            for d_col in range(-reach, reach+1):
+                cell_rows, cell_cols = self.agent_cell_rows[agents]+d_row, self.agent_cell_cols[agents]+d_col
+                valid = (0 <= cell_rows) & (cell_rows < self.num_cell_rows) & (0 <= cell_cols) & (cell_cols < self.num_cell_cols)
+                keys = cell_rows[valid]*self.num_cell_cols + cell_cols[valid]
+                begins, counts = self.starts[keys], self.starts[keys+1]-self.starts[keys]
+                sources.append(np.repeat(agents[valid], counts))
+                # Position of each candidate inside the agents of its cell
+                offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts)-counts, counts)
+                targets.append(self.order[np.repeat(begins, counts)+offsets])
+        return np.concatenate(sources), np.concatenate(targets)
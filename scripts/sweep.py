@@ -0,0 +1,113 @@
+from typing import List
+import os, concurrent.futures, scripts.constants, pandas as pd
+
+
+class Sweep:
+    """
+    A class to represent a parameter sweep of Ad Hoc networks run in a pool of processes.
+
+        Attributes
+        ----------
+
+        parameters_sets : List[dict]
+            Parameters of each run
+        num_workers : int
+            Number of worker processes, 0 for the number of processors
+        max_pending : int
+            Maximum number of runs submitted to the pool and not finished
+        results : pd.DataFrame
+            Parameters and results of each run
+
+        Methods
+        -------
+
+        initialize_worker() -> None:
+            Import the network once in each worker process.
+        run_network(run_id: int, parameters: dict) -> dict:
+            Run the Ad Hoc Network of a parameters set.
+        run(self) -> pd.DataFrame:
+            Run every parameters set and join their results.
+        save_results(self, filename: str) -> None:
+            Save the results table in the content folder.
+    """
+
+    def __init__(self, parameters_sets: List[dict], num_workers: int = 0, max_pending: int = 0) -> None:
+        self.parameters_sets = parameters_sets
+        self.num_workers = num_workers if num_workers > 0 else os.cpu_count()
+        self.max_pending = max_pending if max_pending > 0 else 2*self.num_workers
+        self.results = None
+
+    @staticmethod
+    def initialize_worker() -> None:
+        """
+        Import the network once in each worker process.
+
+            Parameters
+                None
+
+            Returns
+                return None
+        """
+
+        import matplotlib
+        matplotlib.use("Agg")
+        import scripts.adhoc_network
+
+    @staticmethod
+    def run_network(run_id: int, parameters: dict) -> dict:
+        """
+        Run the Ad Hoc Network of a parameters set.
+
+            Parameters
+                run_id (int): Id of the run, it names the folder of the run
+                parameters (dict): Parameters of the network
+
+            Returns
+                return Dictionary with the parameters and the results of the run
+        """
+
+        import matplotlib.pyplot as plt
+        from scripts.adhoc_network import AdHocNetwork
+        # The runs only save their figures unless the parameters ask for another render mode, the run id of the sweep replaces any other
+        adhoc_network = AdHocNetwork(**{"render_mode" : "headless", **parameters, "run_id" : run_id})
+        results = adhoc_network.run()
+        # The worker is reused, so the figures of the run are closed
+        plt.close("all")
+        return {**parameters, "run_id" : run_id, **results}
+
+    def run(self) -> pd.DataFrame:
+        """
+        Run every parameters set and join their results.
+        At most max_pending runs are waiting in the pool, so the queue doesn't grow with the sweep.
+
+            Parameters
+                None
+
+            Returns
+                return Table with the parameters and results of each run sorted by run id
+        """
+
+        rows, pending = [], set()
+        with concurrent.futures.ProcessPoolExecutor(max_workers=self.num_workers, initializer=Sweep.initialize_worker) as executor:
+            for run_id, parameters in enumerate(self.parameters_sets):
+                if len(pending) >= self.max_pending:
+                    done, pending = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                    rows.extend(future.result() for future in done)
+                pending.add(executor.submit(Sweep.run_network, run_id, parameters))
+            rows.extend(future.result() for future in concurrent.futures.as_completed(pending))
+        self.results = pd.DataFrame(sorted(rows, key=lambda row: row["run_id"]))
+        return self.results
+
+    def save_results(self, filename: str) -> None:
+        """
+        Save the results table in the content folder.
+
+            Parameters
+                filename (str): Name of the results file
+
+            Returns
+                return None
+        """
+
+        os.makedirs(scripts.constants.content_folder_path, exist_ok=True)
+        self.results.to_csv(scripts.constants.content_folder_path + f"\\{filename}", index=False)
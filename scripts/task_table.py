@@ -0,0 +1,89 @@
+import numpy as np
+
+
+class TaskTable:
+    """
+    A class to represent the data of the tasks stored in typed arrays indexed by task id.
+
+        Attributes
+        ----------
+
+        size : int
+            Number of tasks in the table
+        sizes : np.ndarray
+            Size of each task
+        values : np.ndarray
+            Value of each task
+        times : np.ndarray
+            Time of each task
+
+        Methods
+        -------
+
+        __len__(self) -> int:
+            Get the number of tasks in the table.
+        resize(self, capacity: int) -> None:
+            Change the number of tasks that fit in the arrays.
+        add_tasks(self, sizes: np.ndarray, values: np.ndarray, times: np.ndarray) -> np.ndarray:
+            Add new tasks at the end of the table.
+    """
+
+    def __init__(self, capacity: int = 1) -> None:
+        self.size = 0
+        self.sizes = np.zeros(capacity, dtype=np.int32)
+        self.values = np.zeros(capacity, dtype=np.int32)
+        self.times = np.zeros(capacity, dtype=np.int32)
+
+    def __len__(self) -> int:
+        """
+        Get the number of tasks in the table.
+
+            Parameters
+                None
+
+            Returns
+                return Number of tasks
+        """
+
+        return self.size
+
+    def resize(self, capacity: int) -> None:
+        """
+        Change the number of tasks that fit in the arrays.
+
+            Parameters
+                capacity (int): New number of tasks that fit in the arrays
+
+            Returns
+                return None
+        """
+
+        for name in ("sizes", "values", "times"):
+            old_array = getattr(self, name)
+            new_array = np.zeros(capacity, dtype=old_array.dtype)
+            new_array[:self.size] = old_array[:self.size]
+            setattr(self, name, new_array)
+
+    def add_tasks(self, sizes: np.ndarray, values: np.ndarray, times: np.ndarray) -> np.ndarray:
+        """
+        Add new tasks at the end of the table.
+
+            Parameters
+                sizes (np.ndarray): Size of each task
+                values (np.ndarray): Value of each task
+                times (np.ndarray): Time of each task
+
+            Returns
+                return Ids of the new tasks
+        """
+
+        begin, end = self.size, self.size+len(sizes)
+        # Double the arrays until the new tasks fit
+        if end > len(self.sizes):
+            capacity = max(len(self.sizes), 1)
+            while capacity < end:
+                capacity *= 2
+            self.resize(capacity)
+        self.sizes[begin:end], self.values[begin:end], self.times[begin:end] = sizes, values, times
+        self.size = end
+        return np.arange(begin, end, dtype=np.int64)
@@ -0,0 +1,129 @@
+from typing import Tuple
+import numpy as np
+
+
+class Trajectory:
+    """
+    A class to represent the positions of the agents recorded in a preallocated array.
+    The array has a (records, agents, 2) shape with the row and column of each agent in each record,
+    it can be a memory map in a file for the long simulations.
+
+        Attributes
+        ----------
+
+        num_agents : int
+            Number of agents in the records
+        interval : int
+            Number of steps between the records
+        path : str
+            Path of the memory map file, None if the array is in memory
+        positions : np.ndarray
+            Row and column of each agent in each record, EMPTY_CELL if it wasn't installed
+        steps : int
+            Number of recorded steps
+        size : int
+            Number of records in the array
+
+        Methods
+        -------
+
+        get_capacity(num_steps: int, interval: int) -> int:
+            Get the number of records of the steps.
+        get_dtype(rows: int, cols: int) -> np.dtype:
+            Get the smallest integer type of the positions in the grid.
+        record(self, rows: np.ndarray, cols: np.ndarray) -> None:
+            Record the positions of a step.
+        get_positions(self, slot: int) -> Tuple[np.ndarray, np.ndarray]:
+            Get the recorded positions of an agent.
+        flush(self) -> None:
+            Write the records of the memory map in the file.
+    """
+
+    def __init__(self, num_steps: int, num_agents: int, rows: int, cols: int, interval: int = 1, path: str = None) -> None:
+        if interval < 1:
+            raise Exception(f"The interval of the trajectory ({interval}) is invalid.")
+        self.num_agents = num_agents
+        self.interval = interval
+        self.path = path
+        shape, dtype = (Trajectory.get_capacity(num_steps, interval), num_agents, 2), Trajectory.get_dtype(rows, cols)
+        if path is None:
+            self.positions = np.zeros(shape, dtype=dtype)
+        else:
+            self.positions = np.lib.format.open_memmap(path, mode="w+", dtype=dtype, shape=shape)
+        self.steps = 0
+        self.size = 0
+
+    @staticmethod
+    def get_capacity(num_steps: int, interval: int) -> int:
+        """
+        Get the number of records of the steps.
+
+            Parameters
+                num_steps (int): Number of steps of the simulation
+                interval (int): Number of steps between the records
+
+            Returns
+                return Number of records
+        """
+
+        return (num_steps-1)//interval + 1 if num_steps > 0 else 0
+
+    @staticmethod
+    def get_dtype(rows: int, cols: int) -> np.dtype:
+        """
+        Get the smallest integer type of the positions in the grid.
+
+            Parameters
+                rows (int): Number of rows of the grid
+                cols (int): Number of columns of the grid
+
+            Returns
+                return Integer type of the positions
+        """
+
+        return np.dtype(np.int16) if max(rows, cols) <= np.iinfo(np.int16).max else np.dtype(np.int32)
+
+    def record(self, rows: np.ndarray, cols: np.ndarray) -> None:
+        """
+        Record the positions of a step.
+        Only the steps multiple of the interval are saved.
+
+            Parameters
+                rows (np.ndarray): Row of each agent
+                cols (np.ndarray): Column of each agent
+
+            Returns
+                return None
+        """
+
+        if self.steps % self.interval == 0 and self.size < len(self.positions):
+            self.positions[self.size, :, 0], self.positions[self.size, :, 1] = rows, cols
+            self.size += 1
+        self.steps += 1
+
+    def get_positions(self, slot: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the recorded positions of an agent.
+
+            Parameters
+                slot (int): Slot of the agent
+
+            Returns
+                return Tuple with the rows and columns of the agent in each record
+        """
+
+        return self.positions[:self.size, slot, 0], self.positions[:self.size, slot, 1]
+
+    def flush(self) -> None:
+        """
+        Write the records of the memory map in the file.
+
+            Parameters
+                None
+
+            Returns
+                return None
+        """
+
+        if self.path is not None:
+            self.positions.flush()
@@ -1,5 +1,10 @@
-import random, matplotlib.pyplot as plt
-from typing import List
+import scripts.constants, numpy as np, matplotlib.pyplot as plt
+from typing import List, Tuple
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import EllipseCollection, LineCollection
+from matplotlib.animation import FuncAnimation, PillowWriter, FFMpegWriter
+import matplotlib
 import matplotlib.lines as mlines
 
 class VisualGraph:
@@ -17,25 +22,47 @@ class VisualGraph:
             Limit of the y axis
         save_path : str
             Path for save the visual graph
-        colors : List[tuple]
-            List of colors (RGB%)
+        render_mode : str
+            Show the figures in a window or only save them with the Agg canvas
+        rng : np.random.Generator
+            Generator of the colors
+        figure : Figure
+            Figure reused by the headless renders
+        frame_artists : tuple
+            Scatter of the agents, line collection of the edges and text of the iteration updated in each frame
 
         Methods
         -------
         
         generate_palette(self, n: int) -> List[tuple]:
             Generate a palette of colors.
-        update_frame(frame: int, ) -> tuple: 
-            Update the informatin of the next frame.
-        show_visual_graph(self) -> None:
+        update_frame(self, frame: int, animation: "Animation") -> tuple:
+            Update the artists with the information of the next frame.
+        create_axes(self, filename: str) -> "Axes":
+            Create the axes of a visual graph.
+        save_figure(self, ax: "Axes", filename: str) -> None:
+            Save the figure of the axes and release it.
+        get_group_colors(self, groups: List[List["Agent"]], colors: List[str]) -> Tuple[np.ndarray, List[str]]:
+            Get the slots of the agents in the groups and the color of each one.
+        add_legend(self, ax: "Axes", colors: List[str]) -> None:
+            Add the legend of the groups.
+        movement_graph(self, filename: str, groups: List[List["Agent"]], trajectory: "Trajectory") -> None:
+            Create and save the movement graph.
+        show_visual_graph(self, filename: str, groups: List[List["Agent"]]) -> None:
             Show and save the visual graph.
+        animation_graph(self, filename: str, animation: "Animation") -> None:
+            Create and save the animation of the recorded frames.
     """
 
-    def __init__(self, title: str, limit_x: int, limit_y: int, save_path: str) -> None:
+    def __init__(self, title: str, limit_x: int, limit_y: int, save_path: str, render_mode: str = "interactive", rng: np.random.Generator = None) -> None:
         self.title = title 
         self.limit_x = limit_x
         self.limit_y = limit_y
         self.save_path = save_path
+        self.render_mode = render_mode
+        self.rng = np.random.default_rng() if rng is None else rng
+        self.figure = None
+        self.frame_artists = ()
 
     def generate_palette(self, n: int) -> List[tuple]:
         """
@@ -48,44 +75,52 @@ class VisualGraph:
                 return Tuple with the text matplotlib object and None value
         """    
         colors = []
-        for _ in range(n):
-            color = "#{:06x}".format(random.randint(0, 0xFFFFFF))
-            colors.append(color)
+        for color in self.rng.integers(0, 0xFFFFFF+1, size=n).tolist():
+            colors.append("#{:06x}".format(color))
         return colors
 
-    def update_frame(frame: int) -> tuple: 
+    def update_frame(self, frame: int, animation: "Animation") -> tuple:
         """
-        Update the informatin of the next frame.
+        Update the artists with the information of the next frame.
+        The data of the artists is changed in place, so the figure isn't created again.
 
             Parameters
                 frame (int): Current frame
+                animation ("Animation"): Recorded frames of the network
 
             Returns
-                return Tuple with the text matplotlib object and None value
+                return Tuple with the artists of the frame
         """
 
-        # Update text position
-        for agent in self.groups:
-            agent.col = frame*0.1
-        text.set_position((agent_col, 5))
-        return text,
+        agents_scatter, edges_lines, iteration_text = self.frame_artists
+        points, segments, labels = animation.get_frame(frame)
+        group_colors = matplotlib.colormaps[scripts.constants.ANIMATION_COLORMAP]
+        agents_scatter.set_offsets(points)
+        agents_scatter.set_facecolors(group_colors(labels % group_colors.N))
+        edges_lines.set_segments(segments)
+        iteration_text.set_text(f"Iteration: {frame}")
+        return self.frame_artists
 
-    def movement_graph(self, filename: str, groups: List[List["Agent"]]) -> None:
+    def create_axes(self, filename: str) -> "Axes":
         """
-        Create and save the movement graph.
+        Create the axes of a visual graph.
+        The headless renders clear and reuse the same figure, so no pyplot figure is left open.
 
             Parameters
                 filename (str): Name of the visual graph file
-                groups (List[List["Agent"]]): List of groups of agents
 
             Returns
-                return None
+                return Axes of the visual graph
         """
 
-        colors = self.generate_palette(len(groups))
-
-        # Create a figure and axis
-        fig, ax = plt.subplots()
+        if self.render_mode == "headless":
+            if self.figure is None:
+                self.figure = Figure()
+                FigureCanvasAgg(self.figure)
+            self.figure.clear()
+            ax = self.figure.add_subplot()
+        else:
+            _, ax = plt.subplots()
 
         ax.set_title(f"{filename[:filename.find('.')].capitalize()} - {self.title}")
 
@@ -94,82 +129,161 @@ class VisualGraph:
         ax.set_ylim(0, self.limit_y)
 
         ax.grid(True, which="both", linestyle="--", linewidth=0.5, color="gray")
+        return ax
 
-        agents_text_nodes = []
+    def save_figure(self, ax: "Axes", filename: str) -> None:
+        """
+        Save the figure of the axes and release it.
 
-        # Draw groups
-        for i in range(len(groups)):
-            color = colors[i]
-            for agent in groups[i]:
-                plt.plot(agent.old_cols, agent.old_rows, label=f"Group {i}", color=color)
+            Parameters
+                ax ("Axes"): Axes of the visual graph
+                filename (str): Name of the visual graph file
 
-        plt.legend()
+            Returns
+                return None
+        """
 
-        plt.savefig(self.save_path + f"\\{filename}")
-        
-        plt.show()
+        ax.figure.savefig(self.save_path + f"\\{filename}")
+        if self.render_mode != "headless":
+            plt.show()
+            plt.close(ax.figure)
 
-    def show_visual_graph(self, filename: str, groups: List[List["Agent"]]) -> None:
+    def get_group_colors(self, groups: List[List["Agent"]], colors: List[str]) -> Tuple[np.ndarray, List[str]]:
         """
-        Show and save the visual graph.
+        Get the slots of the agents in the groups and the color of each one.
 
             Parameters
-                filename (str): Name of the visual graph file
                 groups (List[List["Agent"]]): List of groups of agents
+                colors (List[str]): Color of each group
 
             Returns
-                return None
+                return Tuple with the slots and the color of each agent
         """
 
-        colors = self.generate_palette(len(groups))
+        slots, agents_colors = [], []
+        for group, color in zip(groups, colors):
+            slots.extend(agent.slot for agent in group)
+            agents_colors.extend([color]*len(group))
+        return np.array(slots, dtype=np.int64), agents_colors
 
-        # Create a figure and axis
-        fig, ax = plt.subplots()
+    def add_legend(self, ax: "Axes", colors: List[str]) -> None:
+        """
+        Add the legend of the groups.
+        The legend is skipped when there are too many groups to read it.
 
-        ax.set_title(f"{filename[:filename.find('.')].capitalize()} - {self.title}")
+            Parameters
+                ax ("Axes"): Axes of the visual graph
+                colors (List[str]): Color of each group
 
-        # Set x and y axis
-        ax.set_xlim(0, self.limit_x)
-        ax.set_ylim(0, self.limit_y)
+            Returns
+                return None
+        """
 
-        ax.grid(True, which="both", linestyle="--", linewidth=0.5, color="gray")
+        if 0 < len(colors) <= scripts.constants.VISUAL_GRAPH_MAX_LEGENDS:
+            ax.legend(handles=[mlines.Line2D([], [], color=color, label=f"Group {i}") for i, color in enumerate(colors)])
 
-        agents_text_nodes = []
+    def movement_graph(self, filename: str, groups: List[List["Agent"]], trajectory: "Trajectory") -> None:
+        """
+        Create and save the movement graph.
+        The paths of every agent are drawn as one line collection.
 
-        # Draw groups
-        for i in range(len(groups)):
-            color = colors[i]
-            for agent in groups[i]:
-                # Add invisible points with labels
+            Parameters
+                filename (str): Name of the visual graph file
+                groups (List[List["Agent"]]): List of groups of agents
+                trajectory ("Trajectory"): Recorded positions of the agents
 
-                x, y = agent.col+1, agent.row+1
+            Returns
+                return None
+        """
 
-                # Get the agent text node
-                agent_text_node = ax.text(
-                    x=x, 
-                    y=y, 
-                    s=agent.tag, 
-                    ha="center", 
-                    va="center", 
-                    fontsize=12, 
-                    color="black", 
-                    bbox=dict(facecolor=color, edgecolor="black", boxstyle="circle", alpha=0.3)
-                )
+        colors = self.generate_palette(len(groups))
+        ax = self.create_axes(filename)
 
-                agents_text_nodes.append(agent_text_node)
+        slots, agents_colors = self.get_group_colors(groups, colors)
+        paths = []
+        for slot in slots.tolist():
+            rows, cols = trajectory.get_positions(slot)
+            # Skip the records before the agent was installed
+            placed = (rows != scripts.constants.EMPTY_CELL) & (cols != scripts.constants.EMPTY_CELL)
+            paths.append(np.column_stack((cols[placed]+1, rows[placed]+1)))
+        ax.add_collection(LineCollection(paths, colors=agents_colors))
 
-                circle = plt.Circle((x, y), agent.radius, color="red", fill=False, linestyle="--", alpha=0.3)
-                ax.add_artist(circle)
+        self.add_legend(ax, colors)
+        self.save_figure(ax, filename)
 
-                for neighbor in agent.neighbors:
-                    ax.annotate("", xy=(neighbor.col+1, neighbor.row+1), xytext=(x, y),
-                        arrowprops=dict(arrowstyle="->"))
+    def show_visual_graph(self, filename: str, groups: List[List["Agent"]]) -> None:
+        """
+        Show and save the visual graph.
+        The agents are drawn as one scatter, their radii as one ellipse collection and the edges as one line collection.
 
-            plt.plot([], [], color=color, label=f"Group {i}")
+            Parameters
+                filename (str): Name of the visual graph file
+                groups (List[List["Agent"]]): List of groups of agents
 
-        plt.legend()
+            Returns
+                return None
+        """
 
-        plt.savefig(self.save_path + f"\\{filename}")
-        
-        plt.show()
+        colors = self.generate_palette(len(groups))
+        ax = self.create_axes(filename)
+
+        slots, agents_colors = self.get_group_colors(groups, colors)
+        if len(slots) > 0:
+            graph = groups[0][0].graph
+            xs, ys = graph.table.cols[slots]+1, graph.table.rows[slots]+1
+            offsets = np.column_stack((xs, ys))
+
+            # Draw the edges from each agent to its neighbors
+            edges = graph.adjacency[slots].tocoo()
+            ax.add_collection(LineCollection(
+                np.stack((offsets[edges.row], np.column_stack((graph.table.cols[edges.col]+1, graph.table.rows[edges.col]+1))), axis=1),
+                colors="black", linewidths=0.5, alpha=0.5
+            ))
+
+            # Draw the radius of each agent
+            diameters = 2*graph.table.radii[slots]
+            ax.add_collection(EllipseCollection(
+                diameters, diameters, np.zeros(len(slots)), units="xy", offsets=offsets, offset_transform=ax.transData,
+                facecolors="none", edgecolors="red", linestyles="--", alpha=0.3
+            ))
+
+            # Draw the agents
+            ax.scatter(xs, ys, s=150, c=agents_colors, edgecolors="black", alpha=0.3, zorder=3)
+            if len(slots) <= scripts.constants.VISUAL_GRAPH_MAX_TAGS:
+                for x, y, tag in zip(xs.tolist(), ys.tolist(), graph.table.tags[slots].tolist()):
+                    ax.text(x=x, y=y, s=str(tag), ha="center", va="center", fontsize=12, color="black", zorder=4)
+
+        self.add_legend(ax, colors)
+        self.save_figure(ax, filename)
+
+    def animation_graph(self, filename: str, animation: "Animation") -> None:
+        """
+        Create and save the animation of the recorded frames.
+        The GIF files are written with Pillow and the MP4 files with FFmpeg.
+
+            Parameters
+                filename (str): Name of the animation file
+                animation ("Animation"): Recorded frames of the network
+
+            Returns
+                return None
+        """
 
+        if filename.endswith(".mp4") == True:
+            if FFMpegWriter.isAvailable() == False:
+                raise Exception("FFmpeg isn't available to write the MP4 animation.")
+            writer = FFMpegWriter(fps=scripts.constants.ANIMATION_FPS)
+        else:
+            writer = PillowWriter(fps=scripts.constants.ANIMATION_FPS)
+
+        ax = self.create_axes(filename)
+        self.frame_artists = (
+            ax.scatter([], [], s=150, edgecolors="black", alpha=0.5, zorder=3),
+            ax.add_collection(LineCollection([], colors="black", linewidths=0.5, alpha=0.5)),
+            ax.text(0.02, 0.98, "", ha="left", va="top", transform=ax.transAxes)
+        )
+        frames = FuncAnimation(ax.figure, self.update_frame, frames=len(animation), fargs=(animation,), blit=True)
+        frames.save(self.save_path + f"\\{filename}", writer=writer)
+        self.frame_artists = ()
+        if self.render_mode != "headless":
+            plt.close(ax.figure)
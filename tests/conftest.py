@@ -0,0 +1,57 @@
+import os, sys, pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import matplotlib
+matplotlib.use("Agg")
+import scripts.constants
+
+DATA_FOLDER_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data")
+
+
+@pytest.fixture
+def content_folder(tmp_path, monkeypatch):
+    """
+    Save the content of the networks in a temporary folder.
+    """
+
+    path = os.path.join(str(tmp_path), "content")
+    monkeypatch.setattr(scripts.constants, "content_folder_path", path)
+    return path
+
+
+@pytest.fixture
+def create_network(content_folder):
+    """
+    Get a function that creates a small fixed-seed network, the keyword arguments replace the parameters.
+    """
+
+    from scripts.adhoc_network import AdHocNetwork
+
+    def create(**kwargs):
+        parameters = dict(
+            width=60.0, height=60.0, width_span=3.0, height_span=3.0, num_agents=30, num_tasks=15,
+            connection_probability=0.7, mobility_model="brownian_motion", seed_id=12345, iterations=3,
+            render_mode="headless"
+        )
+        parameters.update(kwargs)
+        return AdHocNetwork(**parameters)
+    return create
+
+
+def read_log(network) -> list:
+    """
+    Get the lines of the text log of a network without the simulation time.
+    """
+
+    with open(network.log_path + "\\log.txt", "r") as file:
+        return [line for line in file.read().splitlines() if line.startswith("Time: ") == False]
+
+
+def read_data(filename: str) -> list:
+    """
+    Get the lines of a file of the test data.
+    """
+
+    with open(os.path.join(DATA_FOLDER_PATH, filename), "r") as file:
+        return file.read().splitlines()
@@ -0,0 +1,80 @@
+import pytest, numpy as np
+from conftest import read_log, read_data
+
+
+@pytest.mark.parametrize("connection_probability, filename", [
+    (0.7, "log_12345_p070.txt"),
+    (1.0, "log_12345_p100.txt"),
+])
+def test_fixed_seed_log_matches_baseline(create_network, connection_probability, filename):
+    network = create_network(connection_probability=connection_probability)
+    network.run()
+    assert read_log(network) == read_data(filename)
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"executor" : "thread", "num_workers" : 2},
+    {"metrics_mode" : "enabled"},
+    {"trajectory_storage" : "memmap"},
+])
+def test_options_keep_the_results(create_network, kwargs):
+    network = create_network(**kwargs)
+    network.run()
+    assert read_log(network) == read_data("log_12345_p070.txt")
+
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"collision_resolution" : "sequential"},
+    {"executor" : "threads"},
+    {"render_mode" : "Headless"},
+    {"animation_format" : "avi"},
+    {"metrics_mode" : "on"},
+    {"trajectory_storage" : "disk"},
+    {"mobility_model" : "random_walk"},
+    {"solver" : "simplex"},
+])
+def test_invalid_modes_are_rejected(create_network, kwargs):
+    with pytest.raises(Exception, match=list(kwargs)[0]):
+        create_network(**kwargs)
+
+
+def test_same_seed_gives_same_results(create_network):
+    first, second = create_network(), create_network()
+    first_results, second_results = first.run(), second.run()
+    first_results.pop("time"), second_results.pop("time")
+    assert first_results == second_results
+
+
+@pytest.mark.parametrize("seed_id", [1, 2, 3])
+def test_update_edges_matches_new_edges(create_network, seed_id):
+    network = create_network(connection_probability=1.0, seed_id=seed_id, num_agents=80)
+    graph = network.graph
+    for _ in range(5):
+        old_rows, old_cols = graph.get_positions()
+        old_adjacency = graph.adjacency
+        network.brownian_motion(1)
+        new_rows, new_cols = graph.get_positions()
+        changed_slots = network.update_edges(graph, np.flatnonzero((old_rows != new_rows) | (old_cols != new_cols)))
+        adjacency = graph.adjacency
+        network.create_edges(graph)
+        assert (adjacency != graph.adjacency).nnz == 0
+        changes = (old_adjacency != graph.adjacency).tocoo()
+        assert changed_slots.tolist() == np.unique(np.concatenate((changes.row, changes.col))).tolist()
+
+
+def test_resume_gives_the_same_results_and_counters(create_network, tmp_path):
+    uninterrupted = create_network(checkpoint_interval=2, metrics_mode="enabled")
+    results = uninterrupted.run()
+    # The resumed network writes in the same folder, so the checkpoint is copied first
+    checkpoint_path = str(tmp_path / "checkpoint_2.npz")
+    with open(uninterrupted.log_path + "\\checkpoint_2.npz", "rb") as source, open(checkpoint_path, "wb") as target:
+        target.write(source.read())
+    resumed = create_network(metrics_mode="enabled", resume_path=checkpoint_path)
+    resumed_results = resumed.run()
+    results.pop("time"), resumed_results.pop("time")
+    assert resumed_results == results
+    assert resumed.metrics.counters == uninterrupted.metrics.counters
+    assert (resumed.mobility.rounds, resumed.mobility.retries) == (uninterrupted.mobility.rounds, uninterrupted.mobility.retries)
+    assert [agent.value for agent in resumed.graph.agents] == [agent.value for agent in uninterrupted.graph.agents]
+    assert np.array_equal(resumed.trajectory.positions[:resumed.trajectory.size], uninterrupted.trajectory.positions[:uninterrupted.trajectory.size])
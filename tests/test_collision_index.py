@@ -0,0 +1,115 @@
+import random, collections, pytest, numpy as np
+from scripts.collision_index import CollisionIndex
+from scripts.group_allocator import GroupAllocator
+
+Task = collections.namedtuple("Task", ["size", "value"])
+
+
+def merge(tasks, all_selected_tasks, left, mid, right):
+    """
+    Merge of the baseline merge sort of the selected tasks, kept as the reference of the index.
+    """
+
+    left_list, right_list = all_selected_tasks[left:mid+1], all_selected_tasks[mid+1:right+1]
+    i, j, k = 0, 0, left
+    while i < len(left_list) and j < len(right_list):
+        if len(left_list[i][1]) > len(right_list[j][1]):
+            all_selected_tasks[k], i = left_list[i], i+1
+        elif len(left_list[i][1]) == len(right_list[j][1]):
+            size_comparison = tasks[left_list[i][0]].size > tasks[right_list[j][0]].size
+            value_comparison = tasks[left_list[i][0]].value > tasks[right_list[j][0]].value
+            if size_comparison == False and value_comparison == True:
+                all_selected_tasks[k], i = left_list[i], i+1
+            elif size_comparison == True and value_comparison == False:
+                all_selected_tasks[k], j = right_list[j], j+1
+            else:
+                all_selected_tasks[k], i = left_list[i], i+1
+        else:
+            all_selected_tasks[k], j = right_list[j], j+1
+        k += 1
+    for entry in left_list[i:] + right_list[j:]:
+        all_selected_tasks[k], k = entry, k+1
+
+
+def merge_sort_tasks(tasks, all_selected_tasks, begin, end):
+    """
+    Baseline merge sort of the selected tasks.
+    """
+
+    if begin >= end:
+        return
+    mid = begin+(end-begin)//2
+    merge_sort_tasks(tasks, all_selected_tasks, begin, mid)
+    merge_sort_tasks(tasks, all_selected_tasks, mid+1, end)
+    merge(tasks, all_selected_tasks, begin, mid, end)
+
+
+def baseline_top(sizes, values, entries):
+    """
+    Get the first task of the baseline merge sort.
+    """
+
+    tasks = [Task(size, value) for size, value in zip(sizes, values)]
+    all_selected_tasks = list(entries)
+    merge_sort_tasks(tasks, all_selected_tasks, 0, len(all_selected_tasks)-1)
+    return all_selected_tasks[0]
+
+
+@pytest.mark.parametrize("seed", range(30))
+def test_top_matches_the_baseline_merge_sort(seed):
+    rng = random.Random(seed)
+    num_tasks = rng.randint(1, 40)
+    # Few sizes and values give many ties between tasks with the same collisions
+    sizes = [rng.randint(1, 3) for _ in range(num_tasks)]
+    values = [rng.randint(1, 3) for _ in range(num_tasks)]
+    # The selected tasks in the order of their first selection
+    entries = [(task_idx, list(range(rng.randint(1, 3)))) for task_idx in rng.sample(range(num_tasks), rng.randint(1, num_tasks))]
+    collision_index = CollisionIndex(sizes, values)
+    collision_index.build(entries)
+    assert collision_index.get_top() == baseline_top(sizes, values, entries)
+
+
+def test_ties_keep_the_selection_order():
+    # The second task is smaller with the same value, the third is incomparable with both
+    sizes, values = [3, 2, 1], [2, 2, 1]
+    for entries in ([(0, [0, 1]), (1, [2, 3]), (2, [4, 5])], [(2, [4, 5]), (0, [0, 1]), (1, [2, 3])], [(1, [2, 3]), (2, [4, 5]), (0, [0, 1])]):
+        collision_index = CollisionIndex(sizes, values)
+        collision_index.build(entries)
+        assert collision_index.get_top() == baseline_top(sizes, values, entries)
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_allocator_resolves_the_baseline_top_task(seed):
+    rng = random.Random(seed)
+    sizes = np.array([rng.randint(1, 3) for _ in range(25)])
+    task_values = np.array([rng.randint(1, 3) for _ in range(25)])
+    values = [rng.randint(3, 12) for _ in range(12)]
+    expected, resolved = [], []
+
+    class RecordingAllocator(GroupAllocator):
+        def resolve_collisions(self, collision_index, tasks_counter):
+            expected.append(baseline_top(self.sizes.tolist(), self.task_values.tolist(), list(tasks_counter.items()))[0])
+            resolutions = super().resolve_collisions(collision_index, tasks_counter)
+            resolved.append(resolutions[0][0])
+            return resolutions
+
+    allocator = RecordingAllocator(values, sizes, task_values, "one_at_a_time", False).allocate()
+    assert allocator.collision_rounds > 1
+    assert resolved == expected
+
+
+def test_batched_mode_resolves_disjoint_collisions_in_one_round():
+    # The two small agents contest the first task and the two big agents contest a big task
+    sizes, task_values, values = np.array([2, 10, 10]), np.array([5, 100, 100]), [2, 3, 10, 11]
+    resolutions = []
+
+    class RecordingAllocator(GroupAllocator):
+        def resolve_collisions(self, collision_index, tasks_counter):
+            resolutions.append(super().resolve_collisions(collision_index, tasks_counter))
+            return resolutions[-1]
+
+    one_at_a_time = GroupAllocator(values, sizes, task_values, "one_at_a_time", False).allocate()
+    batched = RecordingAllocator(values, sizes, task_values, "batched", False).allocate()
+    assert sorted(task_idx for task_idx, _ in resolutions[0]) == [0, 1]
+    assert batched.collision_rounds < one_at_a_time.collision_rounds
+    assert batched.selected_tasks == one_at_a_time.selected_tasks
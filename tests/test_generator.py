@@ -0,0 +1,47 @@
+import pytest, numpy as np
+from scripts.generator import Generator
+
+
+@pytest.mark.parametrize("n, min_value, max_value", [(1, 0, 0), (10, 5, 14), (50, -20, 200)])
+def test_unique_integer_numbers_are_unique_and_in_range(n, min_value, max_value):
+    numbers = Generator(n, np.random.default_rng(0)).generate_unique_integer_numbers(min_value, max_value)
+    assert len(numbers) == n
+    assert len(np.unique(numbers)) == n
+    assert numbers.min() >= min_value and numbers.max() <= max_value
+
+
+def test_unique_integer_numbers_of_an_exact_range_are_a_permutation():
+    numbers = Generator(30, np.random.default_rng(1)).generate_unique_integer_numbers(0, 29)
+    assert sorted(numbers.tolist()) == list(range(30))
+
+
+def test_unique_integer_numbers_reject_a_small_range():
+    with pytest.raises(Exception, match="unique numbers"):
+        Generator(11, np.random.default_rng(0)).generate_unique_integer_numbers(0, 9)
+
+
+@pytest.mark.parametrize("n, rows, cols", [(1, 1, 1), (20, 5, 4), (100, 30, 40)])
+def test_unique_pairs_are_unique_and_in_range(n, rows, cols):
+    pairs = Generator(n, np.random.default_rng(2)).generate_unique_pairs(0, rows-1, 3, cols+2)
+    assert pairs.shape == (n, 2)
+    assert len(np.unique(pairs, axis=0)) == n
+    assert pairs[:, 0].min() >= 0 and pairs[:, 0].max() <= rows-1
+    assert pairs[:, 1].min() >= 3 and pairs[:, 1].max() <= cols+2
+
+
+def test_unique_pairs_reject_a_small_grid():
+    with pytest.raises(Exception, match="unique pairs"):
+        Generator(21, np.random.default_rng(0)).generate_unique_pairs(0, 4, 0, 3)
+
+
+def test_network_agents_have_unique_tags_and_positions(create_network):
+    network = create_network(num_agents=200)
+    tags = [agent.tag for agent in network.graph.agents]
+    rows, cols = network.graph.get_positions()
+    assert sorted(tags) == list(range(200))
+    assert len(set(zip(rows.tolist(), cols.tolist()))) == 200
+
+
+def test_network_with_more_agents_than_cells_is_rejected(create_network):
+    with pytest.raises(Exception, match="unique pairs"):
+        create_network(width=6.0, height=6.0, num_agents=30)
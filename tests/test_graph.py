@@ -0,0 +1,78 @@
+import pytest, numpy as np
+from scripts.graph import Graph
+
+
+def create_graph(seed, num_agents, num_edges):
+    rng = np.random.default_rng(seed)
+    graph = Graph()
+    for tag in range(num_agents):
+        graph.add_agent(tag, 1, 1.0)
+    graph.set_edges(rng.integers(0, num_agents, num_edges), rng.integers(0, num_agents, num_edges))
+    return graph, rng
+
+
+def bfs_groups(graph):
+    # Groups of two-way neighbors in BFS order, started from the smallest slot of each group
+    visited, groups = set(), []
+    for start in range(len(graph.agents)):
+        if start in visited:
+            continue
+        group, visited_group = graph.create_group(start)
+        visited.update(agent.slot for agent in group)
+        groups.append([agent.slot for agent in group])
+    return groups
+
+
+@pytest.mark.parametrize("seed", range(8))
+def test_groups_match_the_bfs(seed):
+    graph, _ = create_graph(seed, 40, 120)
+    groups = [[agent.slot for agent in group] for group in graph.create_groups()]
+    assert groups == bfs_groups(graph)
+    for label, group in enumerate(groups):
+        assert (graph.labels[group] == label).all()
+
+
+@pytest.mark.parametrize("seed", range(8))
+def test_update_groups_matches_new_groups(seed):
+    graph, rng = create_graph(seed, 40, 120)
+    graph.create_groups()
+    for _ in range(5):
+        old_adjacency = graph.adjacency
+        edges = graph.adjacency.tocoo()
+        keep = rng.random(len(edges.row)) < 0.8
+        new_sources, new_targets = rng.integers(0, 40, 15), rng.integers(0, 40, 15)
+        graph.set_edges(np.concatenate((edges.row[keep], new_sources)), np.concatenate((edges.col[keep], new_targets)))
+        changes = (old_adjacency != graph.adjacency).tocoo()
+        groups = graph.update_groups(np.unique(np.concatenate((changes.row, changes.col))))
+        labels = graph.labels.copy()
+        assert [[agent.slot for agent in group] for group in groups] == [[agent.slot for agent in group] for group in graph.create_groups()]
+        assert (labels == graph.labels).all()
+
+
+def test_single_edges_and_neighbors():
+    graph, _ = create_graph(0, 5, 0)
+    graph.add_edge(0, 1)
+    graph.add_edge(1, 0)
+    graph.add_edge(1, 3)
+    assert graph.has_edge(1, 3) == True and graph.has_edge(3, 1) == False
+    assert [agent.slot for agent in graph.get_neighbors(1)] == [0, 3]
+    assert graph.agents[0].is_bidirectional(graph.agents[1]) == True
+    graph.remove_edge(0, 1)
+    assert graph.adjacency.nnz == 1
+
+
+def test_staged_edges_are_applied_once():
+    graph, rng = create_graph(1, 30, 60)
+    expected = set(zip(*[indexes.tolist() for indexes in graph.adjacency.nonzero()]))
+    for _ in range(200):
+        slot1, slot2 = rng.integers(0, 30, 2).tolist()
+        if rng.random() < 0.5:
+            graph.connect(slot1, slot2)
+            expected.add((slot1, slot2))
+        else:
+            graph.disconnect(slot1, slot2)
+            expected.discard((slot1, slot2))
+        assert graph.has_edge(slot1, slot2) == ((slot1, slot2) in expected)
+    assert len(graph.staged_edges) > 0
+    assert set(zip(*[indexes.tolist() for indexes in graph.adjacency.nonzero()])) == expected
+    assert graph.staged_edges == {}
@@ -0,0 +1,39 @@
+import numpy as np
+from scripts.grid import Grid
+from scripts.mobility import Mobility
+import scripts.constants
+
+
+def test_move_values_swaps_cells():
+    grid = Grid(3, 4)
+    grid.move_values(np.array([0, 1]), np.array([-1, -1]), np.array([-1, -1]), np.array([0, 2]), np.array([0, 3]))
+    assert grid.values[0, 0] == 0 and grid.values[2, 3] == 1
+    # The agents take the old cell of each other in the same move
+    grid.move_values(np.array([0, 1]), np.array([0, 2]), np.array([0, 3]), np.array([2, 0]), np.array([3, 0]))
+    assert grid.values[2, 3] == 0 and grid.values[0, 0] == 1
+    assert (grid.values != scripts.constants.EMPTY_CELL).sum() == 2
+
+
+def test_free_cells_inside_the_limits():
+    grid = Grid(3, 3)
+    grid.move_value(5, None, None, 0, 1)
+    assert grid.is_free(0, 1) == False
+    assert sorted(grid.get_free_cells(0, 0, 1)) == [(0, 0), (1, 0), (1, 1)]
+    assert len(grid.get_free_cells(1, 1, 1)) == 8
+
+
+def test_brownian_motion_keeps_one_agent_per_cell():
+    rng = np.random.default_rng(3)
+    grid = Grid(6, 6)
+    cells = rng.choice(36, size=20, replace=False)
+    rows, cols = cells // 6, cells % 6
+    grid.move_values(np.arange(20), np.full(20, -1), np.full(20, -1), rows, cols)
+    mobility = Mobility(grid, rng)
+    for _ in range(10):
+        new_rows, new_cols = mobility.brownian_motion(rows, cols, 1)
+        assert len(set(zip(new_rows.tolist(), new_cols.tolist()))) == 20
+        assert np.abs(new_rows-rows).max() <= 1 and np.abs(new_cols-cols).max() <= 1
+        assert ((0 <= new_rows) & (new_rows < 6) & (0 <= new_cols) & (new_cols < 6)).all()
+        grid.move_values(np.arange(20), rows, cols, new_rows, new_cols)
+        rows, cols = new_rows, new_cols
+    assert (grid.values[rows, cols] == np.arange(20)).all()
@@ -0,0 +1,71 @@
+import itertools, pytest, numpy as np
+from scripts.knapsack import Knapsack
+
+
+def brute_force(sizes, values, capacity, removed=()):
+    best = 0
+    items = [i for i in range(len(sizes)) if i not in removed]
+    for r in range(len(items)+1):
+        for combination in itertools.combinations(items, r):
+            if sum(sizes[i] for i in combination) <= capacity:
+                best = max(best, sum(values[i] for i in combination))
+    return best
+
+
+def check_selection(knapsack, sizes, values, capacity, removed=()):
+    selected = knapsack.get_selected_items(capacity)
+    assert len(set(selected)) == len(selected)
+    assert set(selected).isdisjoint(removed)
+    assert sum(sizes[i] for i in selected) <= capacity
+    assert sum(values[i] for i in selected) == knapsack.get_score(capacity)
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_best_score_of_every_capacity(seed):
+    rng = np.random.default_rng(seed)
+    num_items = int(rng.integers(0, 10))
+    sizes, values = rng.integers(1, 12, num_items).tolist(), rng.integers(0, 30, num_items).tolist()
+    knapsack = Knapsack(sizes, values, 30)
+    knapsack.solve()
+    for capacity in range(31):
+        assert knapsack.get_score(capacity) == brute_force(sizes, values, capacity)
+        check_selection(knapsack, sizes, values, capacity)
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_removed_items_resolve_as_a_new_knapsack(seed):
+    rng = np.random.default_rng(seed)
+    # More items than a block of the checkpoints, so the update starts from a saved row
+    num_items = 80
+    sizes, values = rng.integers(1, 15, num_items).tolist(), rng.integers(0, 40, num_items).tolist()
+    knapsack = Knapsack(sizes, values, 40)
+    knapsack.solve()
+    removed = set()
+    for _ in range(4):
+        indexes = rng.choice(num_items, size=3, replace=False).tolist()
+        removed.update(indexes)
+        knapsack.remove_items(indexes)
+        kept = [i for i in range(num_items) if i not in removed]
+        fresh = Knapsack([sizes[i] for i in kept], [values[i] for i in kept], 40)
+        fresh.solve()
+        for capacity in range(41):
+            assert knapsack.get_score(capacity) == fresh.get_score(capacity)
+            check_selection(knapsack, sizes, values, capacity, removed)
+
+
+def test_set_capacity_keeps_the_scores():
+    sizes, values = [3, 4, 5, 9, 2], [4, 5, 7, 11, 1]
+    knapsack = Knapsack(sizes, values, 12)
+    knapsack.solve()
+    knapsack.set_capacity(7)
+    assert [knapsack.get_score(capacity) for capacity in range(8)] == [brute_force(sizes, values, capacity) for capacity in range(8)]
+    knapsack.set_capacity(20)
+    assert knapsack.get_score(20) == brute_force(sizes, values, 20)
+    check_selection(knapsack, sizes, values, 20)
+
+
+def test_empty_knapsack():
+    knapsack = Knapsack([], [], 5)
+    knapsack.solve()
+    assert knapsack.get_score(5) == 0
+    assert knapsack.get_selected_items(5) == []
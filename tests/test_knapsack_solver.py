@@ -0,0 +1,86 @@
+import pytest, numpy as np
+from scripts.knapsack import Knapsack
+from scripts.knapsack_solver import KnapsackSolver
+from scripts.solver_registry import SolverRegistry
+
+
+class BestItemKnapsack(KnapsackSolver):
+    """
+    Solver that only takes the best item that fits, registered by the tests.
+    """
+
+    def solve_capacity(self, capacity):
+        items = self.get_items(capacity)
+        if len(items) == 0:
+            return 0, [], 0.0
+        best_item = items[self.values[items].argmax()].item()
+        score = self.values[best_item].item()
+        return score, [best_item], KnapsackSolver.get_relative_gap(score, self.get_upper_bound(items, capacity))
+
+
+@pytest.fixture
+def solver_names(monkeypatch):
+    monkeypatch.setattr(SolverRegistry, "solvers", dict(SolverRegistry.solvers))
+    SolverRegistry.register("best_item", BestItemKnapsack)
+    return list(SolverRegistry.solvers)
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_gap_bounds_the_distance_to_the_exact_score(solver_names, seed):
+    rng = np.random.default_rng(seed)
+    num_items = int(rng.integers(1, 25))
+    sizes, values = rng.integers(1, 12, num_items).tolist(), rng.integers(0, 30, num_items).tolist()
+    removed = rng.choice(num_items, size=num_items//4, replace=False).tolist()
+    exact = Knapsack(sizes, values, 40)
+    exact.solve()
+    exact.remove_items(removed)
+    for name in solver_names:
+        knapsack = SolverRegistry.create(name, sizes, values, 40, epsilon=0.2)
+        knapsack.solve()
+        knapsack.remove_items(removed)
+        for capacity in range(41):
+            score, best_score, gap = knapsack.get_score(capacity), exact.get_score(capacity), knapsack.get_gap(capacity)
+            selected = knapsack.get_selected_items(capacity)
+            assert set(selected).isdisjoint(removed)
+            assert sum(sizes[i] for i in selected) <= capacity
+            assert sum(values[i] for i in selected) == score
+            assert 0.0 <= gap <= 1.0
+            assert score <= best_score
+            if best_score > 0:
+                assert (best_score - score) / best_score <= gap + 1e-9
+            if name == "branch_and_bound":
+                assert score == best_score and gap == 0.0
+            if name == "fptas":
+                assert gap <= 0.2
+
+
+def test_register_rejects_existing_names_and_other_classes(solver_names):
+    with pytest.raises(Exception):
+        SolverRegistry.register("best_item", BestItemKnapsack)
+    with pytest.raises(Exception):
+        SolverRegistry.register("dict", dict)
+
+
+def test_solver_without_solve_capacity_is_abstract():
+    class IncompleteKnapsack(KnapsackSolver):
+        pass
+
+    with pytest.raises(TypeError):
+        IncompleteKnapsack([1, 2], [3, 4], 3)
+
+
+def test_options_reach_every_solver(solver_names):
+    class ScaledItemKnapsack(BestItemKnapsack):
+        def __init__(self, sizes, values, capacity, scale=1, **options):
+            super().__init__(sizes, [scale*value for value in values], capacity, **options)
+
+    SolverRegistry.register("scaled_item", ScaledItemKnapsack)
+    knapsack = SolverRegistry.create("scaled_item", [1, 2], [3, 5], 2, scale=10, epsilon=0.2)
+    knapsack.solve()
+    assert knapsack.get_score(2) == 50
+    # The options that a solver doesn't use are ignored
+    for name in solver_names:
+        knapsack = SolverRegistry.create(name, [1, 2], [3, 5], 3, epsilon=0.2, scale=10)
+        knapsack.solve()
+        assert knapsack.get_score(3) == 8 or name in ("greedy", "best_item")
+    assert SolverRegistry.create("fptas", [1], [1], 1, epsilon=0.3).epsilon == 0.3
@@ -0,0 +1,37 @@
+import os, pytest, scripts.constants
+from scripts.program import Program
+
+
+def write_parameters(tmp_path, monkeypatch, content: str) -> str:
+    """
+    Write a parameters or sweep file in a temporary parameters folder.
+    """
+
+    monkeypatch.setattr(scripts.constants, "parameters_folder_path", str(tmp_path))
+    with open(str(tmp_path) + "\\parameters.txt", "w") as file:
+        file.write(content)
+    return "parameters.txt"
+
+
+def test_read_sweep_expands_every_combination(tmp_path, monkeypatch):
+    filename = write_parameters(tmp_path, monkeypatch, "num_agents = 10, 20\nconnection_probability = 0.5, 1.0\nseed_id = 7\n")
+    program = Program()
+    parameters_sets = program.expand_sweep(program.read_sweep(filename))
+    assert len(parameters_sets) == 4
+    assert parameters_sets[0] == {"num_agents" : 10, "connection_probability" : 0.5, "seed_id" : 7}
+
+
+def test_read_sweep_rejects_the_run_id(tmp_path, monkeypatch):
+    filename = write_parameters(tmp_path, monkeypatch, "num_agents = 10\nrun_id = 1, 2\n")
+    with pytest.raises(Exception, match="run_id"):
+        Program().read_sweep(filename)
+
+
+def test_template_parameters_are_valid_keyword_arguments(tmp_path, monkeypatch):
+    from scripts.adhoc_network import AdHocNetwork
+    with open(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "parameters", "template.txt"), "r") as file:
+        filename = write_parameters(tmp_path, monkeypatch, file.read())
+    parameters = Program().read_parameters(filename)
+    assert parameters["resume_path"] == ""
+    for key, value in parameters.items():
+        assert isinstance(value, AdHocNetwork.valid_kwargs[key])
@@ -0,0 +1,50 @@
+import pytest, numpy as np
+from scripts.spatial_hash import SpatialHash
+
+
+def create_positions(seed, num_agents, rows, cols):
+    rng = np.random.default_rng(seed)
+    cells = rng.choice(rows*cols, size=num_agents, replace=False)
+    return cells // cols, cells % cols
+
+
+@pytest.mark.parametrize("seed, cell_size", [(0, 1), (1, 3), (2, 4), (3, 10)])
+def test_pairs_contain_the_near_agents(seed, cell_size):
+    rows, cols = create_positions(seed, 60, 20, 17)
+    spatial_hash = SpatialHash(20, 17, cell_size)
+    spatial_hash.build(rows, cols)
+    sources, targets = spatial_hash.query_pairs(1)
+    pairs = set(zip(sources.tolist(), targets.tolist()))
+    assert len(pairs) == len(sources)
+    for first in range(60):
+        for second in range(60):
+            near = abs(int(rows[first])-int(rows[second])) <= cell_size and abs(int(cols[first])-int(cols[second])) <= cell_size
+            if near == True:
+                assert (first, second) in pairs
+
+
+def test_query_of_some_agents_is_part_of_the_full_query():
+    rows, cols = create_positions(4, 50, 15, 15)
+    spatial_hash = SpatialHash(15, 15, 3)
+    spatial_hash.build(rows, cols)
+    sources, targets = spatial_hash.query_pairs(1)
+    agents = np.array([2, 7, 31, 49])
+    agent_sources, agent_targets = spatial_hash.query_pairs(1, agents)
+    expected = {(source, target) for source, target in zip(sources.tolist(), targets.tolist()) if source in agents}
+    assert set(zip(agent_sources.tolist(), agent_targets.tolist())) == expected
+
+
+def test_moved_agents_give_the_pairs_of_a_new_hash():
+    rng = np.random.default_rng(5)
+    rows, cols = create_positions(5, 40, 12, 12)
+    spatial_hash = SpatialHash(12, 12, 3)
+    spatial_hash.build(rows, cols)
+    for _ in range(10):
+        agents = np.sort(rng.choice(40, size=8, replace=False))
+        rows, cols = rows.copy(), cols.copy()
+        rows[agents], cols[agents] = rng.integers(0, 12, 8), rng.integers(0, 12, 8)
+        spatial_hash.move(agents, rows[agents], cols[agents])
+        new_hash = SpatialHash(12, 12, 3)
+        new_hash.build(rows, cols)
+        assert (np.diff(spatial_hash.starts) == np.diff(new_hash.starts)).all()
+        assert set(zip(*[pairs.tolist() for pairs in spatial_hash.query_pairs(1)])) == set(zip(*[pairs.tolist() for pairs in new_hash.query_pairs(1)]))
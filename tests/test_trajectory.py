@@ -0,0 +1,76 @@
+import pytest, numpy as np
+from scripts.trajectory import Trajectory
+
+
+def record_steps(trajectory, num_steps, num_agents):
+    """
+    Record steps where the position of each agent is (step, agent), so the first step is on row 0.
+    """
+
+    for step in range(num_steps):
+        trajectory.record(np.full(num_agents, step), np.arange(num_agents))
+
+
+@pytest.mark.parametrize("storage", ["memory", "memmap"])
+@pytest.mark.parametrize("num_steps, interval", [(10, 1), (10, 3), (9, 3), (4, 5)])
+def test_records_every_interval_step(tmp_path, storage, num_steps, interval):
+    path = str(tmp_path / "trajectory.npy") if storage == "memmap" else None
+    trajectory = Trajectory(num_steps, 3, 20, 20, interval, path)
+    record_steps(trajectory, num_steps, 3)
+    recorded_steps = list(range(0, num_steps, interval))
+    assert trajectory.size == len(recorded_steps) == len(trajectory.positions)
+    assert trajectory.steps == num_steps
+    for slot in range(3):
+        rows, cols = trajectory.get_positions(slot)
+        assert rows.tolist() == recorded_steps
+        assert cols.tolist() == [slot]*len(recorded_steps)
+    trajectory.flush()
+    if storage == "memmap":
+        assert np.array_equal(np.load(path), trajectory.positions)
+
+
+def test_positions_on_row_and_column_0_are_kept():
+    trajectory = Trajectory(3, 2, 5, 5)
+    trajectory.record(np.array([0, 4]), np.array([0, 0]))
+    trajectory.record(np.array([0, 3]), np.array([1, 0]))
+    trajectory.record(np.array([1, 0]), np.array([1, 0]))
+    rows, cols = trajectory.get_positions(0)
+    assert (rows.tolist(), cols.tolist()) == ([0, 0, 1], [0, 1, 1])
+    rows, cols = trajectory.get_positions(1)
+    assert (rows.tolist(), cols.tolist()) == ([4, 3, 0], [0, 0, 0])
+
+
+def test_invalid_interval_is_rejected():
+    with pytest.raises(Exception, match="interval"):
+        Trajectory(3, 2, 5, 5, 0)
+
+
+@pytest.mark.parametrize("storage", ["memory", "memmap"])
+def test_network_records_the_installed_and_interval_positions(create_network, storage):
+    network = create_network(iterations=4, trajectory_interval=2, trajectory_storage=storage)
+    installed_rows, installed_cols = network.graph.get_positions()
+    network.run()
+    # The installed positions and the positions after the iterations 2 and 4
+    assert network.trajectory.steps == 5 and network.trajectory.size == 3
+    assert np.array_equal(network.trajectory.positions[0, :, 0], installed_rows)
+    assert np.array_equal(network.trajectory.positions[0, :, 1], installed_cols)
+    final_rows, final_cols = network.graph.get_positions()
+    assert np.array_equal(network.trajectory.positions[2, :, 0], final_rows)
+    assert np.array_equal(network.trajectory.positions[2, :, 1], final_cols)
+    if storage == "memmap":
+        assert np.array_equal(np.load(network.log_path + "\\trajectory.npy"), network.trajectory.positions)
+
+
+def test_movement_graph_keeps_row_and_column_0(tmp_path):
+    from types import SimpleNamespace
+    from scripts.visual_graph import VisualGraph
+    trajectory = Trajectory(3, 2, 5, 5)
+    trajectory.record(np.array([0, 4]), np.array([0, 0]))
+    trajectory.record(np.array([0, 3]), np.array([1, 0]))
+    trajectory.record(np.array([1, 0]), np.array([1, 0]))
+    visual_graph = VisualGraph("test", 6, 6, str(tmp_path), "headless", np.random.default_rng(0))
+    visual_graph.movement_graph("movement_3.png", [[SimpleNamespace(slot=0), SimpleNamespace(slot=1)]], trajectory)
+    # The paths are drawn one cell up and right of the grid positions, as (col+1, row+1)
+    first, second = visual_graph.figure.axes[0].collections[0].get_segments()
+    assert first.tolist() == [[1, 1], [2, 1], [2, 2]]
+    assert second.tolist() == [[1, 5], [1, 4], [1, 1]]
@@ -0,0 +1,15 @@
+import os, matplotlib.pyplot as plt
+
+
+def test_headless_run_saves_the_figures_and_the_animation(create_network):
+    plt.close("all")
+    network = create_network(animation_format="gif")
+    network.run()
+    for filename in ("network_1.png", "network_3.png", "movement_3.png", "animation_3.gif"):
+        path = network.graphs_path + f"\\{filename}"
+        assert os.path.isfile(path) and os.path.getsize(path) > 0
+    # The headless renders reuse their own figure, so no pyplot figure is left open
+    assert plt.get_fignums() == []
+    assert len(network.animation) == network.iterations + 1
+    with open(network.graphs_path + "\\animation_3.gif", "rb") as file:
+        assert file.read(6) in (b"GIF87a", b"GIF89a")